@@ -2,11 +2,15 @@
 # 🖼️ 고급 이미지 다운로드 (403 우회 시도)
 
 import requests
-import os
 from pathlib import Path
-import time
 import random
 
+from image_downloader import build_session, download_image
+from retry_scheduler import CircuitOpenError, RetryScheduler
+
+# 모든 다운로드가 공유하는 재시도 / 속도 제한 스케줄러
+SCHEDULER = RetryScheduler()
+
 def download_image_advanced(url, filepath):
     """다양한 방법으로 403 에러 우회 시도"""
     
@@ -55,42 +59,39 @@ def download_image_advanced(url, filepath):
         }
     ]
     
+    # 방법마다 헤더만 바꾸고 연결은 하나의 세션에서 재사용
+    session = build_session(pool_size=1, headers={})
+    
     for i, method in enumerate(methods, 1):
         try:
             print(f"  🔄 방법 {i} 시도...")
             
-            session = requests.Session()
-            response = session.get(url, timeout=30, stream=True, **method)
-            
-            print(f"    📊 상태 코드: {response.status_code}")
+            # 임시 파일에 받고 Range 로 이어받은 뒤 검증 후 원자적으로 교체
+            # 일시적 오류(5xx/429/연결 끊김)만 스케줄러가 백오프 후 재시도, 403/404 는 바로 다음 방법으로
+            status, received = SCHEDULER.call(
+                url, lambda: download_image(session, url, filepath, headers=method['headers'])
+            )
             
-            if response.status_code == 200:
-                # 성공!
-                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            file_size = Path(filepath).stat().st_size
+            print(f"  ✅ 성공: {filepath} ({file_size:,} bytes, {status})")
+            return True
                 
-                with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                
-                file_size = os.path.getsize(filepath)
-                print(f"  ✅ 성공: {filepath} ({file_size:,} bytes)")
-                return True
-                
-            elif response.status_code == 403:
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code
+            print(f"    📊 상태 코드: {status_code}")
+            if status_code == 403:
                 print(f"    ❌ 403 Forbidden (방법 {i})")
-            elif response.status_code == 404:
+            elif status_code == 404:
                 print(f"    ❌ 404 Not Found")
                 break  # 404면 다른 방법도 소용없음
             else:
-                print(f"    ❌ {response.status_code}: {response.reason}")
+                print(f"    ❌ {status_code}: {e.response.reason}")
                 
-        except requests.exceptions.RequestException as e:
+        except CircuitOpenError as e:
+            print(f"    ⛔ {e}")
+            break  # 서버가 계속 5xx → 다른 헤더로 시도해도 소용없음
+        except (requests.exceptions.RequestException, OSError) as e:
             print(f"    ❌ 네트워크 오류 (방법 {i}): {e}")
-        
-        # 다음 방법 시도 전 잠깐 대기
-        if i < len(methods):
-            time.sleep(1)
     
     print(f"  💥 모든 방법 실패: {filepath}")
     return False
@@ -148,10 +149,10 @@ def main():
         print(f"📥 {img['type']} 다운로드 시도...")
         print(f"    🌐 URL: {img['url']}")
         
+        # 요청 간 간격은 SCHEDULER 의 호스트별 토큰 버킷이 조절
         if download_image_advanced(img['url'], img['path']):
             success_count += 1
         
-        time.sleep(2)  # 요청 간 딜레이
         print()
     
     print("=" * 50)
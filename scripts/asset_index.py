@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이미지 자산 메타데이터 색인 (SQLite)
+보유한 모든 이미지의 경로 / 크기 / mtime / 해시 / 크기(px) / 형식과
+제품 / 용도(main, hover, colors) / 색상을 실행 간에 보관
+
+- refresh(): 폴더를 한 번 훑어 크기 / mtime 이 바뀐 파일만 다시 해시 (나머지는 DB 값 사용)
+- 정리 / 리포트 / 코드 생성 단계는 glob + stat 대신 이 색인을 조회
+
+사용법: python scripts/asset_index.py [--db 경로] [refresh | stats | find 이름]
+"""
+
+import argparse
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from image_store import file_sha256
+import instrumentation
+from instrumentation import stage
+
+# 경로 설정
+SOURCE_DIR = r"C:\Users\apf_temp_admin\Desktop\Bookcases, Bookshelves - modern, large or small - Tylko_files"
+TARGET_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\public\images\products\v2"
+DB_FILE = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\asset-index.sqlite"
+
+SCHEMA_VERSION = 1
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.avif', '.gif'}
+ROLES = ('main', 'hover', 'colors')
+HASH_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    path     TEXT PRIMARY KEY,
+    root     TEXT NOT NULL,
+    name     TEXT NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256   TEXT,
+    width    INTEGER,
+    height   INTEGER,
+    format   TEXT,
+    product  TEXT,
+    role     TEXT,
+    color    TEXT
+);
+CREATE INDEX IF NOT EXISTS images_root ON images (root);
+CREATE INDEX IF NOT EXISTS images_name ON images (name);
+CREATE INDEX IF NOT EXISTS images_sha256 ON images (sha256);
+CREATE INDEX IF NOT EXISTS images_product_role ON images (product, role);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS perceptual_hashes (
+    sha256 TEXT NOT NULL,
+    kind   TEXT NOT NULL,
+    value  BLOB NOT NULL,
+    PRIMARY KEY (sha256, kind)
+);
+"""
+
+def describe_path(relative):
+    """루트 기준 상대 경로 → (제품, 용도, 색상)
+
+    제품별 구조  <제품>/<용도>/<제품>-<색상>.webp
+    단순 구조    <용도>/<파일>
+    다운로드     <파일> (파일명으로 용도 추정: 섬네일 → colors, jpg → main, webp → hover)
+    """
+    parts = Path(relative).parts
+    name = parts[-1]
+    stem = Path(name).stem
+
+    if len(parts) >= 3 and parts[-2] in ROLES:
+        product, role = parts[-3], parts[-2]
+        color = stem[len(product) + 1:] if role == 'colors' and stem.startswith(f"{product}-") else None
+        return product, role, color
+    if len(parts) == 2 and parts[0] in ROLES:
+        return None, parts[0], None
+    if len(parts) == 1:
+        lower = name.lower()
+        if 'thumbnail' in lower:
+            return None, 'colors', None
+        if lower.endswith(('.jpg', '.jpeg')):
+            return None, 'main', None
+        if lower.endswith('.webp'):
+            return None, 'hover', None
+    return None, None, None
+
+
+def _walk_images(directory):
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_images(entry.path)
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                    yield entry
+    except FileNotFoundError:
+        return
+
+
+class AssetIndex:
+    """SQLite 이미지 메타데이터 색인"""
+
+    def __init__(self, db_path=DB_FILE):
+        self.db_path = Path(db_path)
+        if str(db_path) != ':memory:':
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+    def _migrate(self):
+        row = None
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        except sqlite3.OperationalError:
+            pass
+        if row is not None and int(row[0]) != SCHEMA_VERSION:
+            # 구조가 바뀌면 색인은 다시 만들면 되므로 버림
+            self.conn.executescript("DROP TABLE IF EXISTS images; DROP TABLE IF EXISTS meta;")
+        self.conn.executescript(_SCHEMA)
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def refresh(self, root, hash_files=True, workers=HASH_WORKERS):
+        """root 아래 이미지 색인 갱신 → {'added', 'updated', 'removed', 'unchanged'} 개수
+
+        크기 / mtime 이 DB 와 같은 파일은 건드리지 않고, 바뀐 파일만 (병렬로) 다시 해시
+        """
+        with stage("asset_index.refresh") as metrics:
+            counts, hashed_bytes = self._refresh(str(Path(root)), hash_files, workers)
+            metrics.add(files=counts['added'] + counts['updated'], bytes=hashed_bytes)
+            metrics.cache(hits=counts['unchanged'], misses=counts['added'] + counts['updated'])
+        return counts
+
+    def _refresh(self, root, hash_files, workers):
+        """refresh() 본체 → (개수, 다시 해시한 바이트 수)"""
+        # 상위 / 하위 폴더를 root 로 색인된 파일도 포함 (root 만 다르면 다시 해시하지 않고 root 만 옮김)
+        prefix = os.path.join(root, '')
+        known = {}
+        other_root = set()
+        for row in self.conn.execute(
+                "SELECT path, root, size, mtime_ns FROM images WHERE root = ? OR substr(path, 1, ?) = ?",
+                (root, len(prefix), prefix)):
+            known[row['path']] = (row['size'], row['mtime_ns'])
+            if row['root'] != root:
+                other_root.add(row['path'])
+
+        changed = []
+        moved = []
+        seen = set()
+        for entry in _walk_images(root):
+            st = entry.stat()
+            seen.add(entry.path)
+            if known.get(entry.path) != (st.st_size, st.st_mtime_ns):
+                changed.append((entry.path, st))
+            elif entry.path in other_root:
+                moved.append((root, entry.path))
+
+        digests = [None] * len(changed)
+        if hash_files and changed:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                digests = list(executor.map(lambda item: file_sha256(item[0]), changed))
+
+        rows = []
+        for (path, st), digest in zip(changed, digests):
+            product, role, color = describe_path(os.path.relpath(path, root))
+            rows.append((path, root, os.path.basename(path), st.st_size, st.st_mtime_ns, digest,
+                         os.path.splitext(path)[1].lower().lstrip('.'), product, role, color))
+        removed = [(path,) for path in known if path not in seen]
+
+        with self.conn:
+            # width / height 는 내용이 바뀌었으면 다시 측정해야 하므로 비움
+            # (다른 root 로 색인돼 있던 파일은 이 root 로 옮기고, 파일이 같으면 크기 정보 유지)
+            self.conn.executemany(
+                "INSERT INTO images (path, root, name, size, mtime_ns, sha256, format, product, role, color) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET root = excluded.root, size = excluded.size, "
+                "mtime_ns = excluded.mtime_ns, sha256 = excluded.sha256, "
+                "width = CASE WHEN images.sha256 = excluded.sha256 THEN images.width END, "
+                "height = CASE WHEN images.sha256 = excluded.sha256 THEN images.height END, "
+                "format = CASE WHEN images.sha256 = excluded.sha256 AND images.width IS NOT NULL "
+                "THEN images.format ELSE excluded.format END, "
+                "product = excluded.product, role = excluded.role, color = excluded.color",
+                rows)
+            self.conn.executemany("UPDATE images SET root = ? WHERE path = ?", moved)
+            self.conn.executemany("DELETE FROM images WHERE path = ?", removed)
+
+        added = sum(1 for path, _ in changed if path not in known)
+        counts = {'added': added, 'updated': len(changed) - added, 'removed': len(removed),
+                  'unchanged': len(seen) - len(changed)}
+        return counts, sum(st.st_size for _, st in changed) if hash_files else 0
+
+    def digest_of(self, path):
+        """파일 해시 (DB 의 크기 / mtime 이 같으면 저장된 값, 아니면 계산해서 저장)"""
+        path = str(path)
+        st = os.stat(path)
+        row = self.conn.execute("SELECT size, mtime_ns, sha256 FROM images WHERE path = ?", (path,)).fetchone()
+        if row is not None and row['sha256'] and (row['size'], row['mtime_ns']) == (st.st_size, st.st_mtime_ns):
+            return row['sha256']
+        digest = file_sha256(path)
+        if row is not None:
+            with self.conn:
+                self.conn.execute("UPDATE images SET size = ?, mtime_ns = ?, sha256 = ? WHERE path = ?",
+                                  (st.st_size, st.st_mtime_ns, digest, path))
+        return digest
+
+    def set_dimensions(self, rows):
+        """[(경로, 너비, 높이, 형식)] 저장"""
+        with self.conn:
+            self.conn.executemany("UPDATE images SET width = ?, height = ?, format = ? WHERE path = ?",
+                                  [(w, h, fmt, str(p)) for p, w, h, fmt in rows])
+
+    def perceptual_hashes(self, kind):
+        """내용 해시 → 저장된 지각 해시 (부호 없는 정수)"""
+        return {sha: int.from_bytes(value, 'big') for sha, value in
+                self.conn.execute("SELECT sha256, value FROM perceptual_hashes WHERE kind = ?", (kind,))}
+
+    def set_perceptual_hashes(self, kind, hashes):
+        """{내용 해시: 지각 해시} 저장 (64비트를 넘는 해시도 있어 빅엔디언 바이트로 저장)"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO perceptual_hashes VALUES (?, ?, ?)",
+                [(sha, kind, value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big'))
+                 for sha, value in hashes.items()])
+
+    def query(self, root=None, product=None, role=None, name=None, sha256=None):
+        """조건에 맞는 이미지 행 목록 (경로순)"""
+        clauses, params = [], []
+        for column, value in (('root', root), ('product', product), ('role', role),
+                              ('name', name), ('sha256', sha256)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(str(value) if column == 'root' else value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return [dict(row) for row in self.conn.execute(f"SELECT * FROM images{where} ORDER BY path", params)]
+
+    def counts_by_role(self, root, product=None):
+        """용도별 이미지 수 → {'main': n, 'hover': n, 'colors': n} (product 가 None 이면 단순 구조)"""
+        counts = dict.fromkeys(ROLES, 0)
+        counts.update(self.conn.execute(
+            "SELECT role, COUNT(*) FROM images WHERE root = ? AND product IS ? AND role IS NOT NULL "
+            "GROUP BY role", (str(Path(root)), product)).fetchall())
+        return counts
+
+    def duplicates(self, root=None):
+        """같은 내용(해시)의 파일 묶음 목록"""
+        sql = "SELECT sha256, GROUP_CONCAT(path, char(10)) FROM images WHERE sha256 IS NOT NULL"
+        params = []
+        if root is not None:
+            sql += " AND root = ?"
+            params.append(str(Path(root)))
+        sql += " GROUP BY sha256 HAVING COUNT(*) > 1"
+        return [paths.split('\n') for _, paths in self.conn.execute(sql, params)]
+
+    def stats(self):
+        """루트별 (이미지 수, 총 용량)"""
+        return {root: (count, total) for root, count, total in
+                self.conn.execute("SELECT root, COUNT(*), SUM(size) FROM images GROUP BY root")}
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="이미지 자산 메타데이터 색인 (SQLite)")
+    parser.add_argument("--db", default=DB_FILE, help="색인 DB 경로")
+    parser.add_argument("--root", action="append", help="색인할 폴더 (기본: 다운로드 폴더 + 제품 이미지 폴더)")
+    parser.add_argument("command", nargs="?", default="refresh", choices=["refresh", "stats", "find"])
+    parser.add_argument("name", nargs="?", help="find 할 파일명")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    instrumentation.configure(args)
+    roots = args.root or [SOURCE_DIR, TARGET_DIR]
+
+    with AssetIndex(args.db) as index:
+        if args.command == "refresh":
+            print("🗂️ 이미지 색인 갱신 중...")
+            for root in roots:
+                result = index.refresh(root)
+                print(f"  📂 {root}")
+                print(f"    ➕ {result['added']}  ✏️ {result['updated']}  "
+                      f"➖ {result['removed']}  ✔️ {result['unchanged']}")
+
+        if args.command == "find":
+            for row in index.query(name=args.name):
+                print(f"  {row['path']}  {row['size']:,} bytes  {row['product'] or '-'}/{row['role'] or '-'}"
+                      f"/{row['color'] or '-'}  {(row['sha256'] or '')[:12]}")
+            return
+
+        print("\n📊 색인 현황:")
+        for root, (count, total) in index.stats().items():
+            print(f"  📂 {root}: {count}개, {total or 0:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
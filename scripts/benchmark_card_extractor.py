@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+제품 카드 추출기 벤치마크
+기존 방식(전체 파일 DOTALL 정규식 + 필드별 재검색)과
+스트리밍 파서 + 필드 테이블 한 번 훑기 방식의 초당 카드 처리량 비교
+
+사용법: python scripts/benchmark_card_extractor.py [HTML 파일] [반복 횟수]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+from product_card_parser import extract_filename_from_url, iter_product_mappings
+
+DEFAULT_HTML = Path(__file__).resolve().parent.parent / "product-v2-example.txt"
+DEFAULT_ROUNDS = 20
+
+
+def legacy_extract_all_products(html_file):
+    """기존 extract_all_products_from_html() 의 추출 로직 (출력 제외)"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+
+    products = re.findall(r'<li data-testid="product-card">.*?</li>', html_content, re.DOTALL)
+    extracted_mappings = []
+
+    for product_html in products:
+        name_match = re.search(r'alt="([^"]*Bookcase[^"]*)"', product_html)
+        if not name_match:
+            continue
+
+        main_match = re.search(r'<img src="([^"]*)"[^>]*data-testid="product-card-image-instagrid"', product_html)
+        hover_match = re.search(r'<img src="([^"]*)"[^>]*data-testid="product-card-image"', product_html)
+
+        color_thumbnails = []
+        for match in re.findall(r'src="[^"]*thumbnail[^"]*"', product_html):
+            url = match.replace('src="', '').replace('"', '')
+            color_thumbnails.append(extract_filename_from_url(url))
+
+        price_match = re.search(r'data-testid="product-card-price-discount">€(\d+)</span>', product_html)
+        original_price_match = re.search(r'data-testid="product-card-price">€(\d+)</span>', product_html)
+        size_match = re.search(r'data-testid="product-card-furniture-size">([^<]*)</h3>', product_html)
+        type_match = re.search(r'data-testid="product-card-furniture-type">([^<]*)</p>', product_html)
+
+        extracted_mappings.append({
+            "name": name_match.group(1),
+            "main_image": extract_filename_from_url(main_match.group(1)) if main_match else None,
+            "hover_image": extract_filename_from_url(hover_match.group(1)) if hover_match else None,
+            "color_thumbnails": color_thumbnails,
+            "price": int(price_match.group(1)) if price_match else None,
+            "original_price": int(original_price_match.group(1)) if original_price_match else None,
+            "dimensions": size_match.group(1).strip() if size_match else None,
+            "furniture_type": type_match.group(1).strip() if type_match else None,
+            "has_top_seller": "Top seller" in product_html,
+            "has_discount": "data-testid=\"product-card-badge\"" in product_html,
+        })
+
+    return extracted_mappings
+
+
+def streaming_extract_all_products(html_file):
+    """스트리밍 파서 + 필드 테이블 방식"""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        return list(iter_product_mappings(f))
+
+
+def measure(extract, html_file, rounds):
+    """rounds 회 실행 후 (최고 소요 시간, 카드 수) 반환"""
+    best = float('inf')
+    cards = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        cards = len(extract(html_file))
+        best = min(best, time.perf_counter() - started)
+    return best, cards
+
+
+def main():
+    html_file = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_HTML
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ROUNDS
+
+    print("🚀 제품 카드 추출기 벤치마크")
+    print(f"📄 HTML: {html_file} ({html_file.stat().st_size:,} bytes)")
+    print(f"🔁 반복: {rounds}회 (최고 기록 기준)")
+    print("=" * 70)
+
+    legacy = legacy_extract_all_products(html_file)
+    streaming = streaming_extract_all_products(html_file)
+    if legacy != streaming:
+        print("❌ 두 추출기의 결과가 다릅니다!")
+        sys.exit(1)
+    print(f"✅ 결과 일치: {len(streaming)}개 제품")
+
+    results = {}
+    for label, extract in [("legacy", legacy_extract_all_products),
+                           ("streaming", streaming_extract_all_products)]:
+        elapsed, cards = measure(extract, html_file, rounds)
+        results[label] = cards / elapsed
+        print(f"  ⏱️ {label:<10} {elapsed * 1000:8.2f} ms  {cards / elapsed:12,.0f} cards/s")
+
+    print(f"\n📊 속도 향상: {results['streaming'] / results['legacy']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
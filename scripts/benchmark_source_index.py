@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다운로드 폴더 색인 벤치마크
+임시 폴더에 가짜 다운로드 파일(기본 50,000개)을 만들고
+기존 방식(glob 분류 + 패턴마다 전체 목록 선형 검색)과 SourceIndex 사전 조회를 비교
+
+사용법: python scripts/benchmark_source_index.py [파일 수] [제품 수]
+"""
+
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from source_index import SourceIndex
+
+DEFAULT_FILES = 50_000
+DEFAULT_PRODUCTS = 500
+COLORS_PER_PRODUCT = 8
+
+
+def _suffix(rng):
+    return ''.join(rng.choice(string.ascii_letters + string.digits) for _ in range(7))
+
+
+def make_download_folder(directory, count, seed=0):
+    """Tylko 저장 폴더와 비슷한 이름의 빈 파일들 생성 → 파일명 목록"""
+    rng = random.Random(seed)
+    names = set()
+    render_id = 10_000
+    while len(names) < count:
+        render_id += rng.randint(1, 7)
+        variant = f"_{_suffix(rng)}" if rng.random() < 0.5 else ""
+        kind = rng.random()
+        if kind < 0.45:
+            names.add(f"unreal_{render_id}{variant}_thumbnail.webp")
+        elif kind < 0.8:
+            names.add(f"unreal_{render_id}{variant}.webp")
+        elif kind < 0.95:
+            names.add(f"Living_room_{render_id}_living-room-Bookcase_{_suffix(rng)}.jpg")
+        else:
+            names.add(f"icon_{render_id}.svg")
+
+    for name in names:
+        (Path(directory) / name).touch()
+    return sorted(names)
+
+
+def make_mappings(names, products, seed=0):
+    """제품별 (메인, 호버, 색상들) 패턴 생성 (확장자 포함 전체 파일명이라 두 방식의 결과가 같아야 함)"""
+    rng = random.Random(seed)
+    mains = [n for n in names if n.endswith('.jpg')]
+    hovers = [n for n in names if n.endswith('.webp') and 'thumbnail' not in n]
+    colors = [n for n in names if n.endswith('_thumbnail.webp')]
+    return [{
+        "main_pattern": rng.choice(mains),
+        "hover_pattern": rng.choice(hovers),
+        "color_patterns": rng.sample(colors, COLORS_PER_PRODUCT),
+    } for _ in range(products)]
+
+
+def legacy_match(directory, mappings):
+    """기존 get_all_images() + distribute_images() 의 특별 매칭 방식"""
+    main_images, hover_images, color_images = [], [], []
+    for file in Path(directory).glob("*"):
+        if file.is_file() and file.suffix.lower() in ['.jpg', '.webp']:
+            filename = file.name.lower()
+            if file.suffix.lower() == '.jpg':
+                if not any(skip in filename for skip in ['icon', 'logo', 'banner']):
+                    main_images.append(file)
+            elif 'thumbnail' in filename:
+                color_images.append(file)
+            elif not any(skip in filename for skip in ['icon', 'logo', 'banner']):
+                hover_images.append(file)
+
+    used_images = set()
+    matched = []
+    for mapping in mappings:
+        for pattern, pool in [(mapping["main_pattern"], main_images + hover_images),
+                              (mapping["hover_pattern"], hover_images)]:
+            for img in pool:
+                if pattern in img.name and img not in used_images:
+                    used_images.add(img)
+                    matched.append(img.name)
+                    break
+        for pattern in mapping["color_patterns"]:
+            for img in color_images:
+                if pattern in img.name and img not in used_images:
+                    used_images.add(img)
+                    matched.append(img.name)
+                    break
+    return matched
+
+
+def indexed_match(directory, mappings):
+    """SourceIndex 한 번 나열 + 패턴당 사전 조회"""
+    index = SourceIndex.scan(directory)
+    index.classify()
+
+    used_images = set()
+    matched = []
+    for mapping in mappings:
+        for pattern in [mapping["main_pattern"], mapping["hover_pattern"], *mapping["color_patterns"]]:
+            img = index.find(pattern, exclude=used_images)
+            if img is not None:
+                used_images.add(img)
+                matched.append(img.name)
+    return matched
+
+
+def measure(match, directory, mappings):
+    started = time.perf_counter()
+    matched = match(directory, mappings)
+    return time.perf_counter() - started, matched
+
+
+def main():
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FILES
+    products = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PRODUCTS
+
+    print("🚀 다운로드 폴더 색인 벤치마크")
+    print(f"📂 가짜 파일: {files:,}개, 제품: {products}개 (제품당 패턴 {COLORS_PER_PRODUCT + 2}개)")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory(prefix="source-index-bench-") as directory:
+        names = make_download_folder(directory, files)
+        mappings = make_mappings(names, products)
+
+        results = {}
+        for label, match in [("legacy", legacy_match), ("indexed", indexed_match)]:
+            elapsed, matched = measure(match, directory, mappings)
+            results[label] = (elapsed, matched)
+            print(f"  ⏱️ {label:<8} {elapsed * 1000:10.1f} ms  매칭 {len(matched)}개")
+
+    if results["legacy"][1] != results["indexed"][1]:
+        print("❌ 두 방식의 매칭 결과가 다릅니다!")
+        sys.exit(1)
+    print("✅ 매칭 결과 일치")
+    print(f"\n📊 속도 향상: {results['legacy'][0] / results['indexed'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자산 스크립트 규모별 벤치마크
+synthetic_catalogue.py 로 실제 목록(34개 제품)의 여러 배율 카탈로그를 만들고
+추출기 / 정리기 / 코드 생성 단계를 같은 입력으로 돌려 단계별 시간과 처리량을 비교
+
+- extract.cold   : 목록 HTML 한 파일 스트리밍 추출 (카드 캐시 없음), 정답 매핑과 비교
+- extract.warm   : 같은 파일을 카드 캐시로 다시 추출 (전부 캐시 적중)
+- extract.pages  : 여러 페이지로 나눈 목록을 프로세스 풀로 추출 후 병합
+- organise.cold  : 빈 대상 폴더로 main / hover / colors 동기화 (reorganize-images.py 와 같은 계획)
+- organise.warm  : 바뀐 것 없는 상태에서 다시 동기화 (쓰기 0회여야 함)
+- codegen        : 이미지 색인 / 크기 탐지 + 16개 슬러그 매칭 + TS 모듈 렌더
+- 단계 기록은 instrumentation 으로 남기므로 --metrics 를 주면 JSON lines 로 누적 (실행 간 비교용)
+  --metrics 는 tracemalloc 을 켜서 느려지므로 시간은 같은 옵션으로 잰 실행끼리 비교
+- 정리기 / 코드 생성 스크립트는 경로가 고정되어 있어, 같은 공용 모듈(organize_engine,
+  generate_products_data 등)을 임시 폴더 경로로 호출
+
+사용법: python scripts/benchmark_suite.py [--scales 1,10,100] [--keep 폴더] [--metrics]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import instrumentation
+from asset_index import AssetIndex
+from generate_products_data import build_entries, render_module
+from image_probe import dimensions_by_url, probe_tree
+from image_store import ImageStore
+from instrumentation import stage
+from organize_engine import DEFAULT_WORKERS, add_to_plan, apply_sync, diff_tree, scan_files, sync_is_empty
+from product_card_parser import dedupe_mappings, extract_html_file, init_worker_cache, iter_cached_cards
+from source_index import SourceIndex
+from synthetic_catalogue import BASE_PRODUCTS, CATALOGUE_JSON, IMAGE_SIZE, generate_corpus
+
+DEFAULT_SCALES = "1,10,100"
+# 표에 싣는 바깥 단계 (execute_plan 같은 안쪽 단계 기록은 --metrics 파일에만)
+STAGE_NAMES = ("extract.cold", "extract.warm", "extract.pages", "organise.cold", "organise.warm", "codegen")
+# 페이지 하나에 들어가는 카드 수 (실제 목록과 비슷하게)
+CARDS_PER_PAGE = BASE_PRODUCTS
+
+
+class BenchmarkError(Exception):
+    """벤치마크 결과가 정답과 다름"""
+
+
+def corpus_paths(directory):
+    """코퍼스 폴더 안의 작업 경로들"""
+    directory = Path(directory)
+    return {
+        "public_images": directory / "public" / "images",
+        "image_root": directory / "public" / "images" / "products" / "v2",
+        "store": directory / ".cache" / "image-store",
+        "db": directory / ".cache" / "asset-index.sqlite",
+    }
+
+
+def bench_extract(corpus, expected):
+    """단일 파일 추출 (캐시 없음 → 캐시 적중) → 매핑 목록"""
+    listing = corpus["listing"]
+    with stage("extract.cold") as metrics:
+        with open(listing, 'r', encoding='utf-8') as f:
+            cards = list(iter_cached_cards(f, {}))
+        metrics.add(files=1, bytes=corpus["listing_bytes"], cards=len(cards)).cache(misses=len(cards))
+    mappings = [mapping for _, mapping, _ in cards if mapping is not None]
+    if mappings != expected:
+        raise BenchmarkError(f"extract.cold: 추출 결과가 정답과 다름 ({len(mappings)} / {len(expected)}개)")
+
+    cache = {digest: mapping for digest, mapping, _ in cards}
+    with stage("extract.warm") as metrics:
+        with open(listing, 'r', encoding='utf-8') as f:
+            cards = list(iter_cached_cards(f, cache))
+        hits = sum(cached for _, _, cached in cards)
+        metrics.add(files=1, bytes=corpus["listing_bytes"], cards=len(cards))
+        metrics.cache(hits=hits, misses=len(cards) - hits)
+    return mappings
+
+
+def bench_pages(corpus, expected, workers):
+    """여러 페이지 병렬 추출 (extract-complete-mapping.py 의 여러 입력 경로와 같은 방식)"""
+    pages = corpus["pages"]
+    if not pages:
+        return
+    with stage("extract.pages") as metrics:
+        merged = []
+        with ProcessPoolExecutor(max_workers=max(1, min(workers, len(pages))),
+                                 initializer=init_worker_cache, initargs=({},)) as executor:
+            for _, cards in executor.map(extract_html_file, pages):
+                merged.extend(mapping for _, mapping, _ in cards if mapping is not None)
+        mappings = dedupe_mappings(merged)
+        metrics.add(files=len(pages), bytes=sum(os.path.getsize(path) for path in pages), cards=len(merged))
+    if mappings != expected:
+        raise BenchmarkError(f"extract.pages: 병합 결과가 정답과 다름 ({len(mappings)} / {len(expected)}개)")
+
+
+def plan_structure(mappings, names, source_dir, image_root):
+    """reorganize-images.py 의 plan_new_structure 와 같은 계획 (main / hover / colors 평면 구조)"""
+    plan, missing = [], []
+    for mapping in mappings:
+        for kind, key in (("main", 'main_image'), ("hover", 'hover_image')):
+            if mapping[key]:
+                add_to_plan(plan, missing, names, source_dir, mapping[key], image_root / kind / mapping[key], kind)
+        for thumbnail in mapping['color_thumbnails']:
+            add_to_plan(plan, missing, names, source_dir, thumbnail, image_root / "colors" / thumbnail, "colors")
+    return plan, missing
+
+
+def bench_organise(corpus, mappings, paths, workers):
+    """빈 폴더로 동기화한 뒤 다시 동기화 → 배치한 파일 수"""
+    store = ImageStore(paths["store"])
+    managed = [paths["image_root"] / kind for kind in ("main", "hover", "colors")]
+    placed = 0
+    with AssetIndex(paths["db"]) as assets:
+        for label in ("organise.cold", "organise.warm"):
+            with stage(label) as metrics:
+                plan, missing = plan_structure(mappings, SourceIndex.scan(corpus["downloads"]),
+                                               corpus["downloads"], paths["image_root"])
+                sync = diff_tree(plan, scan_files(managed), assets.digest_of)
+                results = apply_sync(sync, store.place, workers)
+                metrics.add(files=len(plan), written=len(results) + len(sync['move']), missing=len(missing))
+            if label == "organise.cold":
+                placed = sum(1 for result in results if result['ok'])
+            elif not sync_is_empty(sync):
+                raise BenchmarkError("organise.warm: 최신 상태에서 다시 동기화했는데 쓰기가 있음")
+    return placed
+
+
+def bench_codegen(mappings, paths):
+    """generate_products_data.generate() 와 같은 순서 (크기 탐지 → 매칭 → 렌더) → 경고 수"""
+    with stage("codegen") as metrics:
+        with AssetIndex(paths["db"]) as index:
+            probe_tree(index, [str(paths["public_images"])])
+            sizes = dimensions_by_url(index, str(paths["public_images"]))
+        entries, warnings = build_entries(mappings, sizes, paths["image_root"])
+        text = render_module(entries)
+        metrics.add(cards=len(mappings), bytes=len(text.encode('utf-8')))
+    return len(warnings)
+
+
+def run_scale(directory, products, args):
+    """배율 하나: 코퍼스 생성 → 단계별 측정 → {단계: 기록}"""
+    started = time.perf_counter()
+    pages = max(1, -(-products // CARDS_PER_PAGE))
+    corpus = generate_corpus(directory, products, pages=pages, seed=args.seed,
+                             image_size=args.image_size, workers=args.workers)
+    with open(corpus["catalogue"], 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+    print(f"  🏭 코퍼스: 카드 {products:,}개, HTML {corpus['listing_bytes'] / 1e6:,.1f} MB, "
+          f"페이지 {len(corpus['pages']) or 1}개, 이미지 {corpus['files']:,}개 "
+          f"({corpus['image_bytes'] / 1e6:,.1f} MB) - {time.perf_counter() - started:.1f}s")
+
+    first = len(instrumentation.records())
+    paths = corpus_paths(directory)
+    mappings = bench_extract(corpus, expected)
+    bench_pages(corpus, expected, args.workers)
+    placed = bench_organise(corpus, mappings, paths, args.workers)
+    warnings = bench_codegen(mappings, paths)
+    print(f"  ✅ 추출 결과 = 정답, 배치 {placed:,}개, 코드 생성 경고 {warnings}개")
+
+    return {record["stage"]: record for record in instrumentation.records()[first:] if record["stage"] in STAGE_NAMES}
+
+
+def format_rate(record):
+    if record.get("cards") and record["wall_s"] > 0:
+        return f"{record['cards'] / record['wall_s']:,.0f} cards/s"
+    if record.get("files_per_s"):
+        return f"{record['files_per_s']:,.0f} files/s"
+    return ""
+
+
+def print_results(results):
+    """배율 × 단계 표"""
+    print("\n📊 결과 (벽시계 시간 / 처리량)")
+    for name in STAGE_NAMES:
+        if not any(name in records for records in results.values()):
+            continue
+        print(f"  ⏱️ {name}")
+        for products, records in results.items():
+            record = records.get(name)
+            if record is not None:
+                print(f"      {products:>8,}개  {record['wall_s']:9.3f}s  {format_rate(record)}")
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="합성 카탈로그로 추출 / 정리 / 코드 생성 규모별 벤치마크")
+    parser.add_argument("--scales", default=DEFAULT_SCALES,
+                        help=f"실제 목록({BASE_PRODUCTS}개 제품) 대비 배율 목록 (쉼표 구분)")
+    parser.add_argument("--seed", type=int, default=0, help="코퍼스 난수 seed (같으면 같은 입력)")
+    parser.add_argument("--image-size", type=int, default=IMAGE_SIZE, help="메인 / 호버 이미지 한 변 (px)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="병렬 작업 수")
+    parser.add_argument("--keep", default=None, help="코퍼스를 지우지 않고 이 폴더에 남김")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    instrumentation.configure(args)
+    scales = [float(scale) for scale in args.scales.split(',') if scale.strip()]
+
+    print("🚀 자산 스크립트 규모별 벤치마크")
+    print(f"📏 배율: {', '.join(f'{scale:g}x' for scale in scales)} (기준 {BASE_PRODUCTS}개 제품), seed {args.seed}")
+    print("=" * 70)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="asset-bench-") as temp:
+        root = Path(args.keep or temp)
+        for scale in scales:
+            products = max(1, round(BASE_PRODUCTS * scale))
+            print(f"\n📦 {scale:g}x: 제품 {products:,}개")
+            directory = root / f"scale-{products}"
+            if (directory / CATALOGUE_JSON).exists():
+                print(f"❌ 이미 코퍼스가 있습니다 (다른 폴더를 지정하세요): {directory}")
+                sys.exit(1)
+            try:
+                results[products] = run_scale(directory, products, args)
+            except BenchmarkError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+
+    print_results(results)
+    if args.keep:
+        print(f"\n📁 코퍼스 보관: {args.keep}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,9 @@
 #!/usr/bin/env python3
 # 🖼️ Bookcase in White with Doors 이미지 다운로드 테스트
 
-import requests
-import os
 from pathlib import Path
-import time
 
-def download_image(url, filepath):
-    try:
-        print(f"📥 다운로드 시작: {filepath}")
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Referer': 'https://tylko.com/'
-        }
-        
-        response = requests.get(url, headers=headers, stream=True, timeout=30)
-        response.raise_for_status()
-        
-        # 디렉토리 생성
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-        
-        file_size = os.path.getsize(filepath)
-        print(f"✅ 완료: {filepath} ({file_size:,} bytes)")
-        return True
-        
-    except Exception as e:
-        print(f"❌ 실패 {filepath}: {e}")
-        return False
+from image_downloader import download_all
 
 def main():
     print("🚀 ProductV2 이미지 다운로드 테스트")
@@ -46,23 +17,22 @@ def main():
     (base_path / "main").mkdir(parents=True, exist_ok=True)
     (base_path / "hover").mkdir(parents=True, exist_ok=True)
     
-    success_count = 0
-    total_count = 2
-    
     # 메인 이미지 (Instagram 이미지)
     main_url = "https://media.tylko.com/media/gallery/furniture_image/2022/05/Living_room_08_living-room-Bookcase_EAPgDsY.jpg"
     main_path = base_path / "main" / "bookcase-white-doors-main.jpg"
     
-    if download_image(main_url, main_path):
-        success_count += 1
-    time.sleep(1)  # 서버 부하 방지
-    
     # 호버 이미지 (제품 이미지)
     hover_url = "https://media.tylko.com/media/catalogue/catalogue_entry/2024/02/unreal_render_tasks/unreal_50.webp"
     hover_path = base_path / "hover" / "bookcase-white-doors-hover.webp"
     
-    if download_image(hover_url, hover_path):
-        success_count += 1
+    # 공유 세션으로 동시에 다운로드 (호스트별 동시 요청 수로 서버 부하 제한)
+    results = download_all([
+        {'url': main_url, 'path': main_path, 'type': 'main'},
+        {'url': hover_url, 'path': hover_path, 'type': 'hover'},
+    ])
+    
+    total_count = len(results)
+    success_count = sum(1 for r in results if r['ok'])
     
     print()
     print("📊 다운로드 완료!")
@@ -1,31 +1,167 @@
 #!/usr/bin/env python3
-# 문법 체크 스크립트
-
-with open('productv2-image-extractor.html', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-    
-backtick_count = 0
-for i, line in enumerate(lines, 1):
-    backtick_count += line.count('`')
-    
-print(f"Total backticks: {backtick_count}")
-if backtick_count % 2 != 0:
-    print("ERROR: Odd number of backticks - unclosed template literal!")
-    
-# Find unclosed template literals
-in_template = False
-template_start = 0
-for i, line in enumerate(lines, 1):
-    if '`' in line:
-        count = line.count('`')
-        for _ in range(count):
-            if not in_template:
-                in_template = True
-                template_start = i
-            else:
-                in_template = False
-                
-if in_template:
-    print(f"ERROR: Unclosed template literal around line {template_start}")
-else:
-    print("All template literals are properly closed")
\ No newline at end of file
+# -*- coding: utf-8 -*-
+"""
+문법 체크 스크립트 (커밋 전 검사용)
+src 아래 .ts / .tsx (와 지정한 .js / .mjs / .html) 파일의 괄호 / 문자열 / 템플릿 / 주석 / 정규식 / JSX 짝 검사
+
+- 렉서는 js_lexer.py (문자열 / 주석 / 정규식 안의 백틱은 세지 않음)
+- 파일은 프로세스 풀에서 병렬로 검사
+- 결과는 .cache/syntax-check.json 에 캐시: 크기 / mtime 이 같으면 읽지 않고, 달라도 내용 해시가 같으면 다시 검사하지 않음
+- 문제가 하나라도 있으면 종료 코드 1
+
+사용법: python scripts/check_syntax.py [폴더/파일 ...] [--no-cache] [--workers N]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import instrumentation
+from instrumentation import stage
+from js_lexer import check_file_text
+
+# 경로 설정 (저장소 루트에서 실행)
+DEFAULT_ROOTS = ["src"]
+CACHE_FILE = ".cache/syntax-check.json"
+EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '.html'}
+SKIP_DIRS = {'node_modules', '.next', '.git', 'out', 'coverage'}
+
+# 렉서 규칙이 바뀌면 올려서 캐시를 버림
+CACHE_VERSION = 2
+# 이보다 적은 파일은 프로세스 풀 없이 바로 검사 (풀 시작 비용이 더 큼)
+POOL_THRESHOLD = 16
+CHUNK_SIZE = 8
+
+
+def collect_files(paths):
+    """폴더 / 파일 목록 → 검사할 파일 경로 목록 (정렬)"""
+    files = set()
+    for path in paths:
+        if os.path.isfile(path):
+            files.add(os.path.normpath(path))
+            continue
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames[:] = [name for name in dirnames if name not in SKIP_DIRS]
+            for name in filenames:
+                if os.path.splitext(name)[1].lower() in EXTENSIONS:
+                    files.add(os.path.normpath(os.path.join(directory, name)))
+    return sorted(files)
+
+
+def load_cache(cache_file):
+    """캐시 로드 (없거나 손상/버전 불일치면 빈 캐시)"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def save_cache(cache_file, files):
+    """캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+    cache_path = Path(cache_file)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": CACHE_VERSION, "files": files}, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+
+def check_file(job):
+    """(경로, 캐시된 해시) → (해시, 문제 목록) - 해시가 같으면 문제 목록은 None (검사 생략)"""
+    path, known_sha = job
+    with open(path, 'rb') as f:
+        data = f.read()
+    sha = hashlib.sha256(data).hexdigest()
+    if sha == known_sha:
+        return sha, None
+    text = data.decode('utf-8', errors='replace')
+    return sha, [list(issue) for issue in check_file_text(path, text)]
+
+
+def check_files(files, cache, workers=os.cpu_count() or 1):
+    """파일 목록 검사 → ({경로: 문제 목록}, 새 캐시, 실제로 검사한 파일 수)"""
+    results = {}
+    new_cache = {}
+    jobs = []
+    for path in files:
+        st = os.stat(path)
+        entry = cache.get(path)
+        if entry and (entry["size"], entry["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+            results[path] = entry["issues"]
+            new_cache[path] = entry
+        else:
+            jobs.append((path, st, entry))
+
+    work = [(path, entry["sha256"] if entry else None) for path, _, entry in jobs]
+    if len(work) >= POOL_THRESHOLD and workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(work))) as executor:
+            checked = list(executor.map(check_file, work, chunksize=CHUNK_SIZE))
+    else:
+        checked = [check_file(job) for job in work]
+
+    lexed = 0
+    for (path, st, entry), (sha, issues) in zip(jobs, checked):
+        if issues is None:
+            issues = entry["issues"]
+        else:
+            lexed += 1
+        results[path] = issues
+        new_cache[path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": sha, "issues": issues}
+
+    return results, new_cache, lexed
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="JS / TS 구문 짝 검사 (괄호, 문자열, 템플릿, 주석, 정규식, JSX)")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_ROOTS, help="검사할 폴더 / 파일")
+    parser.add_argument("--cache", default=CACHE_FILE, help="결과 캐시 파일 경로")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 무시하고 모두 다시 검사")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="검사 프로세스 수")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    instrumentation.configure(args)
+    started = time.perf_counter()
+
+    files = collect_files(args.paths)
+    cache = {} if args.no_cache else load_cache(args.cache)
+    with stage("check_files") as metrics:
+        results, new_cache, lexed = check_files(files, cache, args.workers)
+        metrics.add(files=len(files), bytes=sum(entry["size"] for entry in new_cache.values()))
+        metrics.cache(hits=len(files) - lexed, misses=lexed)
+
+    # 이번에 검사하지 않은 파일의 캐시 항목은 유지 (다른 폴더만 검사한 경우)
+    cache.update(new_cache)
+    save_cache(args.cache, cache)
+
+    failed = 0
+    for path in files:
+        issues = results[path]
+        if issues:
+            failed += 1
+            for line, column, message in issues:
+                print(f"❌ {path}:{line}:{column} {message}")
+
+    elapsed = time.perf_counter() - started
+    print(f"📊 파일 {len(files)}개 (새로 검사 {lexed}개, 나머지는 캐시), 문제 있는 파일 {failed}개")
+    print(f"⏱️ 소요 시간: {elapsed:.2f}s")
+    if failed:
+        sys.exit(1)
+    print("✅ 모든 파일의 괄호 / 문자열 / 템플릿 짝이 맞습니다")
+
+
+if __name__ == "__main__":
+    main()
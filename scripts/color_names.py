@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+색상 섬네일 대표색 추출 → 색상 이름 자동 지정
+섬네일마다 배경을 뺀 제품 픽셀의 채널별 중앙값을 대표색으로 잡고,
+Lab 공간에서 팔레트(COLORS) 중 가장 가까운 이름과 신뢰도를 돌려줌
+
+- 이미지는 프로세스 풀에서 작게 줄이고, 대표색은 NumPy 로 모든 섬네일을 한 번에
+- 대표색은 내용 해시(sha256) 기준으로 이미지 색인에 캐시 (팔레트 매칭은 매번 계산)
+- 신뢰도는 가장 가까운 색과 두 번째 색의 거리 차이 (0 이면 두 색 사이에서 애매함)
+
+사용법: python scripts/color_names.py [폴더 ...] [--db .cache/asset-index.sqlite]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from asset_index import AssetIndex
+
+# NumPy / Pillow 는 선택 사항: 없으면 호출한 쪽이 기존 순서 방식으로 이름을 붙임
+try:
+    import numpy as np
+    from PIL import Image
+    HAS_IMAGING = True
+except ImportError:
+    HAS_IMAGING = False
+
+# 경로 설정 (저장소 루트에서 실행)
+DEFAULT_ROOTS = ["public/images/products/v2/colors"]
+DB_FILE = ".cache/asset-index.sqlite"
+
+COLOR_KIND = "dominant_rgb24"
+SAMPLE_SIZE = 48
+BACKGROUND_DISTANCE = 24    # 테두리 배경색과 이만큼 다르면 제품 픽셀
+LOW_CONFIDENCE = 0.25
+CHUNK_SIZE = 64
+
+# 팔레트 기준색 (sRGB) - 실제 마감재 색이 아니라 렌더 섬네일에서 측정되는 중앙값 기준
+PALETTE = {
+    "white": (218, 218, 217),
+    "light-grey": (186, 186, 185),
+    "grey": (159, 159, 158),
+    "dark-grey": (106, 106, 107),
+    "black": (48, 48, 48),
+    "cream": (208, 204, 193),
+    "beige": (196, 184, 164),
+    "sand": (172, 167, 153),
+    "light-wood": (192, 160, 124),
+    "brown": (122, 90, 68),
+    "dark-wood": (90, 64, 50),
+    "red": (166, 102, 82),
+    "burgundy": (104, 56, 58),
+    "pink": (212, 168, 164),
+    "yellow": (216, 184, 96),
+    "green": (108, 121, 84),
+    "moss-green": (88, 96, 70),
+    "sage": (163, 173, 152),
+    "blue": (166, 194, 209),
+}
+
+
+def load_sample(path):
+    """이미지 → SAMPLE_SIZE x SAMPLE_SIZE RGB 픽셀 바이트 (실패하면 None)"""
+    try:
+        with Image.open(path) as image:
+            image.draft('RGB', (SAMPLE_SIZE * 2, SAMPLE_SIZE * 2))
+            return image.convert('RGB').resize((SAMPLE_SIZE, SAMPLE_SIZE), Image.BILINEAR).tobytes()
+    except (OSError, ValueError):
+        return None
+
+
+def srgb_to_lab(rgb):
+    """(..., 3) sRGB 0-255 배열 → CIE Lab (D65)"""
+    c = np.asarray(rgb, dtype=np.float64) / 255.0
+    c = np.where(c > 0.04045, ((c + 0.055) / 1.055) ** 2.4, c / 12.92)
+    xyz = c @ np.array([[0.4124, 0.2126, 0.0193],
+                        [0.3576, 0.7152, 0.1192],
+                        [0.1805, 0.0722, 0.9505]])
+    xyz /= np.array([0.95047, 1.0, 1.08883])
+    f = np.where(xyz > 216 / 24389, np.cbrt(xyz), (24389 / 27 * xyz + 16) / 116)
+    return np.stack([116 * f[..., 1] - 16,
+                     500 * (f[..., 0] - f[..., 1]),
+                     200 * (f[..., 1] - f[..., 2])], axis=-1)
+
+
+def dominant_color_batch(samples):
+    """RGB 픽셀 바이트 목록 → 대표색 24비트 정수 목록
+
+    모든 섬네일을 (N, 픽셀, 3) 배열로 쌓아 배경 픽셀을 NaN 으로 지우고 채널별 중앙값을 한 번에 계산
+    (그늘진 안쪽 면 / 밝은 책 같은 소수 픽셀에 끌려가지 않음)
+    """
+    pixels = np.frombuffer(b''.join(samples), dtype=np.uint8)
+    pixels = pixels.reshape(len(samples), SAMPLE_SIZE, SAMPLE_SIZE, 3).astype(np.float32)
+
+    border = np.concatenate([pixels[:, 0], pixels[:, -1], pixels[:, :, 0], pixels[:, :, -1]], axis=1)
+    background = np.median(border, axis=1)
+    mask = np.abs(pixels - background[:, None, None, :]).sum(axis=3) > BACKGROUND_DISTANCE
+    # 제품 픽셀이 거의 없으면(단색 이미지) 전체를 사용
+    mask[mask.sum(axis=(1, 2)) < 4] = True
+
+    foreground = np.where(mask[..., None], pixels, np.nan).reshape(len(samples), -1, 3)
+    dominant = np.clip(np.rint(np.nanmedian(foreground, axis=1)), 0, 255).astype(np.int64)
+    return [int(r) << 16 | int(g) << 8 | int(b) for r, g, b in dominant]
+
+
+def match_palette(colors, names=None):
+    """대표색 목록 → [(이름, 신뢰도, ΔE)], names 로 쓸 팔레트 이름을 제한"""
+    if not colors:
+        return []
+    names = [name for name in (names or PALETTE) if name in PALETTE]
+    palette = srgb_to_lab([PALETTE[name] for name in names])
+    rgb = np.array([[c >> 16 & 0xFF, c >> 8 & 0xFF, c & 0xFF] for c in colors], dtype=np.float64)
+    delta = np.linalg.norm(srgb_to_lab(rgb)[:, None, :] - palette[None, :, :], axis=2)   # (N, 팔레트)
+
+    ranked = np.argsort(delta, axis=1)
+    best, second = ranked[:, 0], ranked[:, min(1, len(names) - 1)]
+    rows = np.arange(len(colors))
+    d1, d2 = delta[rows, best], delta[rows, second]
+    confidence = np.where(d2 > 0, 1 - d1 / np.maximum(d2, 1e-9), 1.0)
+    return [(names[b], round(float(c), 3), round(float(d), 1)) for b, c, d in zip(best, confidence, d1)]
+
+
+def dominant_colors(index, paths, workers=os.cpu_count() or 1):
+    """파일 경로 목록 → {경로: 대표색} (색인 캐시에 없는 내용만 계산하여 저장)"""
+    digests = {Path(path): index.digest_of(path) for path in paths}
+    cached = index.perceptual_hashes(COLOR_KIND)
+    pending = {}
+    for path, sha in digests.items():
+        if sha and sha not in cached:
+            pending.setdefault(sha, path)
+
+    if pending:
+        shas = list(pending)
+        with ProcessPoolExecutor(max_workers=max(1, min(workers, len(shas)))) as executor:
+            samples = list(executor.map(load_sample, [pending[sha] for sha in shas], chunksize=CHUNK_SIZE))
+        loaded = [(sha, data) for sha, data in zip(shas, samples) if data is not None]
+        if loaded:
+            new_colors = dict(zip([sha for sha, _ in loaded], dominant_color_batch([data for _, data in loaded])))
+            index.set_perceptual_hashes(COLOR_KIND, new_colors)
+            cached.update(new_colors)
+
+    return {path: cached[sha] for path, sha in digests.items() if sha in cached}
+
+
+def name_thumbnails(index, paths, names=None, workers=os.cpu_count() or 1):
+    """섬네일 경로 목록 → {경로: (색상 이름, 신뢰도)}, NumPy / Pillow 가 없으면 빈 사전"""
+    if not HAS_IMAGING or not paths:
+        return {}
+    colors = dominant_colors(index, paths, workers)
+    if not colors:
+        # 모두 열 수 없는 섬네일 → 호출한 쪽이 기존 순서 방식으로 이름을 붙임
+        return {}
+    keys = list(colors)
+    return {path: (name, confidence)
+            for path, (name, confidence, _) in zip(keys, match_palette([colors[p] for p in keys], names))}
+
+
+def unique_labels(labels):
+    """제품 안에서 같은 색 이름이 겹치면 뒤에 번호를 붙여 파일명이 겹치지 않게"""
+    seen = {}
+    result = []
+    for label in labels:
+        seen[label] = seen.get(label, 0) + 1
+        result.append(label if seen[label] == 1 else f"{label}-{seen[label]}")
+    return result
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="색상 섬네일 대표색 → 색상 이름")
+    parser.add_argument("roots", nargs="*", default=DEFAULT_ROOTS, help="섬네일 폴더")
+    parser.add_argument("--db", default=DB_FILE, help="이미지 색인 DB 경로")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="이미지 로딩 프로세스 수")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if not HAS_IMAGING:
+        print("⚠️ NumPy 와 Pillow 가 필요합니다: pip install numpy pillow")
+        return
+
+    print("🎨 섬네일 대표색 추출 시작")
+    started = time.perf_counter()
+    paths = []
+    with AssetIndex(args.db) as index:
+        for root in args.roots:
+            root = os.path.normpath(root)
+            index.refresh(root)
+            paths.extend(row['path'] for row in index.query(root=root) if 'thumbnail' in row['name'])
+        colors = dominant_colors(index, paths, args.workers)
+
+    if not colors:
+        print("⚠️ 대표색을 구할 섬네일이 없습니다")
+        return
+
+    keys = sorted(colors)
+    matches = match_palette([colors[path] for path in keys])
+    uncertain = 0
+    for path, (name, confidence, delta) in zip(keys, matches):
+        mark = "✅" if confidence >= LOW_CONFIDENCE else "❓"
+        uncertain += confidence < LOW_CONFIDENCE
+        print(f"  {mark} {Path(path).name:<45} #{colors[path]:06x} → {name:<11} "
+              f"신뢰도 {confidence:.2f} (ΔE {delta})")
+
+    print(f"\n📊 섬네일 {len(keys)}개, 확인이 필요한 것 {uncertain}개")
+    print(f"⏱️ 소요 시간: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
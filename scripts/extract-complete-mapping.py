@@ -5,157 +5,167 @@ HTML에서 모든 제품의 완전한 이미지 매핑 정보를 추출하는 
 Tylko.com HTML 데이터에서 34개 제품의 정확한 이미지 파일명 추출
 """
 
-import re
+import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from extraction_cache import (
+    diff_mappings,
+    load_card_cache,
+    load_previous_mappings,
+    save_card_cache,
+)
+from product_card_parser import (
+    dedupe_mappings,
+    expand_html_inputs,
+    extract_html_file,
+    init_worker_cache,
+    iter_cached_cards,
+)
+from source_index import SourceIndex
+import instrumentation
+from instrumentation import detail, stage
+
 # HTML 파일 경로
 HTML_FILE = r"C:\Users\apf_temp_admin\Desktop\befunweb\product-v2-example.txt"
 SOURCE_DIR = r"C:\Users\apf_temp_admin\Desktop\Bookcases, Bookshelves - modern, large or small - Tylko_files"
 TARGET_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\public\images\products\v2"
+OUTPUT_FILE = r"C:\Users\apf_temp_admin\Desktop\befunweb\extracted-mappings.json"
+CACHE_FILE = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\extract-card-cache.json"
 
-def extract_filename_from_url(url):
-    """URL에서 파일명만 추출"""
-    return url.split('/')[-1]
-
-def extract_all_products_from_html():
-    """HTML에서 모든 제품의 이미지 매핑 정보 추출"""
+def extract_all_products_from_html(html_file=HTML_FILE, cache=None):
+    """HTML에서 모든 제품의 이미지 매핑 정보 추출 (카드 단위 스트리밍)
+    
+    (제품 매핑 목록, 이번 실행의 카드 캐시, 캐시 적중 수) 반환
+    """
     print("🔍 HTML에서 제품 정보 추출 중...")
     
-    with open(HTML_FILE, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    extracted_mappings = []
+    seen_cards = {}
+    cache_hits = 0
     
-    # 제품 카드별로 분리하기 위한 패턴
-    product_pattern = r'<li data-testid="product-card">.*?</li>'
-    products = re.findall(product_pattern, html_content, re.DOTALL)
+    with open(html_file, 'r', encoding='utf-8') as f:
+        for i, (digest, mapping, cached) in enumerate(iter_cached_cards(f, cache or {})):
+            seen_cards[digest] = mapping
+            cache_hits += cached
+            detail(f"\n🔍 제품 {i+1} 분석 중...{' (캐시)' if cached else ''}")
+            
+            if mapping is None:
+                detail(f"  ❌ 제품 이름을 찾을 수 없습니다.")
+                continue
+            
+            extracted_mappings.append(mapping)
+            
+            detail(f"  📝 제품명: {mapping['name']}")
+            detail(f"  📸 메인: {mapping['main_image']}")
+            detail(f"  🎯 호버: {mapping['hover_image']}")
+            detail(f"  🎨 섬네일: {len(mapping['color_thumbnails'])}개")
+            detail(f"  💰 가격: €{mapping['price']} (원가: €{mapping['original_price']})")
+            detail(f"  📏 크기: {mapping['dimensions']}")
     
-    print(f"📦 발견된 제품 카드: {len(products)}개")
+    print(f"\n📦 발견된 제품 카드: {len(seen_cards)}개 (캐시 재사용 {cache_hits}개)")
     
-    extracted_mappings = []
+    return extracted_mappings, seen_cards, cache_hits
+
+def extract_all_products_from_pages(html_files, cache=None, workers=None):
+    """여러 HTML 페이지를 프로세스 풀에서 병렬 추출 후 하나로 병합
     
-    for i, product_html in enumerate(products):
-        print(f"\n🔍 제품 {i+1} 분석 중...")
-        
-        # 제품 이름 추출
-        name_match = re.search(r'alt="([^"]*Bookcase[^"]*)"', product_html)
-        if not name_match:
-            print(f"  ❌ 제품 이름을 찾을 수 없습니다.")
-            continue
-            
-        product_name = name_match.group(1)
-        print(f"  📝 제품명: {product_name}")
-        
-        # 메인 이미지 (data-testid="product-card-image-instagrid") - 순서를 바꿔서 더 정확하게
-        main_match = re.search(r'<img src="([^"]*)"[^>]*data-testid="product-card-image-instagrid"', product_html)
-        main_image = extract_filename_from_url(main_match.group(1)) if main_match else None
-        
-        # 호버 이미지 (data-testid="product-card-image") - 순서를 바꿔서 더 정확하게  
-        hover_match = re.search(r'<img src="([^"]*)"[^>]*data-testid="product-card-image"', product_html)
-        hover_image = extract_filename_from_url(hover_match.group(1)) if hover_match else None
-        
-        # 색상 섬네일들
-        thumbnail_pattern = r'src="[^"]*thumbnail[^"]*"'
-        thumbnail_matches = re.findall(thumbnail_pattern, product_html)
-        color_thumbnails = []
-        
-        for match in thumbnail_matches:
-            url = match.replace('src="', '').replace('"', '')
-            filename = extract_filename_from_url(url)
-            color_thumbnails.append(filename)
-        
-        # 가격 정보 추출
-        price_match = re.search(r'data-testid="product-card-price-discount">€(\d+)</span>', product_html)
-        original_price_match = re.search(r'data-testid="product-card-price">€(\d+)</span>', product_html)
-        
-        price = int(price_match.group(1)) if price_match else None
-        original_price = int(original_price_match.group(1)) if original_price_match else None
-        
-        # 크기 정보 추출
-        size_match = re.search(r'data-testid="product-card-furniture-size">([^<]*)</h3>', product_html)
-        dimensions = size_match.group(1).strip() if size_match else None
-        
-        # 가구 타입 추출
-        type_match = re.search(r'data-testid="product-card-furniture-type">([^<]*)</p>', product_html)
-        furniture_type = type_match.group(1).strip() if type_match else None
-        
-        # 배지/라벨 정보
-        has_top_seller = "Top seller" in product_html
-        has_discount = "data-testid=\"product-card-badge\"" in product_html
-        
-        # 결과 저장
-        mapping = {
-            "name": product_name,
-            "main_image": main_image,
-            "hover_image": hover_image,
-            "color_thumbnails": color_thumbnails,
-            "price": price,
-            "original_price": original_price,
-            "dimensions": dimensions,
-            "furniture_type": furniture_type,
-            "has_top_seller": has_top_seller,
-            "has_discount": has_discount
-        }
-        
-        extracted_mappings.append(mapping)
-        
-        print(f"  📸 메인: {main_image}")
-        print(f"  🎯 호버: {hover_image}")
-        print(f"  🎨 섬네일: {len(color_thumbnails)}개")
-        print(f"  💰 가격: €{price} (원가: €{original_price})")
-        print(f"  📏 크기: {dimensions}")
+    결과 순서는 입력 파일 순서 → 파일 내 카드 순서로 항상 동일하며,
+    제품명과 이미지 집합이 같은 중복 제품은 처음 것만 남긴다.
+    """
+    workers = workers or min(len(html_files), os.cpu_count() or 1)
+    print(f"🔍 {len(html_files)}개 HTML 페이지에서 제품 정보 추출 중... (워커 {workers}개)")
+    
+    merged = []
+    seen_cards = {}
+    total_cards = 0
+    cache_hits = 0
     
-    return extracted_mappings
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker_cache,
+                             initargs=(cache or {},)) as executor:
+        # map 은 입력 순서대로 결과를 돌려주므로 병합 순서가 결정적
+        for html_file, cards in executor.map(extract_html_file, html_files):
+            mappings = [mapping for _, mapping, _ in cards if mapping is not None]
+            hits = sum(cached for _, _, cached in cards)
+            seen_cards.update((digest, mapping) for digest, mapping, _ in cards)
+            total_cards += len(cards)
+            cache_hits += hits
+            merged.extend(mappings)
+            print(f"  📄 {Path(html_file).name}: 카드 {len(cards)}개 → 제품 {len(mappings)}개 (캐시 {hits}개)")
+    
+    unique = dedupe_mappings(merged)
+    print(f"\n📦 발견된 제품 카드: {total_cards}개 (캐시 재사용 {cache_hits}개)")
+    print(f"🧹 중복 제거: {len(merged)}개 → {len(unique)}개")
+    
+    return unique, seen_cards, cache_hits
 
 def save_mappings_to_json(mappings):
-    """추출된 매핑 정보를 JSON 파일로 저장"""
-    output_file = Path("C:\\Users\\apf_temp_admin\\Desktop\\befunweb\\extracted-mappings.json")
+    """추출된 매핑 정보를 JSON 파일로 저장 (내용이 같으면 다시 쓰지 않음)"""
+    output_file = Path(OUTPUT_FILE)
+    content = json.dumps(mappings, indent=2, ensure_ascii=False)
+    
+    if output_file.exists() and output_file.read_text(encoding='utf-8') == content:
+        print(f"\n💾 매핑 정보 변경 없음: {output_file}")
+        return output_file
     
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(mappings, f, indent=2, ensure_ascii=False)
+        f.write(content)
     
     print(f"\n💾 매핑 정보를 저장했습니다: {output_file}")
     return output_file
 
+def print_change_summary(previous, mappings):
+    """이전 실행 대비 추가/변경/삭제된 제품 요약"""
+    added, changed, removed = diff_mappings(previous, mappings)
+    
+    print(f"\n🔄 변경 요약: 추가 {len(added)}개, 변경 {len(changed)}개, 삭제 {len(removed)}개")
+    for label, keys in [("➕ 추가", added), ("✏️ 변경", changed), ("➖ 삭제", removed)]:
+        for name, main_image in keys:
+            print(f"  {label}: {name} ({main_image})")
+    
+    return added, changed, removed
+
 def check_available_files(mappings):
     """다운로드 폴더에서 사용 가능한 파일 확인"""
     print("\n📂 다운로드된 파일 가용성 확인...")
     
-    source_path = Path(SOURCE_DIR)
-    available_files = set(f.name.lower() for f in source_path.glob("*") if f.is_file())
+    index = SourceIndex.scan(SOURCE_DIR)
     
     total_needed = 0
     total_available = 0
     
     for i, mapping in enumerate(mappings):
-        print(f"\n📦 {mapping['name']}")
+        detail(f"\n📦 {mapping['name']}")
         
         # 메인 이미지 확인
         if mapping['main_image']:
             total_needed += 1
-            if mapping['main_image'].lower() in available_files:
-                print(f"  ✅ 메인: {mapping['main_image']}")
+            if index.has(mapping['main_image']):
+                detail(f"  ✅ 메인: {mapping['main_image']}")
                 total_available += 1
             else:
-                print(f"  ❌ 메인: {mapping['main_image']} (없음)")
+                detail(f"  ❌ 메인: {mapping['main_image']} (없음)")
         
         # 호버 이미지 확인
         if mapping['hover_image']:
             total_needed += 1
-            if mapping['hover_image'].lower() in available_files:
-                print(f"  ✅ 호버: {mapping['hover_image']}")
+            if index.has(mapping['hover_image']):
+                detail(f"  ✅ 호버: {mapping['hover_image']}")
                 total_available += 1
             else:
-                print(f"  ❌ 호버: {mapping['hover_image']} (없음)")
+                detail(f"  ❌ 호버: {mapping['hover_image']} (없음)")
         
         # 색상 섬네일들 확인
         available_thumbnails = 0
         for thumbnail in mapping['color_thumbnails']:
-            if thumbnail.lower() in available_files:
+            if index.has(thumbnail):
                 available_thumbnails += 1
                 total_available += 1
             total_needed += 1
         
-        print(f"  🎨 섬네일: {available_thumbnails}/{len(mapping['color_thumbnails'])}개 사용 가능")
+        detail(f"  🎨 섬네일: {available_thumbnails}/{len(mapping['color_thumbnails'])}개 사용 가능")
     
     print(f"\n📊 전체 요약:")
     print(f"  필요한 파일: {total_needed}개")
@@ -164,14 +174,46 @@ def check_available_files(mappings):
     
     return total_available, total_needed
 
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Tylko HTML 페이지에서 제품-이미지 매핑 추출")
+    parser.add_argument("inputs", nargs="*", default=[HTML_FILE],
+                        help="HTML 파일, 디렉토리 또는 glob 패턴 (기본: HTML_FILE)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="병렬 추출 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="카드 캐시를 무시하고 모든 카드를 다시 파싱")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+    instrumentation.configure(args)
+    
     print("🚀 HTML에서 완전한 제품-이미지 매핑 추출 시작!")
     print("=" * 70)
     
     try:
         # 1. HTML에서 모든 제품 정보 추출
-        mappings = extract_all_products_from_html()
+        html_files = expand_html_inputs(args.inputs)
+        if not html_files:
+            print(f"❌ 입력에 해당하는 HTML 파일이 없습니다: {args.inputs}")
+            return
+        
+        cache = {} if args.no_cache else load_card_cache(CACHE_FILE)
+        previous = load_previous_mappings(OUTPUT_FILE)
+        
+        with stage("extract") as metrics:
+            if len(html_files) == 1:
+                mappings, seen_cards, cache_hits = extract_all_products_from_html(html_files[0], cache)
+            else:
+                mappings, seen_cards, cache_hits = extract_all_products_from_pages(html_files, cache, args.workers)
+            metrics.add(files=len(html_files), bytes=sum(os.path.getsize(path) for path in html_files))
+            metrics.cache(hits=cache_hits, misses=len(seen_cards) - cache_hits)
+        
+        # 이번 실행에서 본 카드만 남겨 캐시가 무한히 커지지 않도록 함
+        save_card_cache(CACHE_FILE, seen_cards)
         
         if not mappings:
             print("❌ 추출된 제품 정보가 없습니다.")
@@ -180,10 +222,13 @@ def main():
         # 2. JSON 파일로 저장
         json_file = save_mappings_to_json(mappings)
         
-        # 3. 파일 가용성 확인
+        # 3. 변경 요약
+        print_change_summary(previous, mappings)
+        
+        # 4. 파일 가용성 확인
         available, needed = check_available_files(mappings)
         
-        # 4. 결과 요약
+        # 5. 결과 요약
         print("\n" + "=" * 70)
         print("🎉 HTML 매핑 추출 완료!")
         print(f"📦 추출된 제품: {len(mappings)}개")
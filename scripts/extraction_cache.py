@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+제품 카드 증분 추출 캐시
+카드 HTML 해시 → 추출된 매핑을 디스크에 보관하여 바뀌지 않은 카드는 재파싱하지 않음
+"""
+
+import json
+import os
+from pathlib import Path
+
+CACHE_VERSION = 1
+
+
+def load_card_cache(cache_file):
+    """캐시 파일 로드 (없거나 손상/버전 불일치면 빈 캐시)"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("cards", {})
+
+
+def save_card_cache(cache_file, cards):
+    """캐시 파일 저장 (임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 손상되지 않음)"""
+    cache_path = Path(cache_file)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": CACHE_VERSION, "cards": cards}, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+
+def load_previous_mappings(mapping_file):
+    """이전 실행의 extracted-mappings.json 로드 (없으면 빈 목록)"""
+    try:
+        with open(mapping_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def product_key(mapping):
+    """실행 간 같은 제품을 식별하는 키 (제품명 + 메인 이미지)"""
+    return mapping["name"], mapping["main_image"]
+
+
+def diff_mappings(previous, current):
+    """이전/현재 매핑 비교 → (추가, 변경, 삭제) 제품 키 목록"""
+    before = {product_key(m): m for m in previous}
+    after = {product_key(m): m for m in current}
+
+    added = [key for key in after if key not in before]
+    removed = [key for key in before if key not in after]
+    changed = [key for key in after if key in before and after[key] != before[key]]
+
+    return added, changed, removed
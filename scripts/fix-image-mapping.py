@@ -5,14 +5,35 @@
 HTML에서 추출한 정확한 매핑 정보 기반
 """
 
+import argparse
 import os
-import shutil
+import time
 from pathlib import Path
 import re
 
+from asset_index import AssetIndex
+from color_names import LOW_CONFIDENCE, name_thumbnails, unique_labels
+from image_store import ImageStore
+import instrumentation
+from organize_engine import (
+    DEFAULT_WORKERS,
+    add_to_plan,
+    apply_sync,
+    diff_tree,
+    print_report,
+    print_sync_plan,
+    scan_files,
+)
+from source_index import SourceIndex
+
 # 설정
 SOURCE_DIR = r"C:\Users\apf_temp_admin\Desktop\Bookcases, Bookshelves - modern, large or small - Tylko_files"
 TARGET_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\public\images\products\v2"
+STORE_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\image-store"
+ASSET_DB = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\asset-index.sqlite"
+
+# 같은 이미지는 저장소에 한 번만 두고 제품 폴더에는 링크로 배치
+STORE = ImageStore(STORE_DIR)
 
 # HTML에서 추출한 정확한 제품-이미지 매핑 정보
 CORRECT_MAPPINGS = {
@@ -61,75 +82,89 @@ CORRECT_MAPPINGS = {
 
 COLORS = ["white", "grey", "brown", "black", "green", "blue", "red", "beige"]
 
-def clear_existing_images():
-    """기존 이미지들 정리"""
-    print("🧹 기존 이미지 파일들 정리 중...")
-    
+def managed_dirs():
+    """동기화가 관리하는 폴더들 (제품 폴더마다 main / hover / colors)"""
     target_path = Path(TARGET_DIR)
-    for product_folder in target_path.glob("*"):
-        if product_folder.is_dir():
-            for subfolder in ["main", "hover", "colors"]:
-                subfolder_path = product_folder / subfolder
-                if subfolder_path.exists():
-                    for file in subfolder_path.glob("*"):
-                        if file.is_file():
-                            file.unlink()
-                            print(f"  🗑️ 삭제: {file}")
-
-def copy_correct_images():
-    """정확한 매핑으로 이미지 복사"""
-    print("📸 올바른 이미지 매핑으로 복사 중...")
+    if not target_path.is_dir():
+        return []
+    return [folder / subfolder
+            for folder in target_path.iterdir() if folder.is_dir()
+            for subfolder in ("main", "hover", "colors")]
+
+def thumbnail_colors(names):
+    """매핑된 색상 섬네일의 대표색 → {파일명: 색상 이름} (NumPy / Pillow 가 없으면 빈 사전)"""
+    paths = [Path(SOURCE_DIR) / thumbnail
+             for mapping in CORRECT_MAPPINGS.values()
+             for thumbnail in mapping['color_thumbnails'] if thumbnail in names]
+    with AssetIndex(ASSET_DB) as assets:
+        named = name_thumbnails(assets, paths, COLORS)
     
-    source_path = Path(SOURCE_DIR)
-    copied_count = 0
-    missing_count = 0
+    for path, (color_name, confidence) in sorted(named.items()):
+        if confidence < LOW_CONFIDENCE:
+            print(f"  ❓ 색상 확인 필요: {path.name} → {color_name} (신뢰도 {confidence:.2f})")
+    return {path.name: color_name for path, (color_name, _) in named.items()}
+
+def plan_correct_images(names, color_names=None):
+    """정확한 매핑으로 복사 계획 작성 → (계획, 누락 파일 목록)
+
+    색상 이름은 섬네일 대표색(color_names)을 쓰고, 없으면 COLORS 순서대로 붙임
+    """
+    color_names = color_names or {}
+    plan = []
+    missing = []
     
     for product_slug, mapping in CORRECT_MAPPINGS.items():
-        print(f"\n📦 {mapping['name']} ({product_slug}) 처리 중...")
         product_path = Path(TARGET_DIR) / product_slug
         
-        # 메인 이미지 복사
-        main_src = source_path / mapping['main_image']
-        if main_src.exists():
-            # 확장자 유지
-            ext = main_src.suffix.lower()
-            main_dst = product_path / "main" / f"{product_slug}-main{ext}"
-            shutil.copy2(main_src, main_dst)
-            print(f"  📸 메인: {mapping['main_image']} → {main_dst.name}")
-            copied_count += 1
-        else:
-            print(f"  ❌ 메인 이미지 없음: {mapping['main_image']}")
-            missing_count += 1
+        # 메인 이미지 (확장자 유지)
+        ext = Path(mapping['main_image']).suffix.lower()
+        add_to_plan(plan, missing, names, SOURCE_DIR, mapping['main_image'],
+                    product_path / "main" / f"{product_slug}-main{ext}", "main")
         
-        # 호버 이미지 복사
-        hover_src = source_path / mapping['hover_image']
-        if hover_src.exists():
-            hover_dst = product_path / "hover" / f"{product_slug}-hover.webp"
-            shutil.copy2(hover_src, hover_dst)
-            print(f"  🎯 호버: {mapping['hover_image']} → {hover_dst.name}")
-            copied_count += 1
-        else:
-            print(f"  ❌ 호버 이미지 없음: {mapping['hover_image']}")
-            missing_count += 1
+        # 호버 이미지
+        add_to_plan(plan, missing, names, SOURCE_DIR, mapping['hover_image'],
+                    product_path / "hover" / f"{product_slug}-hover.webp", "hover")
         
-        # 색상 섬네일들 복사
-        print(f"  🎨 색상 변형들:")
-        for i, thumbnail in enumerate(mapping['color_thumbnails']):
-            color_src = source_path / thumbnail
-            if color_src.exists():
-                color_name = COLORS[i % len(COLORS)]
-                color_dst = product_path / "colors" / f"{product_slug}-{color_name}.webp"
-                shutil.copy2(color_src, color_dst)
-                print(f"    ✅ {color_name}: {thumbnail} → {color_dst.name}")
-                copied_count += 1
-            else:
-                print(f"    ❌ {thumbnail} (파일 없음)")
-                missing_count += 1
+        # 색상 섬네일들 (같은 색이 겹치면 번호를 붙여 구분)
+        labels = unique_labels([color_names.get(thumbnail) or COLORS[i % len(COLORS)]
+                                for i, thumbnail in enumerate(mapping['color_thumbnails'])])
+        for thumbnail, color_name in zip(mapping['color_thumbnails'], labels):
+            add_to_plan(plan, missing, names, SOURCE_DIR, thumbnail,
+                        product_path / "colors" / f"{product_slug}-{color_name}.webp", "colors")
     
-    return copied_count, missing_count
+    return plan, missing
+
+def sync_correct_images(dry_run=False, workers=DEFAULT_WORKERS):
+    """정확한 매핑과 현재 폴더를 비교하여 달라진 파일만 복사 / 이동 / 삭제
+
+    → (결과 목록, 누락 파일 목록), dry_run 이면 계획만 출력하고 결과는 None
+    """
+    print("📸 올바른 이미지 매핑과 현재 폴더 비교 중...")
+    
+    names = SourceIndex.scan(SOURCE_DIR)
+    plan, missing = plan_correct_images(names, thumbnail_colors(names))
+    # 해시는 이미지 색인에 저장된 값을 재사용 (크기 / mtime 이 바뀐 파일만 다시 계산)
+    with AssetIndex(ASSET_DB) as assets:
+        sync = diff_tree(plan, scan_files(managed_dirs()), assets.digest_of)
+    print_sync_plan(sync)
+    
+    if dry_run:
+        return None, missing
+    return apply_sync(sync, STORE.place, workers), missing
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="올바른 제품-이미지 매핑으로 재분류")
+    parser.add_argument("--dry-run", action="store_true", help="동기화 계획만 출력하고 변경하지 않음")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 복사 스레드 수")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
 
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+    instrumentation.configure(args)
+    
     print("🚀 올바른 이미지 매핑으로 재분류 시작!")
     print("=" * 60)
     
@@ -142,17 +177,19 @@ def main():
         return
     
     try:
-        # 1. 기존 이미지 정리
-        clear_existing_images()
+        # 1. 현재 폴더와 비교하여 달라진 이미지만 동기화
+        started = time.perf_counter()
+        results, missing = sync_correct_images(args.dry_run, args.workers)
         
-        # 2. 올바른 이미지 복사
-        copied, missing = copy_correct_images()
+        if results is None:
+            print("\n🔍 dry-run: 계획만 출력하고 변경하지 않았습니다.")
+            return
         
-        # 3. 결과 요약
+        # 2. 결과 요약
         print("\n" + "=" * 60)
         print("🎉 올바른 이미지 매핑 완료!")
-        print(f"✅ 복사된 파일: {copied}개")
-        print(f"❌ 누락된 파일: {missing}개")
+        print_report(results, missing, time.perf_counter() - started)
+        STORE.report()
         
         print("\n🎯 다음 단계:")
         print("1. 나머지 제품들의 HTML 매핑 정보 추가")
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ProductV2 이미지 데이터 코드 생성기
+extracted-mappings.json 과 정리된 이미지 트리(public/images/products/v2)를 읽어
+src/data/generated/productImages.ts 를 생성 (productsV2.ts 가 import)
+색상 스와치는 color-swatches.json 의 색상 이름별 배정을 그대로 사용 (섬네일 순서에 기대지 않음)
+
+- productsV2.ts 를 정규식으로 고치는 대신 데이터 모듈만 다시 생성
+- 내용이 같으면 파일을 쓰지 않음 (Next.js 증분 빌드 / HMR 이 불필요하게 돌지 않게)
+- 슬러그 ↔ 매핑 항목은 product_matcher 로 1:1 배정
+- 참조한 이미지가 트리에 없으면 경고, 크기는 이미지 색인(image_probe) 에서 가져옴
+- --check: 생성 결과가 현재 파일과 다르면 종료 코드 1 (CI 용)
+
+사용법: python scripts/generate_products_data.py [--check] [--no-sizes] [--swatches color-swatches.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+from asset_index import AssetIndex
+import instrumentation
+from instrumentation import stage, timed
+from image_probe import dimensions_by_url, probe_tree
+from product_matcher import match_products
+
+# 경로 설정 (저장소 루트에서 실행)
+MAPPING_JSON = "extracted-mappings.json"
+SWATCH_JSON = "color-swatches.json"
+OUTPUT_FILE = "src/data/generated/productImages.ts"
+IMAGE_ROOT = "public/images/products/v2"
+PUBLIC_IMAGES = "public/images"
+DB_FILE = ".cache/asset-index.sqlite"
+IMAGE_URL_PREFIX = "/images/products/v2"
+
+# 우리 ProductV2 데이터의 16개 제품 (생성 순서)
+OUR_PRODUCTS_SLUGS = [
+    "bookcase-white-doors",
+    "bookcase-grey-external-drawers",
+    "bookcase-brown",
+    "bookcase-grey-doors-storage",
+    "bookcase-moss-green",
+    "bookcase-black",
+    "bookcase-white-large",
+    "bookcase-light-wood",
+    "bookcase-burgundy-doors-drawers",
+    "bookcase-grey-compact",
+    "bookcase-light-wood-drawers",
+    "bookcase-green-xl",
+    "bookcase-white-external-drawers",
+    "bookcase-moss-green-doors",
+    "bookcase-premium-black",
+    "bookcase-beige-drawers-backpanels"
+]
+
+# 프런트엔드 색상 변형 이름 (color-swatches.json 에 없는 제품은 섬네일을 이 순서로 배정)
+SWATCH_COLORS = ["White", "Grey", "Brown", "Black", "Green", "Blue", "Red", "Beige"]
+
+HEADER = """// 🤖 자동 생성 파일 - 직접 수정하지 마세요
+// 생성: python scripts/generate_products_data.py
+// 원본: extracted-mappings.json + color-swatches.json + public/images/products/v2
+
+export interface GeneratedImageSize {
+  width: number;
+  height: number;
+}
+
+export interface GeneratedProductImages {
+  sourceName: string;
+  mainImage: string;
+  hoverImage: string;
+  colorThumbnails: string[];
+  colorSwatches: Record<string, string>;
+  mainImageSize?: GeneratedImageSize;
+  hoverImageSize?: GeneratedImageSize;
+}
+"""
+
+
+def load_mapping_data(mapping_json=MAPPING_JSON):
+    """JSON에서 매핑 데이터 로드"""
+    with open(mapping_json, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_swatches(swatch_json=SWATCH_JSON):
+    """색상 스와치 배정 {슬러그: {색상 이름: 섬네일 파일}} 로드 (없으면 빈 사전)"""
+    try:
+        with open(swatch_json, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def positional_swatches(thumbnails):
+    """배정이 없는 제품: 섬네일을 SWATCH_COLORS 순서로 (모자라면 첫 섬네일)"""
+    if not thumbnails:
+        return {}
+    return {name: thumbnails[i] if i < len(thumbnails) else thumbnails[0]
+            for i, name in enumerate(SWATCH_COLORS)}
+
+
+def fallback_entry(slug):
+    """매칭되지 않은 제품: 예전 제품별 폴더 규칙의 경로"""
+    return {
+        'sourceName': '',
+        'mainImage': f"{IMAGE_URL_PREFIX}/main/{slug}-main.jpg",
+        'hoverImage': f"{IMAGE_URL_PREFIX}/hover/{slug}-hover.webp",
+        'colorThumbnails': [],
+        'colorSwatches': {},
+    }
+
+
+def build_entries(mappings, sizes=None, image_root=IMAGE_ROOT, swatches=None):
+    """제품별 이미지 데이터 → ({슬러그: 항목}, 경고 목록)
+
+    sizes 는 {'/images/...': (너비, 높이, 형식)} (image_probe.dimensions_by_url)
+    swatches 는 {슬러그: {색상 이름: 섬네일 파일}} (load_swatches)
+    """
+    sizes = sizes or {}
+    swatches = swatches or {}
+    matches = match_products(OUR_PRODUCTS_SLUGS, [mapping['name'] for mapping in mappings])
+    entries = {}
+    warnings = []
+
+    for slug in OUR_PRODUCTS_SLUGS:
+        index, score = matches[slug]
+        if index is None:
+            warnings.append(f"{slug}: 매칭 실패 (점수: {score}) - 기본 경로 사용")
+            entries[slug] = fallback_entry(slug)
+            entries[slug]['colorSwatches'] = dict(swatches.get(slug, {}))
+            continue
+        best_match = mappings[index]
+
+        entry = {
+            'sourceName': best_match['name'],
+            'mainImage': f"{IMAGE_URL_PREFIX}/main/{best_match['main_image']}",
+            'hoverImage': f"{IMAGE_URL_PREFIX}/hover/{best_match['hover_image']}",
+            'colorThumbnails': list(best_match['color_thumbnails']),
+            'colorSwatches': dict(swatches.get(slug) or positional_swatches(best_match['color_thumbnails'])),
+        }
+        for key in ('mainImage', 'hoverImage'):
+            size = sizes.get(entry[key])
+            if size:
+                entry[f"{key}Size"] = {'width': size[0], 'height': size[1]}
+
+        # 정리된 트리에 실제로 있는지 확인
+        files = [(entry['mainImage'], Path(image_root) / "main" / best_match['main_image']),
+                 (entry['hoverImage'], Path(image_root) / "hover" / best_match['hover_image'])]
+        thumbnails = dict.fromkeys([*entry['colorThumbnails'], *entry['colorSwatches'].values()])
+        files += [(name, Path(image_root) / "colors" / name) for name in thumbnails]
+        for url, path in files:
+            if not path.exists():
+                warnings.append(f"{slug}: 이미지 없음 {url}")
+
+        entries[slug] = entry
+
+    return entries, warnings
+
+
+def quote(value):
+    """문자열 → 작은따옴표 TypeScript 문자열 리터럴"""
+    escaped = value.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n')
+    return f"'{escaped}'"
+
+
+def ts_key(key):
+    """객체 키 → 식별자면 그대로, 아니면 문자열 리터럴 ("Moss Green" 등)"""
+    return key if key.replace('_', 'a').isalnum() and not key[0].isdigit() else quote(key)
+
+
+def to_ts(value, indent=0):
+    """파이썬 값 → TypeScript 리터럴 (작은따옴표, 식별자 키는 따옴표 없이)"""
+    pad = '  ' * indent
+    if isinstance(value, dict):
+        if not value:
+            return '{}'
+        if all(isinstance(item, (int, float)) for item in value.values()):
+            # 크기처럼 짧은 객체는 한 줄로
+            return "{ " + ", ".join(f"{ts_key(key)}: {to_ts(item)}" for key, item in value.items()) + " }"
+        lines = [f"{pad}  {ts_key(key)}: {to_ts(item, indent + 1)}" for key, item in value.items()]
+        return "{\n" + ",\n".join(lines) + f"\n{pad}}}"
+    if isinstance(value, list):
+        if all(isinstance(item, str) for item in value):
+            return "[" + ", ".join(quote(item) for item in value) + "]"
+        return "[\n" + ",\n".join(f"{pad}  {to_ts(item, indent + 1)}" for item in value) + f"\n{pad}]"
+    if isinstance(value, str):
+        return quote(value)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return json.dumps(value)
+
+
+def render_module(entries):
+    """생성 파일 전체 원문"""
+    return (HEADER + "\n"
+            + "export const productImageMappings: Record<string, GeneratedProductImages> = "
+            + to_ts(entries) + ";\n")
+
+
+def write_if_changed(path, text):
+    """내용이 다를 때만 저장 → 저장 여부"""
+    path = Path(path)
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+    os.replace(tmp, path)
+    return True
+
+
+@timed("load_sizes")
+def load_sizes(db_file=DB_FILE):
+    """이미지 색인에서 크기 정보 (바뀐 파일만 다시 탐지)"""
+    with AssetIndex(db_file) as index:
+        probe_tree(index, [os.path.normpath(PUBLIC_IMAGES)])
+        return dimensions_by_url(index, PUBLIC_IMAGES)
+
+
+def generate(mapping_json=MAPPING_JSON, output_file=OUTPUT_FILE, with_sizes=True, check=False,
+             swatch_json=SWATCH_JSON):
+    """생성 실행 → (변경 여부, 경고 목록); check 이면 파일을 쓰지 않음"""
+    sizes = load_sizes() if with_sizes else {}
+    with stage("build_entries") as metrics:
+        entries, warnings = build_entries(load_mapping_data(mapping_json), sizes,
+                                          swatches=load_swatches(swatch_json))
+        text = render_module(entries)
+        metrics.add(files=len(entries), bytes=len(text.encode('utf-8')))
+
+    if check:
+        try:
+            current = Path(output_file).read_text(encoding='utf-8')
+        except OSError:
+            current = None
+        return current != text, warnings
+    return write_if_changed(output_file, text), warnings
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="extracted-mappings.json → ProductV2 이미지 데이터 모듈 생성")
+    parser.add_argument("--check", action="store_true", help="파일을 쓰지 않고 최신인지만 확인 (다르면 종료 코드 1)")
+    parser.add_argument("--no-sizes", action="store_true", help="이미지 크기 탐지 생략")
+    parser.add_argument("--mapping", default=MAPPING_JSON, help="매핑 JSON 경로")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="생성할 TS 파일 경로")
+    parser.add_argument("--swatches", default=SWATCH_JSON, help="색상 이름별 스와치 배정 JSON 경로")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    instrumentation.configure(args)
+
+    print("🏗️ ProductV2 이미지 데이터 생성")
+    print(f"📄 {args.mapping} → {args.output}")
+    changed, warnings = generate(args.mapping, args.output, not args.no_sizes, args.check, args.swatches)
+
+    for warning in warnings:
+        print(f"  ⚠️ {warning}")
+
+    if args.check:
+        if changed:
+            print("❌ 생성 파일이 최신이 아닙니다: python scripts/generate_products_data.py")
+            sys.exit(1)
+        print("✅ 생성 파일 최신")
+    else:
+        print("✅ 생성 파일 갱신" if changed else "✔️ 변경 없음 (파일을 쓰지 않음)")
+
+
+if __name__ == "__main__":
+    main()
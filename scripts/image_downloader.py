@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ProductV2 이미지 병렬 다운로더
+realImageMappings.ts / extracted-mappings.json 의 이미지들을
+공유 requests.Session 커넥션 풀로 동시에 내려받음 (호스트별 동시 요청 수 제한)
+ETag / Last-Modified 매니페스트로 바뀌지 않은 파일은 304 응답만 받고 건너뜀
+임시 파일 + Range 이어받기 + 검증 후 원자적 교체로 잘린 파일을 남기지 않음
+
+사용법: python scripts/image_downloader.py [--concurrency 16] [--per-host 8]
+"""
+
+import argparse
+import base64
+import binascii
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import instrumentation
+from instrumentation import detail, stage
+from retry_scheduler import RetryScheduler
+
+# 경로 설정 (저장소 루트에서 실행)
+TS_MAPPING_FILE = "src/data/realImageMappings.ts"
+MAPPING_JSON = "extracted-mappings.json"
+HTML_FILES = ["product-v2-example.txt"]
+TARGET_DIR = "public/images/products/v2"
+# public/ 아래에 두면 정적 파일로 서빙되므로 캐시 폴더에 보관
+MANIFEST_FILE = ".cache/image-download-manifest.json"
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 8
+CHUNK_SIZE = 64 * 1024
+TIMEOUT = 30
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Referer': 'https://tylko.com/',
+    'Accept': 'image/avif,image/webp,image/apng,image/*,*/*;q=0.8',
+}
+
+_URL_RE = re.compile(r'https?://[^\s\'"`<>()]+')
+
+# realImageMappings.ts 의 키 → 저장 폴더
+_TS_ROLE_RE = re.compile(r'(mainImage|hoverImage|[\w\'-]+)\s*:\s*\'(https?://[^\']+)\'')
+_TS_ROLE_FOLDERS = {'mainImage': 'main', 'hoverImage': 'hover'}
+
+
+def build_session(pool_size=DEFAULT_CONCURRENCY, headers=None):
+    """커넥션을 재사용하는 공유 세션 생성 (호스트당 pool_size 개의 keep-alive 연결)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(DEFAULT_HEADERS if headers is None else headers)
+    return session
+
+
+def url_filename(url):
+    """URL에서 파일명만 추출"""
+    return urlsplit(url).path.split('/')[-1]
+
+
+def build_url_index(text_files):
+    """텍스트(TS/HTML) 파일 안의 URL들로 파일명 → URL 색인 생성"""
+    index = {}
+    for text_file in text_files:
+        if not Path(text_file).exists():
+            continue
+        with open(text_file, 'r', encoding='utf-8') as f:
+            for url in _URL_RE.findall(f.read()):
+                index.setdefault(url_filename(url), url)
+    return index
+
+
+def jobs_from_ts(ts_file, target_dir=TARGET_DIR):
+    """realImageMappings.ts 의 이미지 URL → 다운로드 작업 목록"""
+    with open(ts_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    jobs = []
+    for key, url in _TS_ROLE_RE.findall(content):
+        folder = _TS_ROLE_FOLDERS.get(key, 'colors')
+        jobs.append({
+            'url': url,
+            'path': Path(target_dir) / folder / url_filename(url),
+            'type': folder,
+        })
+    return jobs
+
+
+def jobs_from_mappings(mapping_json, url_index, target_dir=TARGET_DIR):
+    """extracted-mappings.json 의 파일명 → 다운로드 작업 목록
+
+    JSON 에는 파일명만 저장되므로 url_index(파일명 → URL)로 원본 URL을 찾는다.
+    (작업 목록, URL을 찾지 못한 파일명 목록) 반환
+    """
+    with open(mapping_json, 'r', encoding='utf-8') as f:
+        mappings = json.load(f)
+
+    jobs = []
+    unresolved = []
+    for mapping in mappings:
+        entries = [('main', mapping.get('main_image')), ('hover', mapping.get('hover_image'))]
+        entries += [('colors', name) for name in mapping.get('color_thumbnails', [])]
+
+        for folder, name in entries:
+            if not name:
+                continue
+            url = name if _URL_RE.fullmatch(name) else url_index.get(name)
+            if url is None:
+                unresolved.append(name)
+                continue
+            jobs.append({
+                'url': url,
+                'path': Path(target_dir) / folder / url_filename(url),
+                'type': folder,
+            })
+    return jobs, unresolved
+
+
+def collect_jobs(ts_file=TS_MAPPING_FILE, mapping_json=MAPPING_JSON, html_files=HTML_FILES,
+                 target_dir=TARGET_DIR):
+    """TS 매핑 + 추출 JSON 에서 중복 없는 작업 목록 → (작업 목록, URL을 찾지 못한 파일명 목록)"""
+    jobs = []
+    unresolved = []
+    if Path(ts_file).exists():
+        jobs += jobs_from_ts(ts_file, target_dir)
+    if Path(mapping_json).exists():
+        url_index = build_url_index([ts_file] + list(html_files))
+        mapping_jobs, unresolved = jobs_from_mappings(mapping_json, url_index, target_dir)
+        jobs += mapping_jobs
+    return dedupe_jobs(jobs), unresolved
+
+
+def dedupe_jobs(jobs):
+    """같은 저장 경로의 작업 제거 (처음 것 유지)"""
+    seen = set()
+    unique = []
+    for job in jobs:
+        key = str(job['path'])
+        if key not in seen:
+            seen.add(key)
+            unique.append(job)
+    return unique
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 제한 (서버 부하 방지용 politeness limit)"""
+
+    def __init__(self, per_host=DEFAULT_PER_HOST):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def slot(self, url):
+        """url 의 호스트에 대한 세마포어 (with 문으로 사용)"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+
+class DownloadManifest:
+    """URL별 ETag / Last-Modified / 크기 / 내용 해시 기록 (조건부 재다운로드용)"""
+
+    def __init__(self, manifest_file):
+        self.manifest_file = Path(manifest_file)
+        self._lock = threading.Lock()
+        self._entries = {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def conditional_headers(self, url, filepath):
+        """로컬 파일이 기록과 같을 때만 If-None-Match / If-Modified-Since 헤더 반환"""
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry or entry.get('path') != str(filepath):
+            return {}
+        try:
+            if os.path.getsize(filepath) != entry.get('size'):
+                return {}
+        except OSError:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record(self, url, filepath, etag, last_modified, size, sha256):
+        """검증을 마치고 최종 경로에 놓인 파일 정보 기록"""
+        with self._lock:
+            self._entries[url] = {
+                'path': str(filepath),
+                'etag': etag,
+                'last_modified': last_modified,
+                'size': size,
+                'sha256': sha256,
+            }
+
+    def clear(self):
+        """기록 전체 삭제 (다음 요청은 모두 무조건 다운로드)"""
+        with self._lock:
+            self._entries = {}
+
+    def save(self):
+        """매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_file.with_name(self.manifest_file.name + '.tmp')
+        with self._lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_file)
+
+
+class IncompleteDownload(OSError):
+    """받은 파일의 길이나 해시가 서버가 알려준 값과 다름"""
+
+
+def _part_paths(filepath):
+    """다운로드 중 임시 파일과 이어받기 정보 파일 경로"""
+    filepath = Path(filepath)
+    return (filepath.with_name(filepath.name + '.part'),
+            filepath.with_name(filepath.name + '.part.json'))
+
+
+def _load_part_meta(meta_path, url):
+    """같은 URL의 이어받기 정보 (없거나 다른 URL이면 None)"""
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get('url') == url else None
+
+
+def _discard_part(part_path, meta_path):
+    """임시 파일 정리"""
+    for path in (part_path, meta_path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _expected_md5(response, partial=False):
+    """응답이 본문 MD5 라고 밝힌 값 (16진수), 아니면 None
+
+    32자리 16진수 ETag 를 쓰는 서버 중에는 MD5 가 아닌 곳이 많으므로 ETag 는
+    S3 / CloudFront 응답(x-amz-* 헤더, KMS 암호화가 아닐 때)일 때만 MD5 로 믿는다.
+    Content-MD5 는 보낸 본문 기준이라 전체 응답(partial=False)일 때만 사용.
+    """
+    headers = response.headers
+    if not partial and headers.get('Content-MD5'):
+        try:
+            return base64.b64decode(headers['Content-MD5'], validate=True).hex()
+        except (ValueError, binascii.Error):
+            return None
+
+    etag = headers.get('ETag')
+    if not etag or etag.startswith('W/'):
+        return None
+    if not any(key.lower().startswith('x-amz-') for key in headers):
+        return None
+    if headers.get('x-amz-server-side-encryption') == 'aws:kms':
+        return None
+    value = etag.strip('"').lower()
+    if len(value) == 32 and all(ch in '0123456789abcdef' for ch in value):
+        return value
+    return None
+
+
+def _hash_existing(part_path, offset):
+    """이미 받은 부분의 (sha256, md5) 해시 객체"""
+    sha256, md5 = hashlib.sha256(), hashlib.md5()
+    if offset:
+        with open(part_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                sha256.update(chunk)
+                md5.update(chunk)
+    return sha256, md5
+
+
+def _total_size(response, offset):
+    """응답에서 전체 파일 크기 (알 수 없으면 None)"""
+    content_range = response.headers.get('Content-Range', '')
+    if '/' in content_range:
+        total = content_range.rsplit('/', 1)[1]
+        return int(total) if total.isdigit() else None
+    length = response.headers.get('Content-Length')
+    return offset + int(length) if length and length.isdigit() else None
+
+
+def download_image(session, url, filepath, manifest=None, timeout=TIMEOUT, headers=None):
+    """공유 세션으로 이미지 하나 다운로드 → (상태, 이번에 받은 바이트 수)
+
+    본문은 임시 파일(.part)에 받고, 연결이 끊겨 남은 임시 파일이 있으면
+    HTTP Range(If-Range 검증자 포함)로 받은 바이트 이후부터 이어받는다.
+    길이와 (서버가 밝힌 경우) MD5 를 검증한 뒤에만 최종 경로로 원자적으로 교체하므로
+    잘린 파일이 최종 경로에 남지 않는다. 재시도는 RetryScheduler 가 담당하며,
+    재시도할 때마다 임시 파일 기준으로 이어받는다.
+
+    manifest 가 있으면 조건부 요청을 보내고, 304 응답이면 본문 없이 'not_modified' 를 돌려준다.
+    """
+    filepath = Path(filepath)
+    part_path, meta_path = _part_paths(filepath)
+
+    request_headers = dict(headers or {})
+    # Range 오프셋이 디스크의 바이트 수와 일치하도록 전송 압축 사용 안 함
+    request_headers['Accept-Encoding'] = 'identity'
+
+    meta = _load_part_meta(meta_path, url)
+    offset = part_path.stat().st_size if meta and part_path.exists() else 0
+    conditional = {}
+
+    if offset:
+        request_headers['Range'] = f'bytes={offset}-'
+        validator = meta.get('etag') or meta.get('last_modified')
+        if validator:
+            request_headers['If-Range'] = validator
+    else:
+        _discard_part(part_path, meta_path)
+        conditional = manifest.conditional_headers(url, filepath) if manifest else {}
+        request_headers.update(conditional)
+
+    with session.get(url, stream=True, timeout=timeout, headers=request_headers) as response:
+        if response.status_code == 304:
+            if conditional:
+                return 'not_modified', 0
+            # 조건부 헤더 없이 받은 304 는 빈 본문을 내려받은 것으로 취급하면 안 됨
+            raise requests.exceptions.HTTPError(f"조건부 요청이 아닌데 304 응답: {url}", response=response)
+
+        if response.status_code == 416 and offset and meta.get('total') == offset:
+            # 이전 실행에서 본문은 다 받았지만 교체 전에 중단됨
+            status = 'resumed'
+            sha256, md5 = _hash_existing(part_path, offset)
+        else:
+            if response.status_code == 416:
+                _discard_part(part_path, meta_path)
+            response.raise_for_status()
+
+            if response.status_code != 206:
+                # 서버가 Range 를 무시했거나 파일이 바뀜 → 처음부터
+                offset = 0
+            status = 'resumed' if offset else 'downloaded'
+
+            total = _total_size(response, offset)
+            expected_md5 = _expected_md5(response, partial=bool(offset))
+            if offset and expected_md5 is None:
+                # If-Range 로 같은 파일임이 보장되므로 처음 응답에서 얻은 MD5 유지
+                expected_md5 = meta.get('md5')
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'url': url,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'total': total,
+                    'md5': expected_md5,
+                }, f)
+
+            sha256, md5 = _hash_existing(part_path, offset)
+            with open(part_path, 'ab' if offset else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        sha256.update(chunk)
+                        md5.update(chunk)
+
+        received = part_path.stat().st_size - offset
+        meta = _load_part_meta(meta_path, url) or {}
+        size = part_path.stat().st_size
+
+        if meta.get('total') is not None and size != meta['total']:
+            if size > meta['total']:
+                _discard_part(part_path, meta_path)
+            # 짧으면 임시 파일을 남겨 다음 실행에서 이어받음
+            raise IncompleteDownload(f"길이 불일치: {size:,} / {meta['total']:,} bytes ({url})")
+
+        # 서버가 MD5 를 밝히지 않았으면 길이만 검증
+        if meta.get('md5') and md5.hexdigest() != meta['md5']:
+            _discard_part(part_path, meta_path)
+            raise IncompleteDownload(f"해시 불일치 (MD5): {url}")
+
+        os.replace(part_path, filepath)
+        _discard_part(part_path, meta_path)
+
+        if manifest:
+            manifest.record(url, filepath, meta.get('etag'), meta.get('last_modified'),
+                            size, sha256.hexdigest())
+    return status, received
+
+
+def download_all(jobs, concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST,
+                 session=None, manifest=None, scheduler=None, verbose=True):
+    """작업 목록을 스레드 풀에서 동시에 다운로드 → 작업별 결과 목록 (입력 순서)
+
+    일시적 오류(5xx, 429, 연결 끊김)는 scheduler 가 백오프 후 재시도한다.
+    """
+    session = session or build_session(pool_size=max(concurrency, per_host))
+    scheduler = scheduler or RetryScheduler()
+    limiter = HostLimiter(per_host)
+
+    def run(job):
+        started = time.perf_counter()
+        try:
+            with limiter.slot(job['url']):
+                status, received = scheduler.call(
+                    job['url'],
+                    lambda: download_image(session, job['url'], job['path'], manifest),
+                )
+            return {**job, 'ok': True, 'status': status, 'bytes': received, 'error': None,
+                    'seconds': time.perf_counter() - started}
+        except (requests.exceptions.RequestException, OSError) as e:
+            return {**job, 'ok': False, 'status': 'failed', 'bytes': 0, 'error': str(e),
+                    'seconds': time.perf_counter() - started}
+
+    results = [None] * len(jobs)
+    with stage("download_all") as metrics, ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(run, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if verbose:
+                if result['status'] == 'not_modified':
+                    detail(f"  ♻️ {result['path']} (변경 없음)")
+                elif result['ok']:
+                    detail(f"  ✅ {result['path']} ({result['bytes']:,} bytes)")
+                else:
+                    print(f"  ❌ {result['url']}: {result['error']}")
+        not_modified = sum(1 for r in results if r['status'] == 'not_modified')
+        metrics.add(files=len(jobs), bytes=sum(r['bytes'] for r in results),
+                    failed=sum(1 for r in results if not r['ok']))
+        metrics.cache(hits=not_modified, misses=len(jobs) - not_modified)
+    return results
+
+
+def summarize(results, elapsed):
+    """다운로드 결과 요약 출력"""
+    ok = [r for r in results if r['ok']]
+    not_modified = sum(1 for r in ok if r['status'] == 'not_modified')
+    total_bytes = sum(r['bytes'] for r in ok)
+
+    print("\n📊 다운로드 완료!")
+    print(f"✅ 성공: {len(ok)}/{len(results)} (변경 없음 {not_modified}개)")
+    print(f"❌ 실패: {len(results) - len(ok)}")
+    print(f"📦 받은 용량: {total_bytes:,} bytes")
+    if elapsed > 0:
+        print(f"⏱️ 소요 시간: {elapsed:.2f}s ({len(results) / elapsed:.1f} files/s, "
+              f"{total_bytes / elapsed / 1024:.0f} KB/s)")
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="ProductV2 이미지 병렬 다운로드")
+    parser.add_argument("--ts", default=TS_MAPPING_FILE, help="realImageMappings.ts 경로")
+    parser.add_argument("--mappings", default=MAPPING_JSON, help="extracted-mappings.json 경로")
+    parser.add_argument("--html", nargs="*", default=HTML_FILES,
+                        help="파일명 → URL 색인에 쓸 저장된 HTML 페이지들")
+    parser.add_argument("--target", default=TARGET_DIR, help="저장 폴더")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="동시 다운로드 수")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST,
+                        help="호스트별 최대 동시 요청 수")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="호스트별 초당 최대 요청 수 (스로틀링 시 자동으로 낮아짐)")
+    parser.add_argument("--manifest", default=MANIFEST_FILE,
+                        help="ETag / Last-Modified 매니페스트 경로")
+    parser.add_argument("--force", action="store_true",
+                        help="매니페스트를 무시하고 모든 파일을 새로 받음")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    instrumentation.configure(args)
+
+    print("🚀 ProductV2 이미지 병렬 다운로드")
+    print(f"⚙️ 동시 다운로드: {args.concurrency}, 호스트별 제한: {args.per_host}")
+    print()
+
+    jobs, unresolved = collect_jobs(args.ts, args.mappings, args.html, args.target)
+    if unresolved:
+        print(f"⚠️ URL을 찾지 못한 파일: {len(unresolved)}개 (--html 로 원본 페이지 지정)")
+    if not jobs:
+        print("❌ 다운로드할 이미지가 없습니다.")
+        return
+
+    print(f"📥 다운로드 대상: {len(jobs)}개")
+    manifest = DownloadManifest(args.manifest)
+    if args.force:
+        manifest.clear()
+
+    started = time.perf_counter()
+    scheduler = RetryScheduler(rate=args.rate) if args.rate else RetryScheduler()
+    results = download_all(jobs, args.concurrency, args.per_host,
+                           manifest=manifest, scheduler=scheduler)
+    summarize(results, time.perf_counter() - started)
+
+    manifest.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이미지 크기 / 형식 탐지 (헤더만 읽음, 디코딩 없음)
+- PNG  : IHDR
+- GIF  : 논리 화면 크기
+- WebP : RIFF 의 VP8 / VP8L / VP8X 청크
+- JPEG : SOFn 세그먼트 (앞쪽 세그먼트는 길이만 읽고 건너뜀)
+- AVIF : ISOBMFF meta → iprp → ipco → ispe 박스
+
+public/images 전체를 병렬로 탐지하고, 결과는 이미지 색인(asset_index) 에 저장하여
+바뀌지 않은 파일은 다음 실행에서 다시 읽지 않음
+
+사용법: python scripts/image_probe.py [폴더 ...] [--db .cache/asset-index.sqlite]
+"""
+
+import argparse
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asset_index import AssetIndex
+import instrumentation
+from instrumentation import stage
+
+# 경로 설정 (저장소 루트에서 실행)
+PUBLIC_IMAGES = "public/images"
+DB_FILE = ".cache/asset-index.sqlite"
+
+HEADER_SIZE = 512
+PROBE_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# SOF 마커 중 크기 정보가 없는 것 (DHT, JPG, DAC)
+_JPEG_NON_SOF = {0xC4, 0xC8, 0xCC}
+# ISOBMFF 에서 자식 박스를 가진 컨테이너 (meta 는 version/flags 4바이트 뒤에 자식)
+_AVIF_CONTAINERS = {b'meta': 4, b'iprp': 0, b'ipco': 0}
+_AVIF_BRANDS = (b'avif', b'avis')
+
+
+def _probe_png(header):
+    if len(header) >= 24 and header[12:16] == b'IHDR':
+        width, height = struct.unpack('>II', header[16:24])
+        return width, height, 'png'
+    return None
+
+
+def _probe_gif(header):
+    if len(header) >= 10:
+        width, height = struct.unpack('<HH', header[6:10])
+        return width, height, 'gif'
+    return None
+
+
+def _probe_webp(header):
+    if len(header) < 30:
+        return None
+    chunk = header[12:16]
+    if chunk == b'VP8 ' and header[23:26] == b'\x9d\x01\x2a':
+        width, height = struct.unpack('<HH', header[26:30])
+        return width & 0x3FFF, height & 0x3FFF, 'webp'
+    if chunk == b'VP8L' and header[20] == 0x2F:
+        bits = struct.unpack('<I', header[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, 'webp'
+    if chunk == b'VP8X':
+        width = int.from_bytes(header[24:27], 'little') + 1
+        height = int.from_bytes(header[27:30], 'little') + 1
+        return width, height, 'webp'
+    return None
+
+
+def _probe_jpeg(f):
+    """마커를 따라가며 SOFn 을 찾음 (세그먼트 본문은 seek 로 건너뜀)"""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b'\xff':
+            byte = f.read(1)
+        while byte == b'\xff':
+            byte = f.read(1)
+        if not byte:
+            return None
+
+        marker = byte[0]
+        if marker == 0xD9 or marker == 0xDA:   # EOI / SOS: 더 이상 헤더 없음
+            return None
+        if 0xD0 <= marker <= 0xD7 or marker == 0x01:   # 길이 없는 마커
+            continue
+
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+
+        if 0xC0 <= marker <= 0xCF and marker not in _JPEG_NON_SOF:
+            payload = f.read(5)
+            if len(payload) < 5:
+                return None
+            height, width = struct.unpack('>HH', payload[1:5])
+            return width, height, 'jpeg'
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _iter_boxes(f, start, end):
+    """ISOBMFF 박스 (종류, 본문 시작, 본문 끝) 나열"""
+    offset = start
+    while end is None or offset + 8 <= end:
+        f.seek(offset)
+        head = f.read(8)
+        if len(head) < 8:
+            return
+        size, box_type = struct.unpack('>I4s', head)
+        body = offset + 8
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+            body += 8
+        elif size == 0:
+            size = (end if end is not None else os.fstat(f.fileno()).st_size) - offset
+        if size < body - offset:
+            return
+        yield box_type, body, offset + size
+        offset += size
+
+
+def _find_ispe(f, start, end, depth=0):
+    """meta / iprp / ipco 를 따라 내려가며 가장 큰 ispe (너비, 높이)"""
+    best = None
+    for box_type, body, box_end in _iter_boxes(f, start, end):
+        if box_type == b'ispe':
+            f.seek(body + 4)
+            data = f.read(8)
+            if len(data) == 8:
+                size = struct.unpack('>II', data)
+                if best is None or size[0] * size[1] > best[0] * best[1]:
+                    best = size
+        elif box_type in _AVIF_CONTAINERS and depth < 4:
+            found = _find_ispe(f, body + _AVIF_CONTAINERS[box_type], box_end, depth + 1)
+            if found and (best is None or found[0] * found[1] > best[0] * best[1]):
+                best = found
+        if depth == 0 and box_type == b'mdat':
+            break
+    return best
+
+
+def _probe_avif(f, header):
+    if header[8:12] not in _AVIF_BRANDS and not any(
+            header[i:i + 4] in _AVIF_BRANDS for i in range(16, min(len(header), 64), 4)):
+        return None
+    size = _find_ispe(f, 0, None)
+    if size is None:
+        return None
+    return size[0], size[1], 'avif'
+
+
+def probe_file(path):
+    """이미지 파일 → (너비, 높이, 형식), 알 수 없으면 None"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+            if header.startswith(b'\x89PNG\r\n\x1a\n'):
+                return _probe_png(header)
+            if header[:6] in (b'GIF87a', b'GIF89a'):
+                return _probe_gif(header)
+            if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+                return _probe_webp(header)
+            if header[:2] == b'\xff\xd8':
+                return _probe_jpeg(f)
+            if header[4:8] == b'ftyp':
+                return _probe_avif(f, header)
+    except (OSError, struct.error):
+        return None
+    return None
+
+
+def probe_tree(index, roots, workers=PROBE_WORKERS):
+    """폴더들을 색인에 반영하고 크기를 모르는 이미지만 병렬 탐지 → (탐지 수, 실패 경로 목록)"""
+    pending = []
+    known = 0
+    for root in roots:
+        index.refresh(root)
+        for row in index.query(root=root):
+            if row['width'] is None:
+                pending.append(row['path'])
+            else:
+                known += 1
+
+    if not pending:
+        return 0, []
+
+    with stage("probe_tree") as metrics:
+        with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            probed = list(executor.map(probe_file, pending))
+        metrics.add(files=len(pending)).cache(hits=known, misses=len(pending))
+
+    found = [(path, *result) for path, result in zip(pending, probed) if result]
+    failed = [path for path, result in zip(pending, probed) if not result]
+    index.set_dimensions(found)
+    return len(found), failed
+
+
+def dimensions_by_url(index, public_dir=PUBLIC_IMAGES):
+    """색인의 크기 정보 → {'/images/...': (너비, 높이, 형식)} (코드 생성용)"""
+    public_root = os.path.dirname(os.path.normpath(public_dir))
+    result = {}
+    for row in index.query(root=os.path.normpath(public_dir)):
+        if row['width'] is not None:
+            url = '/' + os.path.relpath(row['path'], public_root).replace(os.sep, '/')
+            result[url] = (row['width'], row['height'], row['format'])
+    return result
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="이미지 크기 / 형식 헤더 탐지")
+    parser.add_argument("roots", nargs="*", default=[PUBLIC_IMAGES], help="탐지할 폴더")
+    parser.add_argument("--db", default=DB_FILE, help="이미지 색인 DB 경로")
+    parser.add_argument("--workers", type=int, default=PROBE_WORKERS, help="동시 탐지 스레드 수")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    instrumentation.configure(args)
+    roots = [os.path.normpath(root) for root in args.roots]
+
+    print("📐 이미지 크기 탐지 시작 (헤더만 읽음)")
+    started = time.perf_counter()
+    with AssetIndex(args.db) as index:
+        probed, failed = probe_tree(index, roots, args.workers)
+        total = sum(len(index.query(root=root)) for root in roots)
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ 새로 탐지: {probed}개 / 전체 {total}개 (나머지는 캐시 사용)")
+    if failed:
+        print(f"❌ 형식을 알 수 없음: {len(failed)}개")
+        for path in failed[:10]:
+            print(f"  - {path}")
+    print(f"⏱️ 소요 시간: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+내용 주소 기반(SHA-256) 이미지 저장소
+같은 이미지는 저장소에 한 번만 보관하고, 제품 폴더에는 reflink / 하드링크로 배치
+(지원하지 않는 파일시스템이면 복사로 대체)
+
+    store = ImageStore(STORE_DIR)
+    store.place(source_file, target_file)   # shutil.copy2 대신 사용
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux FICLONE ioctl (btrfs / xfs / bcachefs 의 copy-on-write 복제)
+FICLONE = 0x40049409
+HASH_CHUNK = 1024 * 1024
+
+LINK_MODES = ('auto', 'reflink', 'hardlink', 'copy')
+
+
+def file_sha256(path):
+    """파일 내용의 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src, dst):
+    """copy-on-write 복제 (지원하지 않으면 OSError)"""
+    if fcntl is None:
+        raise OSError("reflink 미지원 플랫폼")
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.remove(dst)
+            raise
+
+
+class ImageStore:
+    """SHA-256 으로 주소가 정해지는 blob 저장소 (objects/ab/cdef...)"""
+
+    def __init__(self, root, link_mode='auto'):
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"알 수 없는 link_mode: {link_mode}")
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.link_mode = link_mode
+        self._lock = threading.Lock()
+        # (경로, 크기, mtime) → 해시 : 같은 원본을 여러 번 배치할 때 재해시 방지
+        self._digests = {}
+        self.stats = {'reflink': 0, 'hardlink': 0, 'copy': 0, 'skipped': 0,
+                      'blobs_added': 0, 'bytes_deduped': 0}
+
+    def _count(self, key, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def blob_path(self, digest):
+        """해시에 해당하는 blob 경로"""
+        return self.objects / digest[:2] / digest[2:]
+
+    def digest_of(self, path):
+        """파일 해시 (같은 실행 안에서는 크기/mtime 이 같으면 재계산하지 않음)"""
+        st = os.stat(path)
+        key = (str(path), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            digest = self._digests.get(key)
+        if digest is None:
+            digest = file_sha256(path)
+            with self._lock:
+                self._digests[key] = digest
+        return digest
+
+    def put(self, src):
+        """원본 파일을 저장소에 넣고 해시 반환 (이미 있으면 그대로)
+
+        원본이 나중에 수정되어도 blob 이 바뀌지 않도록 저장소에는 독립된 사본(reflink 또는 복사)을 둔다.
+        """
+        digest = self.digest_of(src)
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return digest
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f"{blob.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            _reflink(src, tmp)
+            # mtime 을 원본과 맞춰 두어야 다음 동기화에서 해시 없이 같은 파일로 판단
+            shutil.copystat(src, tmp)
+        except OSError:
+            shutil.copy2(src, tmp)
+        os.replace(tmp, blob)
+        self._count('blobs_added')
+        return digest
+
+    def materialize(self, digest, dest):
+        """blob 을 dest 에 배치 → 사용한 방식 ('reflink' / 'hardlink' / 'copy' / 'skipped')
+
+        임시 이름으로 만든 뒤 os.replace 하므로, 기존 dest 가 하드링크여도 blob 을 덮어쓰지 않는다.
+        """
+        blob = self.blob_path(digest)
+        dest = Path(dest)
+
+        try:
+            dest_stat = dest.stat()
+            blob_stat = blob.stat()
+            if (dest_stat.st_ino, dest_stat.st_dev) == (blob_stat.st_ino, blob_stat.st_dev):
+                self._count('skipped')
+                return 'skipped'
+        except FileNotFoundError:
+            pass
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        modes = ('reflink', 'hardlink', 'copy') if self.link_mode == 'auto' else (self.link_mode,)
+
+        for mode in modes:
+            try:
+                if mode == 'reflink':
+                    _reflink(blob, tmp)
+                elif mode == 'hardlink':
+                    os.link(blob, tmp)
+                else:
+                    shutil.copy2(blob, tmp)
+            except OSError:
+                if mode == modes[-1]:
+                    raise
+                continue
+            os.replace(tmp, dest)
+            self._count(mode)
+            if mode != 'copy':
+                self._count('bytes_deduped', blob.stat().st_size)
+            return mode
+
+    def place(self, src, dest):
+        """shutil.copy2(src, dest) 대체: 저장소에 넣고 dest 에 링크로 배치 → 사용한 방식"""
+        return self.materialize(self.put(src), dest)
+
+    def report(self):
+        """배치 통계 출력"""
+        s = self.stats
+        print(f"🗄️ 이미지 저장소: {self.root}")
+        print(f"  새 blob: {s['blobs_added']}개")
+        print(f"  reflink {s['reflink']}개, 하드링크 {s['hardlink']}개, 복사 {s['copy']}개, "
+              f"그대로 {s['skipped']}개")
+        print(f"  절약한 용량: {s['bytes_deduped']:,} bytes")
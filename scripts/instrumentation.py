@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자산 스크립트 공용 계측
+단계(with stage(...)) / 함수(@timed) 단위로 벽시계 시간, CPU 시간, 처리한 파일 수 / 바이트,
+캐시 적중률, 최대 메모리(tracemalloc) 를 기록하여 JSON lines 파일에 한 줄씩 추가
+
+- --metrics [파일]: 기록 켜기 (기본 .cache/metrics.jsonl), 끝날 때 단계별 요약 출력
+  tracemalloc 은 이때만 켬 (할당마다 추적하므로 실행이 느려짐)
+- --profile: 스크립트 전체를 cProfile 로 실행하여 .cache/profiles/<스크립트>-<시각>.prof 저장
+  (snakeviz / flameprof 로 플레임 그래프 보기), 누적 시간 상위 함수 출력
+- --quiet: detail() 로 찍는 파일 / 제품 단위 출력 생략 (요약만)
+- 환경 변수 ASSET_METRICS / ASSET_PROFILE / ASSET_QUIET 로도 켬 (pipeline.py 가 하위 스크립트에 전달)
+
+사용 예:
+    args = parse_args()          # instrumentation.add_arguments(parser) 를 추가한 파서
+    instrumentation.configure(args)
+    with stage("copy") as metrics:
+        ...
+        metrics.add(files=len(done), bytes=total)
+        metrics.cache(hits=unchanged, misses=changed)
+"""
+
+import atexit
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+METRICS_FILE = ".cache/metrics.jsonl"
+PROFILE_DIR = ".cache/profiles"
+PROFILE_TOP = 25
+
+_config = {"metrics": None, "quiet": False, "profile": False, "script": None}
+_records = []
+_lock = threading.Lock()
+_local = threading.local()
+_profiler = None
+
+
+def add_arguments(parser):
+    """계측 옵션 추가 (--quiet, --metrics, --profile)"""
+    group = parser.add_argument_group("계측")
+    group.add_argument("--quiet", action="store_true", help="파일 / 제품 단위 출력 생략")
+    group.add_argument("--metrics", nargs="?", const=METRICS_FILE, default=None,
+                       help=f"단계별 계측을 JSON lines 로 기록 (기본 {METRICS_FILE})")
+    group.add_argument("--profile", action="store_true", help="cProfile 결과를 .prof 로 저장")
+    return parser
+
+
+def configure(args=None, script=None):
+    """명령행 인자 / 환경 변수로 계측 설정 (스크립트 시작 시 한 번)"""
+    global _profiler
+    _config["script"] = script or Path(sys.argv[0]).stem
+    _config["quiet"] = bool(getattr(args, "quiet", False) or os.environ.get("ASSET_QUIET"))
+    _config["metrics"] = getattr(args, "metrics", None) or os.environ.get("ASSET_METRICS") or None
+    _config["profile"] = bool(getattr(args, "profile", False) or os.environ.get("ASSET_PROFILE"))
+
+    if _config["metrics"] and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if _config["profile"] and _profiler is None:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    if _config["metrics"] or _config["profile"]:
+        atexit.register(_finish, time.perf_counter(), time.process_time())
+
+
+def child_env(env=None):
+    """하위 스크립트에 같은 계측 설정을 넘길 환경 변수 (pipeline.py 용)"""
+    env = dict(os.environ if env is None else env)
+    if _config["quiet"]:
+        env["ASSET_QUIET"] = "1"
+    if _config["metrics"]:
+        env["ASSET_METRICS"] = os.path.abspath(_config["metrics"])
+    if _config["profile"]:
+        env["ASSET_PROFILE"] = "1"
+    return env
+
+
+def quiet():
+    return _config["quiet"]
+
+
+def detail(message):
+    """파일 / 제품 단위의 자세한 출력 (--quiet 이면 생략)"""
+    if not _config["quiet"]:
+        print(message)
+
+
+class StageMetrics:
+    """단계 하나의 측정값 (with stage(...) as metrics 로 받아 처리량 / 캐시 횟수를 더함)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.counters = {"files": 0, "bytes": 0}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.child_peak = 0
+
+    def add(self, **counters):
+        for key, value in counters.items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        return self
+
+    def cache(self, hits=0, misses=0):
+        self.cache_hits += hits
+        self.cache_misses += misses
+        return self
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+@contextmanager
+def stage(name):
+    """단계 계측 (중첩 가능, 바깥 단계의 최대 메모리에는 안쪽 단계 것도 포함)"""
+    metrics = StageMetrics(name)
+    stack = _stack()
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        # reset_peak 는 전역이므로 지금까지의 최대값을 바깥 단계에 넘겨 둠
+        if stack:
+            stack[-1].child_peak = max(stack[-1].child_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+    stack.append(metrics)
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield metrics
+    finally:
+        wall = time.perf_counter() - wall
+        # process_time 은 프로세스 전체 (스레드 풀의 CPU 시간 포함)
+        cpu = time.process_time() - cpu
+        stack.pop()
+        peak = max(tracemalloc.get_traced_memory()[1], metrics.child_peak) if tracing else None
+        if tracing and stack:
+            stack[-1].child_peak = max(stack[-1].child_peak, peak)
+        _record(metrics, wall, cpu, peak)
+
+
+def timed(name=None):
+    """함수 단위 계측 데코레이터 (@timed() / @timed("이름"))"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _record(metrics, wall, cpu, peak):
+    record = {
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "script": _config["script"] or Path(sys.argv[0]).stem,
+        "stage": metrics.name,
+        "wall_s": round(wall, 6),
+        "cpu_s": round(cpu, 6),
+        **metrics.counters,
+    }
+    if wall > 0 and metrics.counters["files"]:
+        record["files_per_s"] = round(metrics.counters["files"] / wall, 1)
+    if wall > 0 and metrics.counters["bytes"]:
+        record["mb_per_s"] = round(metrics.counters["bytes"] / wall / 1e6, 2)
+    lookups = metrics.cache_hits + metrics.cache_misses
+    if lookups:
+        record.update(cache_hits=metrics.cache_hits, cache_misses=metrics.cache_misses,
+                      cache_hit_rate=round(metrics.cache_hits / lookups, 3))
+    if peak is not None:
+        record["peak_mem_bytes"] = peak
+
+    with _lock:
+        _records.append(record)
+        path = _config["metrics"]
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def records():
+    """이번 실행에서 기록된 단계 목록 (기록 순서)"""
+    with _lock:
+        return list(_records)
+
+
+def _finish(wall, cpu):
+    """종료 시: 전체 실행 기록, 프로파일 저장, 단계별 요약 출력"""
+    total = StageMetrics("total")
+    peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+    if peak is not None:
+        peak = max([peak, *(r.get("peak_mem_bytes", 0) for r in records())])
+    _record(total, time.perf_counter() - wall, time.process_time() - cpu, peak)
+
+    if _profiler is not None:
+        _profiler.disable()
+        directory = Path(PROFILE_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = directory / f"{_config['script']}-{stamp}.prof"
+        _profiler.dump_stats(str(path))
+        out = io.StringIO()
+        pstats.Stats(_profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        print(f"\n🔬 프로파일: {path} (snakeviz / flameprof 로 열기)")
+        print(out.getvalue())
+
+    print("\n📈 단계별 계측" + (f" → {_config['metrics']}" if _config["metrics"] else ""))
+    for record in records():
+        line = f"  ⏱️ {record['stage']:<28} {record['wall_s']:8.3f}s  CPU {record['cpu_s']:8.3f}s"
+        if record.get("files"):
+            line += f"  파일 {record['files']:,}"
+        if record.get("bytes"):
+            line += f"  {record['bytes'] / 1e6:,.1f} MB"
+        if "cache_hit_rate" in record:
+            line += f"  캐시 {record['cache_hit_rate']:.0%}"
+        if "peak_mem_bytes" in record:
+            line += f"  최대 메모리 {record['peak_mem_bytes'] / 1e6:,.1f} MB"
+        print(line)
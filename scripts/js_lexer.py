@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JavaScript / TypeScript 구문 짝 검사 렉서
+원문을 앞에서부터 한 번만 읽는 상태 기계 (모드 스택: 코드 / 템플릿 문자열 / JSX 태그 / JSX 자식)
+
+- 문자열, 템플릿 문자열(중첩 ${ } 포함), 주석, 정규식 리터럴 안의 괄호 / 백틱은 무시
+- 짝이 맞지 않는 괄호, 닫히지 않은 문자열 / 템플릿 / 주석 / 정규식 / JSX 요소를 줄:열 과 함께 보고
+- .tsx / .jsx 는 JSX 안의 텍스트(Don't 같은 작은따옴표)를 문자열로 오인하지 않음
+- .html 은 <script> 블록만 검사 (위치는 HTML 파일 기준)
+
+사용법: python scripts/js_lexer.py 파일 ...   (트리 전체 검사는 check_syntax.py)
+"""
+
+import re
+import sys
+from typing import NamedTuple
+
+MAX_ISSUES = 20
+
+_CODE = re.compile(
+    r"""(?P<space>\s+)"""
+    r"""|(?P<comment>//[^\n]*)"""
+    r"""|(?P<block>/\*)"""
+    r"""|(?P<quote>['"])"""
+    r"""|(?P<template>`)"""
+    r"""|(?P<word>[\w$]+)"""
+    r"""|(?P<open>[(\[{])"""
+    r"""|(?P<close>[)\]}])"""
+    r"""|(?P<slash>/=?)"""
+    r"""|(?P<lt><)"""
+    r"""|(?P<punct>=>|\?\.|\+\+|--|[^\s\w'"`/()\[\]{}<])""")
+_STRING = {"'": re.compile(r"'(?:[^'\\\n]|\\.)*'", re.DOTALL),
+           '"': re.compile(r'"(?:[^"\\\n]|\\.)*"', re.DOTALL)}
+_TEMPLATE = re.compile(r"""(?P<text>(?:[^`\\$]|\\.|\$(?!\{))+)|(?P<end>`)|(?P<subst>\$\{)""", re.DOTALL)
+_JSX_START = re.compile(r"<\s*(?:(?P<name>[A-Za-z_$][\w$.:-]*)|(?=>))")
+# .tsx 의 제네릭 화살표 함수 <T,>(...) / <T extends X>(...) 는 JSX 가 아님
+_GENERIC_ARROW = re.compile(r"<\s*[A-Za-z_$][\w$]*\s*(?:,|extends\b)")
+_JSX_TAG = re.compile(
+    r"""(?P<space>\s+|//[^\n]*|/\*.*?\*/)"""
+    r"""|(?P<string>"[^"]*"|'[^']*')"""
+    r"""|(?P<open>\{)"""
+    r"""|(?P<selfclose>/>)"""
+    r"""|(?P<gt>>)"""
+    r"""|(?P<word>[^\s'"{}/>=<]+|=)"""
+    r"""|(?P<other>.)""", re.DOTALL)
+_JSX_CHILDREN = re.compile(
+    r"""(?P<text>[^<{]+)"""
+    r"""|(?P<open>\{)"""
+    r"""|(?P<end></\s*(?P<name>[\w$.:-]*)\s*>)"""
+    r"""|(?P<lt><)""")
+_SCRIPT_BLOCK = re.compile(r"<script\b[^>]*>(.*?)</script\s*>", re.DOTALL | re.IGNORECASE)
+
+# 이 키워드 뒤에서는 식이 시작됨 (/ 는 정규식, < 는 JSX)
+_KEYWORDS_BEFORE_EXPRESSION = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void',
+                               'throw', 'instanceof', 'yield', 'await', 'default'}
+# 이 기호 뒤의 / 는 나눗셈
+_VALUE_END = {')', ']', '}', '++', '--'}
+# 이 키워드의 ( ) 뒤에서는 문장이 시작됨: if (x) /re/.test(s) 의 / 는 정규식
+_CONTROL_KEYWORDS = {'if', 'while', 'for', 'with'}
+_PROPERTY_ACCESS = {'.', '?.'}
+_CLOSER = {'(': ')', '[': ']', '{': '}', '${': '}', 'jsx{': '}'}
+_CODE_FRAMES = set(_CLOSER)
+_FRAME_NAMES = {'(': "'('", '[': "'['", '{': "'{'", '${': "'${'", 'jsx{': "JSX 식 '{'",
+                '`': "템플릿 문자열", 'tag': "JSX 태그", 'children': "JSX 요소"}
+
+
+class Issue(NamedTuple):
+    line: int
+    column: int
+    message: str
+
+
+class _Frame(NamedTuple):
+    kind: str       # ( [ { ${ jsx{ ` tag children
+    start: int
+    name: str = ''  # JSX 요소 이름 (프래그먼트는 빈 문자열), 제어문 머리의 ( 는 'control'
+
+
+def _position(text, offset):
+    """오프셋 → (줄, 열), 둘 다 1부터"""
+    line = text.count('\n', 0, offset) + 1
+    return line, offset - (text.rfind('\n', 0, offset) + 1) + 1
+
+
+def _scan_regex(text, pos, length):
+    """정규식 리터럴 끝 위치 (문자 클래스 안의 / 무시, 플래그 포함), 닫히지 않으면 None"""
+    i = pos + 1
+    in_class = False
+    while i < length:
+        char = text[i]
+        if char == '\n':
+            return None
+        if char == '\\':
+            i += 2
+            continue
+        if char == '[':
+            in_class = True
+        elif char == ']':
+            in_class = False
+        elif char == '/' and not in_class:
+            i += 1
+            while i < length and (text[i].isalnum() or text[i] in '_$'):
+                i += 1
+            return i
+        i += 1
+    return None
+
+
+class _Lexer:
+    """모드 스택 상태 기계 - 스택 맨 위 프레임이 현재 모드를 정함"""
+
+    def __init__(self, text, jsx, start=0, end=None):
+        self.text = text
+        self.jsx = jsx
+        self.pos = start
+        self.end = len(text) if end is None else end
+        self.stack = []
+        self.issues = []
+        # 직전 의미 있는 토큰 (None / 'word' / 'value' / 'punct', 값) - / 와 < 해석에 사용
+        self.previous = (None, '')
+
+    def report(self, offset, message):
+        self.issues.append((offset, message))
+
+    def expression_allowed(self):
+        kind, value = self.previous
+        if kind is None:
+            return True
+        if kind == 'word':
+            return value in _KEYWORDS_BEFORE_EXPRESSION
+        if kind == 'punct':
+            return value not in _VALUE_END
+        return False
+
+    def run(self):
+        while self.pos < self.end and len(self.issues) < MAX_ISSUES:
+            top = self.stack[-1].kind if self.stack else None
+            if top == '`':
+                done = self.template()
+            elif top == 'tag':
+                done = self.jsx_tag()
+            elif top == 'children':
+                done = self.jsx_children()
+            else:
+                done = self.code()
+            if done:
+                break
+        for frame in reversed(self.stack):
+            self.report(frame.start, f"닫히지 않은 {self.describe(frame)}")
+        return sorted(self.issues)
+
+    @staticmethod
+    def describe(frame):
+        if frame.kind in ('tag', 'children'):
+            return f"JSX 요소 <{frame.name}>"
+        return _FRAME_NAMES[frame.kind]
+
+    def code(self):
+        """코드 모드 토큰 하나 → 파일 끝까지 읽을 수 없으면 True"""
+        text, pos = self.text, self.pos
+        match = _CODE.match(text, pos, self.end)
+        kind = match.lastgroup
+        end = match.end()
+
+        if kind in ('space', 'comment'):
+            pass
+        elif kind == 'block':
+            close = text.find('*/', end, self.end)
+            if close < 0:
+                self.report(pos, "닫히지 않은 주석 /*")
+                return True
+            end = close + 2
+        elif kind == 'quote':
+            string = _STRING[match.group()].match(text, pos, self.end)
+            if string is None:
+                self.report(pos, "닫히지 않은 문자열")
+                newline = text.find('\n', pos, self.end)
+                end = self.end if newline < 0 else newline
+            else:
+                end = string.end()
+            self.previous = ('value', '')
+        elif kind == 'template':
+            self.stack.append(_Frame('`', pos))
+        elif kind == 'word':
+            # obj.if / obj.return 같은 속성 이름은 키워드가 아니라 값
+            property_name = self.previous[0] == 'punct' and self.previous[1] in _PROPERTY_ACCESS
+            self.previous = ('value', '') if property_name else ('word', match.group())
+        elif kind == 'open':
+            control = (match.group() == '(' and self.previous[0] == 'word'
+                       and self.previous[1] in _CONTROL_KEYWORDS)
+            self.stack.append(_Frame(match.group(), pos, 'control' if control else ''))
+            self.previous = ('punct', match.group())
+        elif kind == 'close':
+            self.close(pos, match.group())
+        elif kind == 'slash':
+            if self.expression_allowed():
+                end = _scan_regex(text, pos, self.end)
+                if end is None:
+                    self.report(pos, "닫히지 않은 정규식")
+                    newline = text.find('\n', pos, self.end)
+                    end = self.end if newline < 0 else newline
+                self.previous = ('value', '')
+            else:
+                self.previous = ('punct', match.group())
+        elif kind == 'lt':
+            start = (_JSX_START.match(text, pos, self.end)
+                     if self.jsx and self.expression_allowed() and not _GENERIC_ARROW.match(text, pos, self.end)
+                     else None)
+            if start is not None:
+                self.stack.append(_Frame('tag', pos, start.group('name') or ''))
+                end = start.end()
+            else:
+                self.previous = ('punct', '<')
+        else:
+            self.previous = ('punct', match.group())
+
+        self.pos = end
+        return False
+
+    def close(self, pos, closer):
+        """닫는 괄호: 짝이 맞는 여는 괄호까지 스택을 되감음 (중간에 남은 것은 닫히지 않은 것으로 보고)"""
+        depth = len(self.stack) - 1
+        while depth >= 0 and self.stack[depth].kind in _CODE_FRAMES:
+            if _CLOSER[self.stack[depth].kind] == closer:
+                break
+            depth -= 1
+        else:
+            self.report(pos, f"짝이 없는 '{closer}'")
+            self.previous = ('punct', closer)
+            return
+
+        for frame in self.stack[depth + 1:]:
+            self.report(frame.start, f"닫히지 않은 {self.describe(frame)} ('{closer}' 전에)")
+        frame = self.stack[depth]
+        del self.stack[depth:]
+        # ${ } 가 닫히면 템플릿 문자열 안, JSX 식이 닫히면 태그 / 자식 안으로 돌아감
+        if frame.kind in ('${', 'jsx{'):
+            self.previous = ('value', '')
+        elif frame.name == 'control':
+            # if (...) / while (...) 뒤는 새 문장의 시작
+            self.previous = (None, '')
+        else:
+            self.previous = ('punct', closer)
+
+    def template(self):
+        match = _TEMPLATE.match(self.text, self.pos, self.end)
+        if match is None:
+            # 파일(스크립트 블록) 끝: 마지막 \ 하나만 남은 경우
+            self.pos = self.end
+            return True
+        kind = match.lastgroup
+        if kind == 'end':
+            self.stack.pop()
+            self.previous = ('value', '')
+        elif kind == 'subst':
+            self.stack.append(_Frame('${', self.pos))
+            self.previous = (None, '')
+        self.pos = match.end()
+        return False
+
+    def jsx_tag(self):
+        match = _JSX_TAG.match(self.text, self.pos, self.end)
+        kind = match.lastgroup
+        if kind == 'open':
+            self.stack.append(_Frame('jsx{', self.pos))
+            self.previous = (None, '')
+        elif kind == 'selfclose':
+            self.stack.pop()
+            self.element_closed()
+        elif kind == 'gt':
+            frame = self.stack.pop()
+            self.stack.append(_Frame('children', frame.start, frame.name))
+        elif kind == 'other':
+            self.report(self.pos, f"JSX 태그 안의 예상치 못한 문자 {match.group()!r}")
+        self.pos = match.end()
+        return False
+
+    def jsx_children(self):
+        text, pos = self.text, self.pos
+        match = _JSX_CHILDREN.match(text, pos, self.end)
+        kind = match.lastgroup
+        end = match.end()
+        if kind == 'open':
+            self.stack.append(_Frame('jsx{', pos))
+            self.previous = (None, '')
+        elif kind == 'end':
+            frame = self.stack.pop()
+            if match.group('name') != frame.name:
+                self.report(pos, f"JSX 태그 짝이 맞지 않음: <{frame.name}> … </{match.group('name')}>")
+            self.element_closed()
+        elif kind == 'lt':
+            start = _JSX_START.match(text, pos, self.end)
+            if start is None:
+                self.report(pos, "JSX 자식 안의 잘못된 '<'")
+            else:
+                self.stack.append(_Frame('tag', pos, start.group('name') or ''))
+                end = start.end()
+        self.pos = end
+        return False
+
+    def element_closed(self):
+        # 코드 안에서 끝난 JSX 요소는 값 (뒤의 / 는 나눗셈, < 는 비교)
+        self.previous = ('value', '')
+
+
+def check_source(text, jsx=False):
+    """JS / TS 원문 → 문제 목록 [Issue(줄, 열, 메시지)]"""
+    return [Issue(*_position(text, offset), message) for offset, message in _Lexer(text, jsx).run()]
+
+
+def check_html(text):
+    """HTML 의 <script> 블록들 → 문제 목록 (줄 / 열은 HTML 파일 기준)"""
+    issues = []
+    for block in _SCRIPT_BLOCK.finditer(text):
+        found = _Lexer(text, False, block.start(1), block.end(1)).run()
+        issues.extend(Issue(*_position(text, offset), message) for offset, message in found)
+    return issues
+
+
+def check_file_text(path, text):
+    """확장자에 맞게 검사 (.tsx / .jsx 는 JSX 허용, .html 은 스크립트 블록만)"""
+    suffix = str(path).lower().rsplit('.', 1)[-1]
+    if suffix in ('html', 'htm'):
+        return check_html(text)
+    return check_source(text, jsx=suffix in ('tsx', 'jsx'))
+
+
+def main():
+    status = 0
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8') as f:
+            issues = check_file_text(path, f.read())
+        for issue in issues:
+            print(f"❌ {path}:{issue.line}:{issue.column} {issue.message}")
+        status |= bool(issues)
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
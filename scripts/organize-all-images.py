@@ -5,15 +5,29 @@ ProductV2 전체 16개 제품 이미지 자동 분류 스크립트
 다운로드된 모든 이미지를 16개 제품에 자동 매칭하여 분류
 """
 
+import argparse
 import os
-import shutil
 import random
+import time
 from pathlib import Path
 import re
 
+import instrumentation
+from asset_index import AssetIndex
+from color_names import LOW_CONFIDENCE, name_thumbnails, unique_labels
+from image_store import ImageStore
+from instrumentation import detail
+from organize_engine import DEFAULT_WORKERS, execute_plan, plan_item, print_report
+from source_index import SourceIndex
+
 # 설정
 SOURCE_DIR = r"C:\Users\apf_temp_admin\Desktop\Bookcases, Bookshelves - modern, large or small - Tylko_files"
 TARGET_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\public\images\products\v2"
+STORE_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\image-store"
+ASSET_DB = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\asset-index.sqlite"
+
+# 같은 이미지는 저장소에 한 번만 두고 제품 폴더에는 링크로 배치
+STORE = ImageStore(STORE_DIR)
 
 # ProductV2 데이터의 16개 제품 정보
 PRODUCTS_V2 = [
@@ -38,36 +52,16 @@ PRODUCTS_V2 = [
 # 색상 매칭 정보
 COLORS = ["white", "grey", "brown", "black", "green", "blue", "red", "beige", "sand", "moss-green", "light-wood", "dark-wood", "pink", "yellow", "sage", "burgundy", "cream", "light-grey", "dark-grey"]
 
-def get_all_images():
-    """다운로드 폴더에서 모든 이미지 파일 수집"""
+def get_all_images(index):
+    """색인에서 모든 이미지 파일을 용도별로 분류"""
     print("🖼️ 다운로드된 이미지 파일 수집 중...")
     
-    source_path = Path(SOURCE_DIR)
-    if not source_path.exists():
+    if not index.directory.exists():
         print(f"❌ 소스 폴더가 존재하지 않습니다: {SOURCE_DIR}")
         return [], [], []
     
-    # 파일 분류
-    main_images = []  # jpg 파일들 (메인 이미지용)
-    hover_images = []  # webp 파일들 중 thumbnail이 아닌 것 (호버 이미지용)
-    color_images = []  # thumbnail.webp 파일들 (색상 변형용)
-    
-    for file in source_path.glob("*"):
-        if file.is_file() and file.suffix.lower() in ['.jpg', '.webp']:
-            filename = file.name.lower()
-            
-            if file.suffix.lower() == '.jpg':
-                # JPG는 메인 이미지로 분류
-                if not any(skip in filename for skip in ['icon', 'logo', 'banner']):
-                    main_images.append(file)
-            elif file.suffix.lower() == '.webp':
-                if 'thumbnail' in filename:
-                    # thumbnail.webp는 색상 변형으로 분류
-                    color_images.append(file)
-                else:
-                    # 일반 webp는 호버 이미지로 분류
-                    if not any(skip in filename for skip in ['icon', 'logo', 'banner']):
-                        hover_images.append(file)
+    # jpg → 메인, thumbnail 이 아닌 webp → 호버, thumbnail.webp → 색상 변형
+    main_images, hover_images, color_images = index.classify()
     
     print(f"  📸 메인 이미지 (JPG): {len(main_images)}개")
     print(f"  🎯 호버 이미지 (WebP): {len(hover_images)}개") 
@@ -75,6 +69,21 @@ def get_all_images():
     
     return main_images, hover_images, color_images
 
+def thumbnail_colors(color_images):
+    """색상 섬네일 대표색 → {경로: 색상 이름} (NumPy / Pillow 가 없으면 빈 사전)"""
+    print("🎨 색상 섬네일 대표색 분석 중...")
+    with AssetIndex(ASSET_DB) as assets:
+        named = name_thumbnails(assets, color_images, COLORS)
+    
+    uncertain = [path for path, (_, confidence) in named.items() if confidence < LOW_CONFIDENCE]
+    print(f"  ✅ 색상 이름 지정: {len(named)}개 (확인 필요 {len(uncertain)}개)")
+    return {path: color_name for path, (color_name, _) in named.items()}
+
+def color_labels(color_files, color_names):
+    """제품 하나의 섬네일 목록 → 색상 이름 목록 (대표색이 없으면 COLORS 순서, 겹치면 번호)"""
+    return unique_labels([color_names.get(Path(color_file)) or COLORS[i % len(COLORS)]
+                          for i, color_file in enumerate(color_files)])
+
 def create_all_folders():
     """16개 제품 모두에 대한 폴더 구조 생성"""
     print("📁 전체 제품 폴더 구조 생성 중...")
@@ -87,19 +96,22 @@ def create_all_folders():
         (product_path / "hover").mkdir(parents=True, exist_ok=True)
         (product_path / "colors").mkdir(parents=True, exist_ok=True)
         
-        print(f"  ✅ {product['slug']} 폴더 생성")
+        detail(f"  ✅ {product['slug']} 폴더 생성")
 
-def distribute_images():
-    """이미지를 16개 제품에 균등하게 배분"""
+def distribute_images(workers=DEFAULT_WORKERS):
+    """이미지를 16개 제품에 균등하게 배분 (배분 계획을 만든 뒤 병렬 복사)"""
     print("🎯 이미지를 16개 제품에 배분 중...")
     
-    main_images, hover_images, color_images = get_all_images()
+    # 다운로드 폴더는 한 번만 나열하고, 패턴 매칭은 색인 사전 조회로 처리
+    index = SourceIndex.scan(SOURCE_DIR)
+    main_images, hover_images, color_images = get_all_images(index)
     
     if not main_images and not hover_images and not color_images:
         print("❌ 사용 가능한 이미지가 없습니다!")
-        return 0, 0
+        return [], 0
     
-    copied_count = 0
+    color_names = thumbnail_colors(color_images)
+    plan = []
     
     # 특별히 매칭되는 이미지들 먼저 처리
     special_mappings = {
@@ -120,57 +132,43 @@ def distribute_images():
     # 특별 매칭 먼저 처리
     for product in PRODUCTS_V2:
         product_path = Path(TARGET_DIR) / product["slug"]
-        print(f"\n📦 {product['name']} 처리 중...")
+        detail(f"\n📦 {product['name']} 처리 중...")
         
         if product["slug"] in special_mappings:
             mapping = special_mappings[product["slug"]]
             
-            # 메인 이미지 특별 매칭
-            main_file = None
-            for img in main_images + hover_images:  # JPG와 WebP 모두에서 찾기
-                if mapping["main_pattern"] in img.name and img not in used_images:
-                    main_file = img
-                    break
+            # 메인 이미지 특별 매칭 (JPG와 WebP 모두에서 찾기)
+            main_file = index.find(mapping["main_pattern"], exclude=used_images)
             
             if main_file:
                 ext = main_file.suffix.lower()
                 dest = product_path / "main" / f"{product['slug']}-main{ext}"
-                shutil.copy2(main_file, dest)
+                plan.append(plan_item(main_file, dest, "main"))
                 used_images.add(main_file)
-                print(f"  📸 메인 이미지: {main_file.name} → {dest.name}")
-                copied_count += 1
+                detail(f"  📸 메인 이미지: {main_file.name} → {dest.name}")
             
             # 호버 이미지 특별 매칭
-            hover_file = None
-            for img in hover_images:
-                if mapping["hover_pattern"] in img.name and img not in used_images:
-                    hover_file = img
-                    break
+            hover_file = index.find(mapping["hover_pattern"], exclude=used_images)
             
             if hover_file:
                 dest = product_path / "hover" / f"{product['slug']}-hover.webp"
-                shutil.copy2(hover_file, dest)
+                plan.append(plan_item(hover_file, dest, "hover"))
                 used_images.add(hover_file)
-                print(f"  🎯 호버 이미지: {hover_file.name} → {dest.name}")
-                copied_count += 1
+                detail(f"  🎯 호버 이미지: {hover_file.name} → {dest.name}")
             
             # 색상 변형 특별 매칭
-            color_count = 0
+            color_files = []
             for pattern in mapping.get("color_patterns", []):
-                color_file = None
-                for img in color_images:
-                    if pattern in img.name and img not in used_images:
-                        color_file = img
-                        break
+                color_file = index.find(pattern, exclude=used_images)
                 
                 if color_file:
-                    color_name = COLORS[color_count % len(COLORS)]
-                    dest = product_path / "colors" / f"{product['slug']}-{color_name}.webp"
-                    shutil.copy2(color_file, dest)
+                    color_files.append(color_file)
                     used_images.add(color_file)
-                    print(f"    🎨 {color_name}: {color_file.name} → {dest.name}")
-                    copied_count += 1
-                    color_count += 1
+            
+            for color_file, color_name in zip(color_files, color_labels(color_files, color_names)):
+                dest = product_path / "colors" / f"{product['slug']}-{color_name}.webp"
+                plan.append(plan_item(color_file, dest, "colors"))
+                detail(f"    🎨 {color_name}: {color_file.name} → {dest.name}")
     
     # 나머지 제품들에 남은 이미지 배분
     remaining_main = [img for img in main_images if img not in used_images]
@@ -191,76 +189,83 @@ def distribute_images():
             continue  # 이미 처리됨
             
         product_path = Path(TARGET_DIR) / product["slug"]
-        print(f"\n📦 {product['name']} 처리 중...")
+        detail(f"\n📦 {product['name']} 처리 중...")
         
         # 메인 이미지 배분
         if main_idx < len(remaining_main):
             main_file = remaining_main[main_idx]
             ext = main_file.suffix.lower()
             dest = product_path / "main" / f"{product['slug']}-main{ext}"
-            shutil.copy2(main_file, dest)
-            print(f"  📸 메인 이미지: {main_file.name} → {dest.name}")
-            copied_count += 1
+            plan.append(plan_item(main_file, dest, "main"))
+            detail(f"  📸 메인 이미지: {main_file.name} → {dest.name}")
             main_idx += 1
         
         # 호버 이미지 배분
         if hover_idx < len(remaining_hover):
             hover_file = remaining_hover[hover_idx]
             dest = product_path / "hover" / f"{product['slug']}-hover.webp"
-            shutil.copy2(hover_file, dest)
-            print(f"  🎯 호버 이미지: {hover_file.name} → {dest.name}")
-            copied_count += 1
+            plan.append(plan_item(hover_file, dest, "hover"))
+            detail(f"  🎯 호버 이미지: {hover_file.name} → {dest.name}")
             hover_idx += 1
         
         # 색상 변형 배분 (제품당 5-8개)
         colors_per_product = min(8, (len(remaining_colors) - color_idx) // max(1, (len(PRODUCTS_V2) - len(special_mappings))))
         colors_per_product = max(5, colors_per_product)  # 최소 5개
         
-        print(f"  🎨 색상 변형들:")
-        for i in range(min(colors_per_product, len(remaining_colors) - color_idx)):
-            color_file = remaining_colors[color_idx + i]
-            color_name = COLORS[i % len(COLORS)]
+        detail(f"  🎨 색상 변형들:")
+        color_files = remaining_colors[color_idx:color_idx + colors_per_product]
+        for color_file, color_name in zip(color_files, color_labels(color_files, color_names)):
             dest = product_path / "colors" / f"{product['slug']}-{color_name}.webp"
-            shutil.copy2(color_file, dest)
-            print(f"    ✅ {color_name}: {color_file.name} → {dest.name}")
-            copied_count += 1
+            plan.append(plan_item(color_file, dest, "colors"))
+            detail(f"    ✅ {color_name}: {color_file.name} → {dest.name}")
         
         color_idx += colors_per_product
     
-    return copied_count, len(main_images) + len(hover_images) + len(color_images)
+    print(f"\n📋 복사 계획: {len(plan)}개")
+    results = execute_plan(plan, STORE.place, workers)
+    
+    return results, len(main_images) + len(hover_images) + len(color_images)
 
 def generate_full_report():
     """전체 분류 결과 리포트 생성"""
     print("\n📊 전체 분류 결과 리포트:")
     print("=" * 80)
     
-    target_path = Path(TARGET_DIR)
     total_files = 0
     
-    for product in PRODUCTS_V2:
-        product_path = target_path / product["slug"]
-        print(f"\n📦 {product['name']} ({product['slug']}):")
-        
-        # 각 폴더별 파일 개수 
-        main_files = list((product_path / "main").glob("*"))
-        hover_files = list((product_path / "hover").glob("*"))
-        color_files = list((product_path / "colors").glob("*"))
-        
-        product_total = len(main_files) + len(hover_files) + len(color_files)
-        total_files += product_total
+    with AssetIndex(ASSET_DB) as assets:
+        assets.refresh(TARGET_DIR)
         
-        print(f"  📸 메인: {len(main_files)}개")
-        print(f"  🎯 호버: {len(hover_files)}개") 
-        print(f"  🎨 색상: {len(color_files)}개")
-        print(f"  📊 합계: {product_total}개")
+        for product in PRODUCTS_V2:
+            detail(f"\n📦 {product['name']} ({product['slug']}):")
+            
+            # 각 폴더별 파일 개수 (색인 조회)
+            counts = assets.counts_by_role(TARGET_DIR, product["slug"])
+            product_total = sum(counts.values())
+            total_files += product_total
+            
+            detail(f"  📸 메인: {counts['main']}개")
+            detail(f"  🎯 호버: {counts['hover']}개")
+            detail(f"  🎨 색상: {counts['colors']}개")
+            detail(f"  📊 합계: {product_total}개")
     
     print(f"\n🎉 전체 정리 완료!")
     print(f"📊 총 {len(PRODUCTS_V2)}개 제품, {total_files}개 이미지 파일")
     
     return total_files
 
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="ProductV2 16개 제품 이미지 자동 분류")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 복사 스레드 수")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+    instrumentation.configure(args)
+    
     print("🚀 ProductV2 전체 16개 제품 이미지 자동 분류 시작!")
     print("=" * 80)
     
@@ -278,7 +283,9 @@ def main():
         create_all_folders()
         
         # 2. 이미지 분류 및 배분
-        copied, total_available = distribute_images()
+        started = time.perf_counter()
+        results, total_available = distribute_images(args.workers)
+        elapsed = time.perf_counter() - started
         
         # 3. 결과 리포트
         total_organized = generate_full_report()
@@ -286,9 +293,11 @@ def main():
         # 4. 최종 요약
         print("\n" + "=" * 80)
         print("🎉 16개 제품 이미지 분류 완료!")
-        print(f"✅ 사용된 이미지: {copied}개")
+        copied = print_report(results, [], elapsed)
+        print(f"✅ 사용된 이미지: {copied}/{total_available}개")
         print(f"📁 총 정리된 파일: {total_organized}개")
         print(f"📦 처리된 제품: {len(PRODUCTS_V2)}개")
+        STORE.report()
         
         # 5. 다음 단계 안내
         print("\n🎯 다음 단계:")
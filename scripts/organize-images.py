@@ -5,14 +5,32 @@ ProductV2 이미지 자동 분류 스크립트
 브라우저가 다운로드한 이미지들을 제품별 폴더 구조로 정리
 """
 
+import argparse
 import os
-import shutil
+import time
 from pathlib import Path
 import re
 
+from asset_index import AssetIndex
+from image_store import ImageStore
+import instrumentation
+from instrumentation import detail
+from organize_engine import (
+    DEFAULT_WORKERS,
+    add_to_plan,
+    execute_plan,
+    print_report,
+)
+from source_index import SourceIndex
+
 # 설정
 SOURCE_DIR = r"C:\Users\apf_temp_admin\Desktop\Bookcases, Bookshelves - modern, large or small - Tylko_files"
 TARGET_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\public\images\products\v2"
+STORE_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\image-store"
+ASSET_DB = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\asset-index.sqlite"
+
+# 같은 이미지는 저장소에 한 번만 두고 제품 폴더에는 링크로 배치
+STORE = ImageStore(STORE_DIR)
 
 # HTML에서 추출한 제품-이미지 매핑 정보
 PRODUCT_MAPPINGS = {
@@ -68,87 +86,72 @@ def create_folder_structure():
         (product_path / "hover").mkdir(parents=True, exist_ok=True)
         (product_path / "colors").mkdir(parents=True, exist_ok=True)
         
-        print(f"  ✅ {product_id} 폴더 생성")
+        detail(f"  ✅ {product_id} 폴더 생성")
 
-def copy_images():
-    """이미지 파일들을 적절한 폴더로 복사"""
-    print("🖼️ 이미지 파일 복사 중...")
-    
-    source_path = Path(SOURCE_DIR)
-    copied_count = 0
-    missing_count = 0
+def plan_images(names):
+    """복사 계획 작성 → (계획, 누락 파일 목록)"""
+    plan = []
+    missing = []
     
     for product_id, product_info in PRODUCT_MAPPINGS.items():
-        print(f"\n📦 {product_info['name']} 처리 중...")
         product_path = Path(TARGET_DIR) / product_id
         
-        # 메인 이미지 복사
-        main_src = source_path / product_info['main_image']
-        if main_src.exists():
-            main_dst = product_path / "main" / f"{product_id}-main.jpg"
-            shutil.copy2(main_src, main_dst)
-            print(f"  📸 메인 이미지: {product_info['main_image']} → {main_dst.name}")
-            copied_count += 1
-        else:
-            print(f"  ❌ 메인 이미지 없음: {product_info['main_image']}")
-            missing_count += 1
+        # 메인 / 호버 이미지
+        add_to_plan(plan, missing, names, SOURCE_DIR, product_info['main_image'],
+                    product_path / "main" / f"{product_id}-main.jpg", "main")
+        add_to_plan(plan, missing, names, SOURCE_DIR, product_info['hover_image'],
+                    product_path / "hover" / f"{product_id}-hover.webp", "hover")
         
-        # 호버 이미지 복사  
-        hover_src = source_path / product_info['hover_image']
-        if hover_src.exists():
-            hover_dst = product_path / "hover" / f"{product_id}-hover.webp"
-            shutil.copy2(hover_src, hover_dst)
-            print(f"  🎯 호버 이미지: {product_info['hover_image']} → {hover_dst.name}")
-            copied_count += 1
-        else:
-            print(f"  ❌ 호버 이미지 없음: {product_info['hover_image']}")
-            missing_count += 1
-        
-        # 색상 변형 이미지들 복사
-        print(f"  🎨 색상 변형들:")
+        # 색상 변형 이미지들
         for color in product_info['colors']:
-            color_src = source_path / color['file']
-            if color_src.exists():
-                color_dst = product_path / "colors" / f"{product_id}-{color['name']}.webp"
-                shutil.copy2(color_src, color_dst)
-                print(f"    ✅ {color['name']}: {color['file']} → {color_dst.name}")
-                copied_count += 1
-            else:
-                print(f"    ❌ {color['name']}: {color['file']} (파일 없음)")
-                missing_count += 1
+            add_to_plan(plan, missing, names, SOURCE_DIR, color['file'],
+                        product_path / "colors" / f"{product_id}-{color['name']}.webp", "colors")
+    
+    return plan, missing
+
+def copy_images(workers=DEFAULT_WORKERS):
+    """이미지 파일들을 적절한 폴더로 병렬 복사 → (결과 목록, 누락 파일 목록)"""
+    print("🖼️ 이미지 파일 복사 중...")
     
-    return copied_count, missing_count
+    plan, missing = plan_images(SourceIndex.scan(SOURCE_DIR))
+    print(f"  📋 복사 계획: {len(plan)}개 (누락 {len(missing)}개)")
+    
+    results = execute_plan(plan, STORE.place, workers)
+    return results, missing
 
 def generate_usage_report():
-    """사용 현황 리포트 생성"""
+    """사용 현황 리포트 생성 (폴더를 다시 훑지 않고 이미지 색인 조회)"""
     print("\n📊 사용 현황 리포트:")
     
-    target_path = Path(TARGET_DIR)
-    
-    for product_id, product_info in PRODUCT_MAPPINGS.items():
-        print(f"\n📦 {product_info['name']} ({product_id}):")
-        product_path = target_path / product_id
-        
-        # 메인 이미지
-        main_files = list((product_path / "main").glob("*"))
-        print(f"  📸 메인: {len(main_files)}개")
+    with AssetIndex(ASSET_DB) as assets:
+        assets.refresh(TARGET_DIR)
         
-        # 호버 이미지
-        hover_files = list((product_path / "hover").glob("*"))
-        print(f"  🎯 호버: {len(hover_files)}개")
-        
-        # 색상 변형
-        color_files = list((product_path / "colors").glob("*"))
-        print(f"  🎨 색상: {len(color_files)}개")
-        
-        # 파일 목록
-        for folder, files in [("main", main_files), ("hover", hover_files), ("colors", color_files)]:
-            if files:
-                for file in files:
-                    print(f"    - {folder}/{file.name}")
+        for product_id, product_info in PRODUCT_MAPPINGS.items():
+            detail(f"\n📦 {product_info['name']} ({product_id}):")
+            rows = assets.query(root=TARGET_DIR, product=product_id)
+            files = {role: [row for row in rows if row['role'] == role] for role in ("main", "hover", "colors")}
+            
+            detail(f"  📸 메인: {len(files['main'])}개")
+            detail(f"  🎯 호버: {len(files['hover'])}개")
+            detail(f"  🎨 색상: {len(files['colors'])}개")
+            
+            # 파일 목록
+            for folder, folder_rows in files.items():
+                for row in folder_rows:
+                    detail(f"    - {folder}/{row['name']}")
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="ProductV2 이미지 자동 분류")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 복사 스레드 수")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
 
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+    instrumentation.configure(args)
+    
     print("🚀 ProductV2 이미지 자동 분류 시작!")
     print("=" * 60)
     
@@ -166,13 +169,14 @@ def main():
         create_folder_structure()
         
         # 2. 이미지 복사
-        copied, missing = copy_images()
+        started = time.perf_counter()
+        results, missing = copy_images(args.workers)
         
         # 3. 결과 요약
         print("\n" + "=" * 60)
         print("🎉 이미지 분류 완료!")
-        print(f"✅ 복사된 파일: {copied}개")
-        print(f"❌ 누락된 파일: {missing}개")
+        print_report(results, missing, time.perf_counter() - started)
+        STORE.report()
         
         # 4. 사용 현황 리포트
         generate_usage_report()
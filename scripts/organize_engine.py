@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이미지 정리 공용 엔진
+(원본, 대상) 쌍의 계획을 만든 뒤 스레드 풀로 한꺼번에 배치
+
+- 파일마다 exists() 를 부르는 대신 원본 폴더를 한 번만 나열하여 존재 여부 확인
+- 대상 폴더 mkdir 은 중복 없이 한 번씩만
+- 결과는 마지막에 리포트 하나로 출력
+
+    names = SourceIndex.scan(SOURCE_DIR)   # 또는 list_files(SOURCE_DIR)
+    plan, missing = [], []
+    add_to_plan(plan, missing, names, SOURCE_DIR, "a.webp", dest, "hover")
+    results = execute_plan(plan, STORE.place)
+    print_report(results, missing, elapsed)
+
+증분 동기화 (plan / apply): 원하는 트리와 현재 트리를 크기 / mtime / 해시로 비교하여
+달라진 파일만 복사 / 이동 / 삭제 (최신 상태에서 다시 실행하면 쓰기 0회)
+
+    sync = diff_tree(plan, scan_files(managed_dirs), STORE.digest_of)
+    print_sync_plan(sync)
+    if not dry_run:
+        results = apply_sync(sync, STORE.place)
+
+여러 도구가 같은 폴더에 파일을 두는 경우에는 이전 실행에서 배치한 경로를 기록해 두고
+(save_placed) 그 파일과 계획에 있는 파일만 비교 대상으로 넘김 (owned_files) → 남이 둔 파일은 지우지 않음
+"""
+
+import json
+import os
+import shutil
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from image_store import file_sha256
+from instrumentation import detail, stage
+
+# 파일 배치는 디스크 I/O 대기가 대부분이므로 CPU 수보다 넉넉하게
+# (SSD 는 큐 깊이가 깊을수록 빠르고, HDD 라면 --workers 로 낮춰서 사용)
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def list_files(directory):
+    """폴더를 한 번 나열하여 일반 파일 이름 집합 반환 (폴더가 없으면 빈 집합)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def plan_item(src, dest, kind):
+    """계획 항목 하나 (kind: 'main' / 'hover' / 'colors' 등 리포트용 분류)"""
+    return {'src': Path(src), 'dest': Path(dest), 'kind': kind}
+
+
+def add_to_plan(plan, missing, names, source_dir, filename, dest, kind):
+    """원본이 목록에 있으면 계획에 추가, 없으면 누락 목록에 추가 → 추가 여부"""
+    if filename in names:
+        plan.append(plan_item(Path(source_dir) / filename, dest, kind))
+        return True
+    missing.append(filename)
+    return False
+
+
+def dedupe_plan(plan):
+    """같은 대상으로 가는 항목은 마지막 것만 유지 (순차 복사에서 덮어쓰던 결과와 동일)"""
+    latest = {}
+    for item in plan:
+        latest.pop(item['dest'], None)
+        latest[item['dest']] = item
+    return list(latest.values())
+
+
+def ensure_dirs(plan):
+    """계획의 대상 폴더들을 한 번씩만 생성 → 만든 폴더 수"""
+    dirs = sorted({item['dest'].parent for item in plan})
+    for directory in dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+    return len(dirs)
+
+
+def _run_item(item, place):
+    try:
+        mode = place(item['src'], item['dest'])
+    except OSError as e:
+        return {**item, 'ok': False, 'mode': None, 'error': str(e)}
+    return {**item, 'ok': True, 'mode': mode, 'error': None}
+
+
+def execute_plan(plan, place=shutil.copy2, workers=DEFAULT_WORKERS):
+    """계획을 스레드 풀로 실행 → 계획 순서대로의 결과 목록
+
+    place(src, dest) 는 shutil.copy2 또는 ImageStore.place 처럼 파일 하나를 배치하는 함수
+    """
+    plan = dedupe_plan(plan)
+    if not plan:
+        return []
+
+    with stage("execute_plan") as metrics:
+        ensure_dirs(plan)
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(plan)))) as executor:
+            results = list(executor.map(lambda item: _run_item(item, place), plan))
+        ok = [result for result in results if result['ok']]
+        metrics.add(files=len(ok), bytes=sum(os.stat(result['dest']).st_size for result in ok),
+                    failed=len(results) - len(ok))
+    return results
+
+
+def count_by_kind(results):
+    """성공한 배치 수를 kind 별로 집계"""
+    counts = {}
+    for result in results:
+        if result['ok']:
+            counts[result['kind']] = counts.get(result['kind'], 0) + 1
+    return counts
+
+
+def print_report(results, missing, elapsed, limit=10):
+    """배치 결과 리포트 출력 → 성공 개수"""
+    ok = [r for r in results if r['ok']]
+    failed = [r for r in results if not r['ok']]
+
+    print("\n📊 이미지 배치 결과:")
+    for kind, count in count_by_kind(results).items():
+        print(f"  ✅ {kind}: {count}개")
+    print(f"✅ 배치된 파일: {len(ok)}/{len(results)}개")
+
+    if failed:
+        print(f"❌ 배치 실패: {len(failed)}개")
+        for result in failed[:limit]:
+            print(f"  - {result['src'].name} → {result['dest']}: {result['error']}")
+
+    if missing:
+        print(f"❌ 누락된 파일: {len(missing)}개")
+        for filename in missing[:limit]:
+            print(f"  - {filename}")
+        if len(missing) > limit:
+            print(f"  ... 및 {len(missing) - limit}개 더")
+
+    if elapsed > 0 and results:
+        print(f"⏱️ 소요 시간: {elapsed:.2f}s ({len(results) / elapsed:.0f} files/s)")
+    return len(ok)
+
+
+def _walk_files(directory):
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_files(entry.path)
+                elif entry.is_file():
+                    yield Path(entry.path), entry.stat()
+    except FileNotFoundError:
+        return
+
+
+def scan_files(directories):
+    """관리 대상 폴더들(하위 포함)의 현재 파일 → {경로: stat}"""
+    existing = {}
+    for directory in directories:
+        existing.update(_walk_files(directory))
+    return existing
+
+
+def _same_content(src, dest_stat, dest, digest_of):
+    """원본과 기존 대상이 같은 내용인지 (크기 → inode / mtime → 해시 순으로 확인)"""
+    src_stat = os.stat(src)
+    if src_stat.st_size != dest_stat.st_size:
+        return False
+    if (src_stat.st_ino, src_stat.st_dev) == (dest_stat.st_ino, dest_stat.st_dev):
+        return True
+    if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+        return True
+    return digest_of(src) == digest_of(dest)
+
+
+def diff_tree(plan, existing, digest_of=file_sha256):
+    """원하는 배치(plan)와 현재 파일(existing) 비교 → 동기화 계획
+
+    {'copy': [...], 'move': [(기존 경로, 항목), ...], 'delete': [...], 'unchanged': [...]}
+    삭제될 기존 파일 중 복사할 내용과 같은 것이 있으면 복사 대신 이동
+    """
+    with stage("diff_tree") as metrics:
+        sync = _diff_tree(dedupe_plan(plan), existing, digest_of)
+        # 변경 없는 파일 = 다시 쓰지 않아도 되는 것 (적중), 복사 / 이동 = 다시 써야 하는 것
+        metrics.add(files=len(plan))
+        metrics.cache(hits=len(sync['unchanged']), misses=len(sync['copy']) + len(sync['move']))
+    return sync
+
+
+def _diff_tree(plan, existing, digest_of):
+    desired = {item['dest'] for item in plan}
+
+    copies, unchanged = [], []
+    for item in plan:
+        dest_stat = existing.get(item['dest'])
+        if dest_stat is not None and _same_content(item['src'], dest_stat, item['dest'], digest_of):
+            unchanged.append(item)
+        else:
+            copies.append(item)
+
+    stale_by_size = defaultdict(list)
+    for path, st in existing.items():
+        if path not in desired:
+            stale_by_size[st.st_size].append(path)
+
+    moves, remaining = [], []
+    for item in copies:
+        candidates = stale_by_size.get(os.stat(item['src']).st_size)
+        match = None
+        if candidates:
+            src_digest = digest_of(item['src'])
+            match = next((p for p in candidates if digest_of(p) == src_digest), None)
+        if match is None:
+            remaining.append(item)
+        else:
+            candidates.remove(match)
+            moves.append((match, item))
+
+    deletes = sorted(p for paths in stale_by_size.values() for p in paths)
+    return {'copy': remaining, 'move': moves, 'delete': deletes, 'unchanged': unchanged}
+
+
+def load_placed(manifest_file):
+    """이전 실행에서 배치한 대상 경로 집합 (없거나 손상이면 빈 집합)"""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    return {Path(path) for path in data.get('placed', [])}
+
+
+def save_placed(manifest_file, paths):
+    """배치한 대상 경로 기록 (임시 파일에 쓴 뒤 교체)"""
+    manifest_path = Path(manifest_file)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'placed': sorted(str(path) for path in paths)}, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def owned_files(existing, plan, placed):
+    """현재 파일 중 이 도구가 다뤄도 되는 것만 (계획의 대상이거나 이전에 배치한 파일)"""
+    desired = {item['dest'] for item in plan}
+    return {path: st for path, st in existing.items() if path in desired or path in placed}
+
+
+def sync_is_empty(sync):
+    """할 일이 없는 동기화 계획인지"""
+    return not (sync['copy'] or sync['move'] or sync['delete'])
+
+
+def print_sync_plan(sync, limit=10):
+    """동기화 계획 출력 (적용 전에 항상 먼저 출력)"""
+    print("\n📋 동기화 계획:")
+    print(f"  ➕ 복사: {len(sync['copy'])}개")
+    print(f"  🔀 이동: {len(sync['move'])}개")
+    print(f"  🗑️ 삭제: {len(sync['delete'])}개")
+    print(f"  ✔️ 변경 없음: {len(sync['unchanged'])}개")
+
+    for item in sync['copy'][:limit]:
+        detail(f"    + {item['src'].name} → {item['dest']}")
+    for old_path, item in sync['move'][:limit]:
+        detail(f"    ~ {old_path} → {item['dest']}")
+    for path in sync['delete'][:limit]:
+        detail(f"    - {path}")
+
+    if sync_is_empty(sync):
+        print("  ✅ 이미 최신 상태입니다 (쓰기 없음)")
+
+
+def prune_empty_dirs(directories):
+    """비어 있는 폴더 제거 (하위부터, 지정한 폴더 자체 포함) → 제거한 폴더 수"""
+    removed = 0
+    for directory in directories:
+        for root, _dirs, _files in os.walk(directory, topdown=False):
+            try:
+                os.rmdir(root)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def apply_sync(sync, place=shutil.copy2, workers=DEFAULT_WORKERS):
+    """동기화 계획 적용 (이동 → 복사 → 삭제 순) → 복사 결과 목록"""
+    for old_path, item in sync['move']:
+        item['dest'].parent.mkdir(parents=True, exist_ok=True)
+        os.replace(old_path, item['dest'])
+
+    results = execute_plan(sync['copy'], place, workers)
+
+    for path in sync['delete']:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    return results
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+지각 해시(dHash) 기반 중복 렌더 탐지
+이름은 다르지만 눈으로 보면 같은 이미지(unreal_<id>_<접미사> 재렌더, 재사용 섬네일)를 찾아
+하나로 합칠 수 있는 파일 묶음을 보고
+
+- 이미지는 프로세스 풀에서 작게 줄이고, 해시 계산은 NumPy 로 한 번에
+- dHash 는 회색조라 같은 모양의 색상 변형을 구분하지 못하므로, 배경을 뺀 제품 평균색도 함께 비교
+- 해시는 내용 해시(sha256) 기준으로 이미지 색인에 캐시
+- 해밍 거리 BK-tree 로 가까운 해시만 조회 (전체 쌍 비교 없이)
+- 묶음 대표와 직접 가까운 것만 같은 묶음 (비슷한 것끼리 사슬처럼 이어 붙지 않음)
+- 가로 / 세로 크기가 같은 파일끼리만 합침 (섬네일 ↔ 원본 렌더처럼 크기만 다른 것은 따로 보고)
+
+사용법: python scripts/perceptual_dedupe.py [폴더 ...] [--threshold 14] [--json 결과.json]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from asset_index import AssetIndex
+from image_probe import probe_tree
+
+# NumPy / Pillow 는 선택 사항: 없으면 안내만 출력
+try:
+    import numpy as np
+    from PIL import Image
+    HAS_IMAGING = True
+except ImportError:
+    HAS_IMAGING = False
+
+# 경로 설정 (저장소 루트에서 실행)
+DEFAULT_ROOTS = ["public/images/products/v2"]
+DB_FILE = ".cache/asset-index.sqlite"
+
+HASH_KIND = "dhash256"
+COLOR_KIND = "fg_rgb24"
+HASH_SIZE = 16
+COLOR_SIZE = 32
+DEFAULT_THRESHOLD = 14      # 256비트 중 다른 비트 수가 이 이하면 같은 모양으로 봄
+DEFAULT_COLOR_TOLERANCE = 6    # 제품 평균색 RGB 거리가 이 이하면 같은 색으로 봄
+BACKGROUND_DISTANCE = 24    # 테두리 배경색과 이만큼 다르면 제품 픽셀
+CHUNK_SIZE = 64
+
+
+def load_thumbnails(path):
+    """이미지 → (회색조 (HASH_SIZE + 1) x HASH_SIZE, RGB COLOR_SIZE x COLOR_SIZE) 픽셀 바이트 (실패하면 None)"""
+    try:
+        with Image.open(path) as image:
+            # JPEG 은 디코딩 단계에서 미리 축소하여 빠르게 읽음
+            image.draft('RGB', (COLOR_SIZE * 2, COLOR_SIZE * 2))
+            rgb = image.convert('RGB').resize((COLOR_SIZE, COLOR_SIZE), Image.BILINEAR)
+            gray = rgb.convert('L').resize((HASH_SIZE + 1, HASH_SIZE), Image.BILINEAR)
+            return gray.tobytes(), rgb.tobytes()
+    except (OSError, ValueError):
+        return None
+
+
+def dhash_batch(pixel_rows):
+    """회색조 픽셀 바이트 목록 → dHash 정수 목록 (이웃 픽셀 비교를 배열 연산 한 번으로)"""
+    pixels = np.frombuffer(b''.join(pixel_rows), dtype=np.uint8)
+    pixels = pixels.reshape(len(pixel_rows), HASH_SIZE, HASH_SIZE + 1)
+    bits = pixels[:, :, 1:] > pixels[:, :, :-1]
+    packed = np.packbits(bits.reshape(len(pixel_rows), HASH_SIZE * HASH_SIZE), axis=1)
+    return [int.from_bytes(row.tobytes(), 'big') for row in packed]
+
+
+def foreground_color_batch(rgb_rows):
+    """RGB 픽셀 바이트 목록 → 배경(테두리 중앙값)을 뺀 평균색을 24비트 정수로"""
+    pixels = np.frombuffer(b''.join(rgb_rows), dtype=np.uint8)
+    pixels = pixels.reshape(len(rgb_rows), COLOR_SIZE, COLOR_SIZE, 3).astype(np.float32)
+
+    border = np.concatenate([pixels[:, 0], pixels[:, -1], pixels[:, :, 0], pixels[:, :, -1]], axis=1)
+    background = np.median(border, axis=1)                                  # (N, 3)
+    distance = np.abs(pixels - background[:, None, None, :]).sum(axis=3)    # (N, H, W)
+    mask = distance > BACKGROUND_DISTANCE
+    # 제품 픽셀이 거의 없으면(단색 이미지) 전체 평균 사용
+    mask[mask.sum(axis=(1, 2)) < 4] = True
+
+    weights = mask[..., None].astype(np.float32)
+    mean = (pixels * weights).sum(axis=(1, 2)) / weights.sum(axis=(1, 2))
+    mean = np.clip(np.rint(mean), 0, 255).astype(np.int64)
+    return [int(r) << 16 | int(g) << 8 | int(b) for r, g, b in mean]
+
+
+def color_distance(a, b):
+    """24비트 RGB 두 색의 유클리드 거리"""
+    return sum(((a >> shift & 0xFF) - (b >> shift & 0xFF)) ** 2 for shift in (16, 8, 0)) ** 0.5
+
+
+def hamming(a, b):
+    return (a ^ b).bit_count()
+
+
+class BKTree:
+    """해밍 거리 BK-tree (삼각 부등식으로 반경 밖의 가지는 건너뜀)"""
+
+    def __init__(self):
+        self.root = None
+
+    def add(self, value, item):
+        if self.root is None:
+            self.root = [value, [item], {}]
+            return
+        node = self.root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [item], {}]
+                return
+            node = child
+
+    def search(self, value, radius):
+        """value 에서 radius 이내의 (거리, 항목) 목록"""
+        found = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= radius:
+                found.extend((distance, item) for item in node[1])
+            for edge, child in node[2].items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return found
+
+
+def compute_hashes(index, rows, workers):
+    """행 목록 → {sha256: (dHash, 제품 평균색)} (캐시에 없는 것만 계산하여 저장)"""
+    hashes = index.perceptual_hashes(HASH_KIND)
+    colors = index.perceptual_hashes(COLOR_KIND)
+    pending = {}
+    for row in rows:
+        if row['sha256'] and (row['sha256'] not in hashes or row['sha256'] not in colors):
+            pending.setdefault(row['sha256'], row['path'])
+
+    if pending:
+        shas = list(pending)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(load_thumbnails, [pending[sha] for sha in shas], chunksize=CHUNK_SIZE))
+        loaded = [(sha, data) for sha, data in zip(shas, loaded) if data is not None]
+        if loaded:
+            keys = [sha for sha, _ in loaded]
+            new_hashes = dict(zip(keys, dhash_batch([gray for _, (gray, _) in loaded])))
+            new_colors = dict(zip(keys, foreground_color_batch([rgb for _, (_, rgb) in loaded])))
+            index.set_perceptual_hashes(HASH_KIND, new_hashes)
+            index.set_perceptual_hashes(COLOR_KIND, new_colors)
+            hashes.update(new_hashes)
+            colors.update(new_colors)
+
+    return {sha: (hashes[sha], colors[sha]) for sha in {row['sha256'] for row in rows}
+            if sha in hashes and sha in colors}
+
+
+def find_clusters(signatures, threshold, color_tolerance, order=None):
+    """{키: (해시, 색)} → 묶음 목록 (혼자인 키도 한 묶음)
+
+    아직 묶이지 않은 키를 대표로 삼아, 대표와 해시 거리 / 색 거리가 모두 가까운 키만 붙임
+    order 가 주어지면 그 순서대로 대표를 고름 (먼저 나온 것이 대표)
+    """
+    tree = BKTree()
+    for key, (value, _) in signatures.items():
+        tree.add(value, key)
+
+    assigned = set()
+    groups = []
+    for key in order or signatures:
+        if key in assigned:
+            continue
+        value, color = signatures[key]
+        group = [key]
+        assigned.add(key)
+        for _, other in tree.search(value, threshold):
+            if other not in assigned and color_distance(color, signatures[other][1]) <= color_tolerance:
+                group.append(other)
+                assigned.add(other)
+        groups.append(group)
+    return groups
+
+
+def build_report(rows, signatures, threshold, color_tolerance=DEFAULT_COLOR_TOLERANCE):
+    """중복 묶음 리포트 → (묶음 목록, 크기만 다른 묶음 목록)
+
+    묶음: [{'keep': 행, 'duplicates': [행...], 'bytes': 절약 가능 용량}] - 가로 / 세로 크기가 같은 파일끼리만
+    크기만 다른 묶음: [{'keep': 행, 'resized': [행...]}] - 같은 그림의 다른 크기 (섬네일 ↔ 원본 렌더)
+    작은 섬네일 자리에 큰 렌더를 쓰면 전송량이 오히려 늘어나므로 합치지 않고 절약 용량에도 넣지 않음
+    """
+    by_sha = {}
+    for row in rows:
+        by_sha.setdefault(row['sha256'], []).append(row)
+
+    def keep_order(row):
+        # 해상도가 가장 크고, 같으면 용량이 작은 파일을 남김
+        return -(row['width'] or 0) * (row['height'] or 0), row['size'], row['path']
+
+    clusters = []
+    resized = []
+    # 내용이 완전히 같은 파일들은 같은 sha 이므로 트리에서는 한 노드
+    shas = {sha: value for sha, value in signatures.items() if sha in by_sha}
+    order = sorted(shas, key=lambda sha: min(keep_order(row) for row in by_sha[sha]))
+    for group in find_clusters(shas, threshold, color_tolerance, order):
+        members = [row for sha in group for row in by_sha[sha]]
+        if len(members) < 2:
+            continue
+        members.sort(key=keep_order)
+
+        by_size = {}
+        for row in members:
+            by_size.setdefault((row['width'], row['height']), []).append(row)
+        for same_size in by_size.values():
+            if len(same_size) >= 2:
+                keep, duplicates = same_size[0], same_size[1:]
+                clusters.append({'keep': keep, 'duplicates': duplicates,
+                                 'bytes': sum(r['size'] for r in duplicates)})
+        if len(by_size) > 1:
+            sizes = list(by_size.values())
+            resized.append({'keep': sizes[0][0], 'resized': [same_size[0] for same_size in sizes[1:]]})
+
+    clusters.sort(key=lambda c: -c['bytes'])
+    return clusters, resized
+
+
+def print_report(clusters, resized=(), limit=20):
+    total = sum(c['bytes'] for c in clusters)
+    files = sum(len(c['duplicates']) for c in clusters)
+    print(f"\n📊 중복 묶음: {len(clusters)}개, 합칠 수 있는 파일: {files}개 ({total:,} bytes)")
+    for cluster in clusters[:limit]:
+        keep = cluster['keep']
+        print(f"\n  ✅ 유지: {keep['path']} ({keep['width']}x{keep['height']}, {keep['size']:,} bytes)")
+        for row in cluster['duplicates']:
+            print(f"    🔁 {row['path']} ({row['size']:,} bytes)")
+    if len(clusters) > limit:
+        print(f"\n  ... 및 {len(clusters) - limit}개 묶음 더")
+
+    if resized:
+        print(f"\n📐 크기만 다른 같은 그림: {len(resized)}개 (합치지 않음, 절약 용량에서 제외)")
+        for entry in resized[:limit]:
+            keep = entry['keep']
+            others = ", ".join(f"{row['path']} ({row['width']}x{row['height']})" for row in entry['resized'])
+            print(f"  📏 {keep['path']} ({keep['width']}x{keep['height']}) ↔ {others}")
+        if len(resized) > limit:
+            print(f"  ... 및 {len(resized) - limit}개 더")
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="지각 해시 기반 중복 렌더 탐지")
+    parser.add_argument("roots", nargs="*", default=DEFAULT_ROOTS, help="검사할 폴더")
+    parser.add_argument("--threshold", type=int, default=DEFAULT_THRESHOLD,
+                        help="같은 모양으로 볼 최대 해밍 거리 (0-256)")
+    parser.add_argument("--color-tolerance", type=float, default=DEFAULT_COLOR_TOLERANCE,
+                        help="같은 색으로 볼 제품 평균색 최대 RGB 거리")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="이미지 로딩 프로세스 수")
+    parser.add_argument("--db", default=DB_FILE, help="이미지 색인 DB 경로")
+    parser.add_argument("--json", help="결과를 저장할 JSON 경로")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if not HAS_IMAGING:
+        print("⚠️ NumPy 와 Pillow 가 필요합니다: pip install numpy pillow")
+        return
+
+    print("🔍 지각 해시 중복 탐지 시작")
+    started = time.perf_counter()
+    roots = [os.path.normpath(root) for root in args.roots]
+
+    with AssetIndex(args.db) as index:
+        probe_tree(index, roots)
+        rows = [row for root in roots for row in index.query(root=root) if row['sha256']]
+        signatures = compute_hashes(index, rows, args.workers)
+
+    print(f"🖼️ 이미지 {len(rows)}개, 고유 내용 {len(signatures)}개")
+    clusters, resized = build_report(rows, signatures, args.threshold, args.color_tolerance)
+    print_report(clusters, resized)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'clusters': [{'keep': c['keep']['path'], 'duplicates': [r['path'] for r in c['duplicates']],
+                              'bytes': c['bytes']} for c in clusters],
+                'resized': [{'keep': e['keep']['path'], 'resized': [r['path'] for r in e['resized']]}
+                            for e in resized],
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n📁 결과 저장: {args.json}")
+
+    print(f"⏱️ 소요 시간: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+이미지 / 데이터 파이프라인 실행기 (extract → download → organise → codegen / variants → check)
+각 단계(스크립트)의 입력 / 출력 경로를 선언해 두고, 경로가 겹치는 단계끼리 의존 관계(DAG)를 만들어 실행
+
+- make 처럼 입력이 바뀌지 않은 단계는 건너뜀
+  입력 지문 = 명령 + 입력 파일들의 내용 해시 (+ 스크립트와 스크립트가 import 하는 scripts/ 모듈)
+  파일 해시는 크기 / mtime 이 같으면 다시 읽지 않음 → 아무것도 안 바뀐 실행은 stat 만 함
+- 출력도 지문을 남겨, 출력이 지워지거나 밖에서 바뀌었으면 다시 실행
+- 내용 기준이라 앞 단계가 다시 돌아도 결과가 같으면 뒤 단계는 건너뜀
+- 의존 관계가 없는 단계(codegen / variants)는 동시에 실행
+  download / organise 는 같은 main / hover / colors 폴더에 쓰므로 organise 가 다운로드 매니페스트를 입력으로 받아 뒤에 실행
+- 출력 폴더를 같이 쓰는 단계는 뒤 단계가 바꾼 내용까지 앞 단계의 출력 지문에 반영 (다음 실행에서 다시 돌지 않게)
+- 실패한 단계 뒤의 단계는 실행하지 않음, 종료 코드 1
+
+- --quiet / --metrics / --profile 은 각 단계 스크립트에도 전달 (instrumentation.py)
+
+사용법: python scripts/pipeline.py [단계 ...] [--skip download] [--force] [--dry-run] [--jobs N]
+        (단계를 지정하면 그 단계와 앞 단계만 실행)
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import NamedTuple
+
+import instrumentation
+
+# 경로 설정 (저장소 루트에서 실행)
+SCRIPTS_DIR = "scripts"
+STATE_FILE = ".cache/pipeline-state.json"
+SOURCE_DIR = r"C:\Users\apf_temp_admin\Desktop\Bookcases, Bookshelves - modern, large or small - Tylko_files"
+IMAGE_ROOT = "public/images/products/v2"
+IMAGE_DIRS = [f"{IMAGE_ROOT}/main", f"{IMAGE_ROOT}/hover", f"{IMAGE_ROOT}/colors"]
+DOWNLOAD_MANIFEST = ".cache/image-download-manifest.json"
+PLACED_MANIFEST = ".cache/reorganize-placed.json"
+
+STATE_VERSION = 1
+SKIP_DIRS = {'__pycache__', 'node_modules', '.next'}
+
+
+class Stage(NamedTuple):
+    name: str
+    command: list       # scripts/ 기준 스크립트 + 인자
+    inputs: list        # 파일 / 폴더 (저장소 루트 기준 또는 절대 경로)
+    outputs: list
+    description: str
+
+
+STAGES = [
+    Stage("extract", ["extract-complete-mapping.py", "product-v2-example.txt"],
+          ["product-v2-example.txt"], ["extracted-mappings.json"],
+          "HTML → 제품-이미지 매핑 추출"),
+    Stage("download", ["image_downloader.py"],
+          ["extracted-mappings.json", "src/data/realImageMappings.ts", "product-v2-example.txt"],
+          [DOWNLOAD_MANIFEST, *IMAGE_DIRS],
+          "원격 이미지 다운로드"),
+    # 다운로드 매니페스트가 입력이라 download 뒤에 실행 (받은 파일은 계획에 제자리 항목으로 포함)
+    Stage("organise", ["reorganize-images.py"],
+          ["extracted-mappings.json", SOURCE_DIR, DOWNLOAD_MANIFEST], [*IMAGE_DIRS, PLACED_MANIFEST],
+          "이미지를 main / hover / colors 로 재배치"),
+    Stage("codegen", ["generate_products_data.py"],
+          ["extracted-mappings.json", "color-swatches.json", *IMAGE_DIRS], ["src/data/generated/productImages.ts"],
+          "ProductV2 이미지 데이터 모듈 생성"),
+    Stage("variants", ["responsive_variants.py"],
+          IMAGE_DIRS, ["public/images/variants"],
+          "반응형 WebP / AVIF 변형 생성"),
+    Stage("check", ["check_syntax.py", "src"],
+          ["src"], [],
+          "src 구문 짝 검사"),
+]
+
+_print_lock = threading.Lock()
+
+
+def log(message):
+    """여러 단계가 동시에 출력해도 줄이 섞이지 않게"""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def _overlaps(a, b):
+    """두 경로 중 하나가 다른 하나이거나 그 아래에 있으면 True"""
+    a, b = os.path.normpath(a), os.path.normpath(b)
+    return a == b or a.startswith(b + os.sep) or b.startswith(a + os.sep)
+
+
+def build_graph(stages):
+    """단계별 선행 단계 이름 집합 (앞 단계의 출력과 겹치는 입력이 있으면 의존)"""
+    graph = {}
+    for index, stage in enumerate(stages):
+        graph[stage.name] = {
+            other.name for other in stages[:index]
+            if any(_overlaps(path, output) for path in stage.inputs for output in other.outputs)
+        }
+    return graph
+
+
+def script_modules(script, scripts_dir=SCRIPTS_DIR):
+    """스크립트와 그 스크립트가 (재귀적으로) import 하는 scripts/ 안의 모듈 파일 목록"""
+    found = []
+    pending = [os.path.join(scripts_dir, script)]
+    while pending:
+        path = pending.pop()
+        if path in found or not os.path.isfile(path):
+            continue
+        found.append(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names = [node.module]
+            else:
+                continue
+            pending.extend(os.path.join(scripts_dir, name.split('.')[0] + ".py") for name in names)
+    return sorted(found)
+
+
+class Fingerprinter:
+    """파일 내용 해시 캐시 (크기 / mtime 이 같으면 저장된 해시 사용)"""
+
+    def __init__(self, files):
+        self.files = files      # 경로 → [크기, mtime_ns, sha256]
+        self.lock = threading.Lock()
+
+    def file_digest(self, path):
+        st = os.stat(path)
+        with self.lock:
+            known = self.files.get(path)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime_ns:
+            return known[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        sha = digest.hexdigest()
+        with self.lock:
+            self.files[path] = [st.st_size, st.st_mtime_ns, sha]
+        return sha
+
+    def _entries(self, path):
+        if os.path.isfile(path):
+            yield path, self.file_digest(path)
+        elif os.path.isdir(path):
+            for directory, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(name for name in dirnames if name not in SKIP_DIRS)
+                for name in sorted(filenames):
+                    file_path = os.path.join(directory, name)
+                    yield file_path, self.file_digest(file_path)
+        else:
+            yield path, "missing"
+
+    def paths(self, paths, extra=()):
+        """경로 목록 (폴더는 아래 모든 파일) → 지문"""
+        digest = hashlib.sha256()
+        for item in extra:
+            digest.update(f"{item}\n".encode('utf-8'))
+        for path in paths:
+            for file_path, sha in self._entries(os.path.normpath(path)):
+                digest.update(f"{file_path.replace(os.sep, '/')}\t{sha}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+
+def load_state(state_file):
+    """상태 파일 로드 (없거나 손상/버전 불일치면 빈 상태)"""
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}, "stages": {}}
+    if data.get("version") != STATE_VERSION:
+        return {"files": {}, "stages": {}}
+    return {"files": data.get("files", {}), "stages": data.get("stages", {})}
+
+
+def save_state(state_file, state):
+    """상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = Path(state_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({"version": STATE_VERSION, **state}, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def run_command(stage):
+    """단계 스크립트 실행 (출력은 [단계] 접두어로 한 줄씩) → 종료 코드"""
+    env = instrumentation.child_env(dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8"))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.abspath(SCRIPTS_DIR), env.get("PYTHONPATH")]))
+    command = [sys.executable, os.path.join(SCRIPTS_DIR, stage.command[0]), *stage.command[1:]]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               env=env, encoding='utf-8', errors='replace')
+    for line in process.stdout:
+        log(f"  [{stage.name}] {line.rstrip()}")
+    return process.wait()
+
+
+def select_stages(stages, graph, targets, skipped):
+    """지정한 단계와 그 앞 단계들 (targets 가 없으면 전체) - skipped 는 제외"""
+    names = {stage.name for stage in stages}
+    unknown = [name for name in [*targets, *skipped] if name not in names]
+    if unknown:
+        raise SystemExit(f"❌ 알 수 없는 단계: {', '.join(unknown)} (가능: {', '.join(sorted(names))})")
+
+    selected = set()
+    pending = list(targets or names)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(graph[name])
+    return [stage for stage in stages if stage.name in selected and stage.name not in skipped]
+
+
+def run_pipeline(stages, graph, state, jobs, force=False, dry_run=False):
+    """DAG 실행 → {단계: 'ran' / 'skipped' / 'failed' / 'blocked' / 'pending'}"""
+    fingerprints = Fingerprinter(state["files"])
+    stage_state = state["stages"]
+    by_name = {stage.name: stage for stage in stages}
+    status = {}
+
+    def process(stage):
+        scripts = script_modules(stage.command[0])
+        inputs = fingerprints.paths([*scripts, *stage.inputs], extra=stage.command)
+        outputs = fingerprints.paths(stage.outputs)
+        previous = stage_state.get(stage.name, {})
+        if not force and previous.get("inputs") == inputs and previous.get("outputs") == outputs:
+            return "skipped"
+        if dry_run:
+            return "pending"
+
+        log(f"▶️ {stage.name}: {stage.description}")
+        started = time.perf_counter()
+        with instrumentation.stage(stage.name):
+            code = run_command(stage)
+        elapsed = time.perf_counter() - started
+        missing = [path for path in stage.outputs if not os.path.exists(path)]
+        if code != 0 or missing:
+            reason = f"종료 코드 {code}" if code != 0 else f"출력 없음: {', '.join(missing)}"
+            log(f"❌ {stage.name} 실패 ({reason}, {elapsed:.1f}s)")
+            stage_state.pop(stage.name, None)
+            return "failed"
+
+        stage_state[stage.name] = {"inputs": inputs, "outputs": fingerprints.paths(stage.outputs)}
+        log(f"✅ {stage.name} 완료 ({elapsed:.1f}s)")
+        return "ran"
+
+    # 선택되지 않은 선행 단계는 이미 끝난 것으로 봄 (기존 출력 사용)
+    remaining = {stage.name: {dep for dep in graph[stage.name] if dep in by_name} for stage in stages}
+    running = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        while remaining or running:
+            for name in [name for name, deps in remaining.items() if not deps]:
+                del remaining[name]
+                running[executor.submit(process, by_name[name])] = name
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                status[name] = future.result()
+                if status[name] in ('failed', 'pending'):
+                    # 실패 / 미실행 단계 뒤는 실행하지 않음 (dry-run 에서는 실행 예정으로 표시)
+                    blocked = [other for other in remaining if _depends_on(other, name, graph)]
+                    for other in blocked:
+                        del remaining[other]
+                        status[other] = 'blocked' if status[name] == 'failed' else 'pending'
+                for deps in remaining.values():
+                    deps.discard(name)
+
+    if not dry_run:
+        refresh_shared_outputs(stages, status, stage_state, fingerprints)
+    return status
+
+
+def refresh_shared_outputs(stages, status, stage_state, fingerprints):
+    """출력 경로가 겹치는 다른 단계가 이번에 실행됐으면 출력 지문을 현재 상태로 갱신
+
+    download 뒤에 organise 가 같은 폴더를 바꾸면 download 의 기록된 출력 지문이 달라져
+    다음 실행에서 download 가 다시 돌기 때문 (이번 실행이 만든 결과이므로 바뀐 것이 아님)
+    """
+    ran = [stage for stage in stages if status.get(stage.name) == 'ran']
+    for stage in stages:
+        if status.get(stage.name) not in ('ran', 'skipped') or stage.name not in stage_state:
+            continue
+        if any(other.name != stage.name and
+               any(_overlaps(path, output) for path in stage.outputs for output in other.outputs)
+               for other in ran):
+            stage_state[stage.name]["outputs"] = fingerprints.paths(stage.outputs)
+
+
+def _depends_on(name, ancestor, graph):
+    pending = list(graph[name])
+    while pending:
+        current = pending.pop()
+        if current == ancestor:
+            return True
+        pending.extend(graph[current])
+    return False
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="extract → download → organise → codegen / variants → check 파이프라인")
+    parser.add_argument("targets", nargs="*", help="실행할 단계 (앞 단계 포함, 기본: 전체)")
+    parser.add_argument("--skip", action="append", default=[], help="건너뛸 단계 (여러 번 지정 가능)")
+    parser.add_argument("--force", action="store_true", help="입력이 같아도 모두 다시 실행")
+    parser.add_argument("--dry-run", action="store_true", help="실행할 단계만 출력")
+    parser.add_argument("--jobs", type=int, default=2, help="동시에 실행할 단계 수")
+    parser.add_argument("--state", default=STATE_FILE, help="상태 파일 경로")
+    parser.add_argument("--list", action="store_true", help="단계와 의존 관계 출력")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    instrumentation.configure(args)
+    graph = build_graph(STAGES)
+
+    if args.list:
+        for stage in STAGES:
+            after = f" (← {', '.join(sorted(graph[stage.name]))})" if graph[stage.name] else ""
+            print(f"  📦 {stage.name:<9} {stage.description}{after}")
+        return
+
+    started = time.perf_counter()
+    stages = select_stages(STAGES, graph, args.targets, args.skip)
+    state = load_state(args.state)
+    status = run_pipeline(stages, graph, state, args.jobs, args.force, args.dry_run)
+    if not args.dry_run:
+        save_state(args.state, state)
+
+    marks = {'ran': "✅ 실행", 'skipped': "⏭️ 변경 없음", 'failed': "❌ 실패",
+             'blocked': "⛔ 앞 단계 실패", 'pending': "🔜 실행 예정"}
+    print("\n📊 파이프라인 결과")
+    for stage in stages:
+        print(f"  {marks[status[stage.name]]:<10} {stage.name}")
+    print(f"⏱️ 소요 시간: {time.perf_counter() - started:.2f}s")
+
+    if any(value in ('failed', 'blocked') for value in status.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tylko 제품 목록 HTML 스트리밍 파서
+HTML을 청크 단위로 읽으면서 <li data-testid="product-card"> 가 닫히는 즉시
+카드 하나씩 매핑 정보로 변환 (페이지 크기와 무관하게 메모리 사용량 일정)
+"""
+
+import glob
+import hashlib
+import re
+from pathlib import Path
+
+CARD_OPEN = '<li data-testid="product-card">'
+CHUNK_SIZE = 64 * 1024
+
+# 디렉토리 입력 시 읽어들일 저장된 페이지 확장자
+HTML_SUFFIXES = ('.html', '.htm', '.txt')
+
+# <li 다음에 올 수 있는 문자 (<link 등과 구분)
+_LI_NAME_END = (' ', '>', '/', '\t', '\n', '\r')
+
+
+def extract_filename_from_url(url):
+    """URL에서 파일명만 추출"""
+    return url.split('/')[-1]
+
+
+def _find_li_open(buffer, pos):
+    """pos 이후 첫 번째 <li 태그 위치 (없으면 -1)"""
+    while True:
+        idx = buffer.find('<li', pos)
+        if idx == -1 or idx + 3 >= len(buffer):
+            return idx
+        if buffer[idx + 3] in _LI_NAME_END:
+            return idx
+        pos = idx + 3
+
+
+def iter_card_html(fileobj, chunk_size=CHUNK_SIZE):
+    """파일 객체에서 제품 카드 HTML을 하나씩 yield
+
+    버퍼에는 현재 읽고 있는 카드와 청크 하나만 유지되며,
+    중첩된 <li> 는 깊이를 세어 올바른 닫는 태그에서 카드를 끊는다.
+    """
+    buffer = ''
+    start = -1   # 현재 카드 시작 위치 (-1 이면 카드 밖)
+    depth = 0
+    pos = 0
+
+    while True:
+        chunk = fileobj.read(chunk_size)
+        eof = not chunk
+        buffer += chunk
+
+        while True:
+            if start == -1:
+                idx = buffer.find(CARD_OPEN, pos)
+                if idx == -1:
+                    # 청크 경계에 걸친 여는 태그를 위해 꼬리만 남김
+                    keep = len(CARD_OPEN) - 1
+                    buffer = buffer[-keep:] if len(buffer) > keep else buffer
+                    pos = 0
+                    break
+                buffer = buffer[idx:]
+                start = 0
+                depth = 1
+                pos = len(CARD_OPEN)
+                continue
+
+            open_idx = _find_li_open(buffer, pos)
+            close_idx = buffer.find('</li>', pos)
+
+            if close_idx != -1 and (open_idx == -1 or close_idx < open_idx):
+                depth -= 1
+                pos = close_idx + len('</li>')
+                if depth == 0:
+                    yield buffer[start:pos]
+                    buffer = buffer[pos:]
+                    start = -1
+                    pos = 0
+                continue
+
+            if open_idx != -1 and open_idx + 3 >= len(buffer) and not eof:
+                # 태그 이름이 청크 경계에서 잘림 → 다음 청크 필요
+                pos = open_idx
+                break
+
+            if open_idx != -1:
+                depth += 1
+                pos = open_idx + 3
+                continue
+
+            # 청크 경계에 걸친 태그는 마지막 몇 글자 안에서 시작하므로 거기서부터 재탐색
+            pos = max(pos, len(buffer) - len('</li>') + 1)
+            break
+
+        if eof:
+            return
+
+
+# 카드 필드 테이블: (결과 키, data-testid, 추출 방식)
+#   src   - 같은 태그의 src 속성 파일명
+#   price - 태그 본문의 €가격 (정수)
+#   text  - 태그 본문 텍스트
+#   flag  - 해당 data-testid 존재 여부
+CARD_FIELDS = (
+    ("main_image", "product-card-image-instagrid", "src"),
+    ("hover_image", "product-card-image", "src"),
+    ("price", "product-card-price-discount", "price"),
+    ("original_price", "product-card-price", "price"),
+    ("dimensions", "product-card-furniture-size", "text"),
+    ("furniture_type", "product-card-furniture-type", "text"),
+    ("has_discount", "product-card-badge", "flag"),
+)
+
+# import 시 한 번만 컴파일: data-testid → (키, 방식)
+_FIELDS_BY_TESTID = {testid: (key, kind) for key, testid, kind in CARD_FIELDS}
+
+# 카드 한 번 훑기로 필요한 속성만 찾는 패턴
+# (선행 공백 리터럴 덕분에 정규식 엔진이 후보 위치만 빠르게 건너뜀)
+_CARD_ATTR_RE = re.compile(r' (data-testid|src|alt)="([^"]*)"')
+_PRICE_RE = re.compile(r'€(\d+)')
+
+
+def _empty_mapping():
+    """기본값으로 채운 매핑 (키 순서는 extracted-mappings.json 과 동일)"""
+    return {
+        "name": None,
+        "main_image": None,
+        "hover_image": None,
+        "color_thumbnails": [],
+        "price": None,
+        "original_price": None,
+        "dimensions": None,
+        "furniture_type": None,
+        "has_top_seller": False,
+        "has_discount": False,
+    }
+
+
+def _tag_text(card_html, pos):
+    """pos 가 속한 태그 바로 뒤의 본문 텍스트"""
+    tag_end = card_html.find('>', pos)
+    if tag_end == -1:
+        return ''
+    text_end = card_html.find('<', tag_end + 1)
+    return card_html[tag_end + 1:text_end if text_end != -1 else len(card_html)]
+
+
+def parse_product_card(card_html):
+    """제품 카드 HTML 하나에서 매핑 정보 추출 (이름이 없으면 None)
+
+    필드 테이블(CARD_FIELDS)을 기준으로 카드를 한 번만 선형으로 훑는다.
+    """
+    mapping = _empty_mapping()
+    last_src = None
+    last_src_end = -1
+
+    for match in _CARD_ATTR_RE.finditer(card_html):
+        attr, value = match.groups()
+
+        if attr == 'src':
+            last_src = value
+            last_src_end = match.end()
+            # 색상 섬네일들
+            if 'thumbnail' in value:
+                mapping["color_thumbnails"].append(extract_filename_from_url(value))
+            continue
+
+        if attr == 'alt':
+            # 제품 이름 (Bookcase 가 들어간 첫 번째 alt)
+            if mapping["name"] is None and 'Bookcase' in value:
+                mapping["name"] = value
+            continue
+
+        field = _FIELDS_BY_TESTID.get(value)
+        if field is None:
+            continue
+        key, kind = field
+
+        if kind == 'flag':
+            mapping[key] = True
+        elif mapping[key] is not None:
+            continue
+        elif kind == 'src':
+            # src 가 같은 태그 안에 있어야 함
+            if last_src is not None and card_html.find('>', last_src_end, match.start()) == -1:
+                mapping[key] = extract_filename_from_url(last_src)
+        elif kind == 'price':
+            price_match = _PRICE_RE.fullmatch(_tag_text(card_html, match.end()))
+            if price_match:
+                mapping[key] = int(price_match.group(1))
+        elif kind == 'text':
+            mapping[key] = _tag_text(card_html, match.end()).strip()
+
+    if mapping["name"] is None:
+        return None
+    mapping["has_top_seller"] = "Top seller" in card_html
+    return mapping
+
+
+def iter_product_mappings(fileobj, chunk_size=CHUNK_SIZE):
+    """카드가 닫히는 즉시 제품 매핑을 하나씩 yield (이름 없는 카드는 건너뜀)"""
+    for card_html in iter_card_html(fileobj, chunk_size):
+        mapping = parse_product_card(card_html)
+        if mapping is not None:
+            yield mapping
+
+
+def card_digest(card_html):
+    """카드 HTML 내용 해시 (증분 추출 캐시 키)"""
+    return hashlib.sha256(card_html.encode('utf-8')).hexdigest()
+
+
+def iter_cached_cards(fileobj, cache, chunk_size=CHUNK_SIZE):
+    """(카드 해시, 매핑, 캐시 적중 여부) 를 하나씩 yield
+
+    cache 에 해시가 있는 카드는 파싱하지 않고 저장된 매핑(이름 없는 카드는 None)을 재사용한다.
+    """
+    for card_html in iter_card_html(fileobj, chunk_size):
+        digest = card_digest(card_html)
+        if digest in cache:
+            yield digest, cache[digest], True
+        else:
+            yield digest, parse_product_card(card_html), False
+
+
+# 프로세스 풀 워커별 카드 캐시 (init_worker_cache 로 한 번만 전달)
+_worker_cache = {}
+
+
+def init_worker_cache(cache):
+    """ProcessPoolExecutor initializer: 워커에 카드 캐시 설치"""
+    global _worker_cache
+    _worker_cache = cache
+
+
+def extract_html_file(html_file):
+    """HTML 파일 하나에서 (파일 경로, [(카드 해시, 매핑, 캐시 적중 여부), ...]) 추출
+
+    프로세스 풀 작업 단위이며, 워커에 설치된 카드 캐시를 사용한다.
+    """
+    with open(html_file, 'r', encoding='utf-8') as f:
+        cards = list(iter_cached_cards(f, _worker_cache))
+    return str(html_file), cards
+
+
+def expand_html_inputs(inputs):
+    """파일 / 디렉토리 / glob 패턴 목록을 정렬된 HTML 파일 경로 목록으로 변환"""
+    files = []
+    seen = set()
+
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            matches = sorted(p for p in path.iterdir()
+                             if p.is_file() and p.suffix.lower() in HTML_SUFFIXES)
+        elif any(ch in item for ch in '*?['):
+            matches = sorted(Path(p) for p in glob.glob(item, recursive=True) if Path(p).is_file())
+        else:
+            matches = [path]
+
+        for match in matches:
+            key = match.resolve()
+            if key not in seen:
+                seen.add(key)
+                files.append(match)
+
+    return files
+
+
+def mapping_identity(mapping):
+    """중복 판정 키: 제품명 + 이미지 집합"""
+    images = frozenset(mapping["color_thumbnails"])
+    return mapping["name"], mapping["main_image"], mapping["hover_image"], images
+
+
+def dedupe_mappings(mappings):
+    """제품명과 이미지 집합이 같은 매핑 제거 (처음 나온 순서 유지)"""
+    seen = set()
+    unique = []
+    for mapping in mappings:
+        key = mapping_identity(mapping)
+        if key not in seen:
+            seen.add(key)
+            unique.append(mapping)
+    return unique
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+제품 슬러그 ↔ 추출된 카탈로그 항목 매칭
+이름을 한 번만 토큰화해 역색인(토큰 → 항목 번호)을 만들고,
+슬러그 × 항목 점수 행렬을 NumPy 행렬곱 한 번으로 계산한 뒤 1:1 최적 배정
+(NumPy 가 없으면 같은 점수 / 배정을 순수 파이썬으로 계산: 34개 규모라 충분히 빠름)
+
+- 토큰: 소문자 영숫자 단위, 동의어 표(SYNONYMS)로 정규화, 불용어(STOPWORDS) 제외
+- 점수: IDF 가중 재현율(슬러그 토큰이 이름에 얼마나 있나) 과 정밀도(이름에 남는 토큰이 적은가) 의 가중 평균
+  (흔한 토큰보다 드문 토큰이 더 중요, 슬러그에 없는 토큰이 붙은 이름보다 빠진 토큰이 더 큰 감점)
+- 배정: 점수 합이 최대인 1:1 배정 (SciPy 가 있으면 linear_sum_assignment, 없으면 헝가리안 알고리즘)
+  → 두 슬러그가 같은 항목을 가져가지 않음
+- 점수가 MIN_SCORE 미만인 배정은 매칭 실패로 처리
+
+사용법: python scripts/product_matcher.py [extracted-mappings.json]
+"""
+
+import json
+import math
+import re
+import sys
+import time
+
+# NumPy 는 선택 사항: 없으면 역색인으로 점수를 구하고 순수 파이썬 헝가리안 알고리즘으로 배정
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# SciPy 는 선택 사항: 없으면 아래 헝가리안 알고리즘 사용
+try:
+    from scipy.optimize import linear_sum_assignment
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+MAPPING_JSON = "extracted-mappings.json"
+MIN_SCORE = 0.3
+RECALL_WEIGHT = 0.7
+
+# 표기가 다른 같은 뜻 → 대표 토큰 (beige 는 카탈로그에서 Sand 로 판매)
+SYNONYMS = {
+    'gray': 'grey',
+    'burgund': 'burgundy',
+    'door': 'doors',
+    'drawer': 'drawers',
+    'beige': 'sand',
+    'colour': 'color',
+}
+STOPWORDS = {'bookcase', 'in', 'with', 'and', 'effect', 'the', 'a'}
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def tokenize_name(text):
+    """제품명 / 슬러그 → 정규화된 토큰 튜플 (중복 제거, 순서 유지)"""
+    tokens = (SYNONYMS.get(word, word) for word in _WORD.findall(text.lower()))
+    return tuple(dict.fromkeys(token for token in tokens if token not in STOPWORDS))
+
+
+class TokenIndex:
+    """카탈로그 이름 역색인 (토큰 → 항목 번호 목록) 과 IDF 가중치"""
+
+    def __init__(self, names):
+        self.size = len(names)
+        self.vocabulary = {}
+        self.postings = []
+        for row, name in enumerate(names):
+            for token in tokenize_name(name):
+                column = self.vocabulary.setdefault(token, len(self.postings))
+                if column == len(self.postings):
+                    self.postings.append([])
+                self.postings[column].append(row)
+        self.weight_list = [math.log1p(self.size / max(len(rows), 1)) for rows in self.postings]
+        if not HAS_NUMPY:
+            return
+
+        # 역색인으로 (항목, 토큰) 0/1 행렬 구성
+        self.incidence = np.zeros((self.size, len(self.postings)), dtype=np.float32)
+        for column, rows in enumerate(self.postings):
+            self.incidence[rows, column] = 1.0
+        frequency = np.array([len(rows) for rows in self.postings], dtype=np.float32)
+        self.weights = np.log1p(self.size / np.maximum(frequency, 1.0)).astype(np.float32)
+
+    def query_matrix(self, texts):
+        """질의 목록 → (질의, 토큰) 0/1 행렬 (카탈로그에 없는 토큰은 정보가 없으므로 무시)"""
+        matrix = np.zeros((len(texts), len(self.postings)), dtype=np.float32)
+        for row, text in enumerate(texts):
+            columns = [self.vocabulary[token] for token in tokenize_name(text) if token in self.vocabulary]
+            matrix[row, columns] = 1.0
+        return matrix
+
+    def score_matrix(self, texts):
+        """질의 × 카탈로그 항목 점수 행렬 (0 ~ 1, NumPy 가 없으면 리스트의 리스트)"""
+        if not HAS_NUMPY:
+            return self.score_lists(texts)
+        queries = self.query_matrix(texts) * self.weights
+        overlap = queries @ self.incidence.T
+        query_sizes = np.broadcast_to(queries.sum(axis=1)[:, None], overlap.shape)
+        item_sizes = np.broadcast_to((self.incidence @ self.weights)[None, :], overlap.shape)
+        recall = np.divide(overlap, query_sizes, out=np.zeros_like(overlap), where=query_sizes > 0)
+        precision = np.divide(overlap, item_sizes, out=np.zeros_like(overlap), where=item_sizes > 0)
+        return RECALL_WEIGHT * recall + (1 - RECALL_WEIGHT) * precision
+
+    def score_lists(self, texts):
+        """score_matrix 의 순수 파이썬 버전 (질의 토큰의 역색인 목록만 훑어 겹침을 누적)"""
+        item_sizes = [0.0] * self.size
+        for column, rows in enumerate(self.postings):
+            for row in rows:
+                item_sizes[row] += self.weight_list[column]
+
+        matrix = []
+        for text in texts:
+            columns = [self.vocabulary[token] for token in tokenize_name(text) if token in self.vocabulary]
+            query_size = sum(self.weight_list[column] for column in columns)
+            overlap = [0.0] * self.size
+            for column in columns:
+                for row in self.postings[column]:
+                    overlap[row] += self.weight_list[column]
+            matrix.append([
+                RECALL_WEIGHT * (shared / query_size if query_size > 0 else 0.0)
+                + (1 - RECALL_WEIGHT) * (shared / item_size if item_size > 0 else 0.0)
+                for shared, item_size in zip(overlap, item_sizes)
+            ])
+        return matrix
+
+
+def _hungarian(cost):
+    """직사각 비용 행렬 (행 ≤ 열) 최소 비용 배정 → 행별 열 번호 배열
+
+    열 방향 갱신을 NumPy 로 한 번에 처리 (O(행² × 열) 이지만 안쪽 반복은 벡터 연산)
+    """
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=np.int64)     # 열 → 배정된 행 (1부터, 0 은 없음)
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for row in range(1, n + 1):
+        owner[0] = row
+        column = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[column] = True
+            current = owner[column]
+            free = ~used[1:]
+            reduced = cost[current - 1] - u[current] - v[1:]
+            better = free & (reduced < minv[1:])
+            minv[1:][better] = reduced[better]
+            way[1:][better] = column
+            candidates = np.where(free, minv[1:], np.inf)
+            next_column = int(np.argmin(candidates)) + 1
+            delta = candidates[next_column - 1]
+            used_columns = np.flatnonzero(used)
+            u[owner[used_columns]] += delta
+            v[used_columns] -= delta
+            minv[1:][free] -= delta
+            column = next_column
+            if owner[column] == 0:
+                break
+        # 증가 경로를 따라 배정 갱신
+        while column:
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+
+    assignment = np.full(n, -1, dtype=np.int64)
+    columns = np.flatnonzero(owner[1:])
+    assignment[owner[columns + 1] - 1] = columns
+    return assignment
+
+
+def _hungarian_lists(cost):
+    """_hungarian 의 순수 파이썬 버전 (NumPy 없을 때, 비용은 리스트의 리스트)"""
+    n, m = len(cost), len(cost[0])
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    owner = [0] * (m + 1)
+    way = [0] * (m + 1)
+
+    for row in range(1, n + 1):
+        owner[0] = row
+        column = 0
+        minv = [math.inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[column] = True
+            current = owner[column]
+            delta, next_column = math.inf, 0
+            for j in range(1, m + 1):
+                if used[j]:
+                    continue
+                reduced = cost[current - 1][j - 1] - u[current] - v[j]
+                if reduced < minv[j]:
+                    minv[j] = reduced
+                    way[j] = column
+                if minv[j] < delta:
+                    delta, next_column = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            column = next_column
+            if owner[column] == 0:
+                break
+        while column:
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+
+    assignment = [-1] * n
+    for column in range(1, m + 1):
+        if owner[column]:
+            assignment[owner[column] - 1] = column - 1
+    return assignment
+
+
+def _assign_lists(scores):
+    """assign 의 순수 파이썬 버전 (리스트의 리스트 점수 행렬)"""
+    if not scores or not scores[0]:
+        return []
+    scores = [[value + column * 1e-9 for column, value in enumerate(row)] for row in scores]
+    transposed = len(scores) > len(scores[0])
+    if transposed:
+        scores = [list(column) for column in zip(*scores)]
+
+    top = max(max(row) for row in scores)
+    assignment = _hungarian_lists([[top - value for value in row] for row in scores])
+    pairs = [(row, column) for row, column in enumerate(assignment) if column >= 0]
+    return sorted((column, row) for row, column in pairs) if transposed else pairs
+
+
+def assign(scores):
+    """점수 행렬 → 점수 합이 최대인 1:1 배정 [(행, 열)]"""
+    if not HAS_NUMPY:
+        return _assign_lists(scores)
+    if scores.size == 0:
+        return []
+    # 동점이면 카탈로그 뒤쪽 항목을 고르도록 아주 작은 차이를 줌 (같은 이름이면 마지막 추출 항목, 실행마다 같은 결과)
+    scores = scores.astype(np.float64) + np.arange(scores.shape[1]) * 1e-9
+    transposed = scores.shape[0] > scores.shape[1]
+    if transposed:
+        scores = scores.T
+
+    if HAS_SCIPY:
+        rows, columns = linear_sum_assignment(scores, maximize=True)
+        pairs = list(zip(rows.tolist(), columns.tolist()))
+    else:
+        assignment = _hungarian(scores.max() - scores)
+        pairs = [(row, int(column)) for row, column in enumerate(assignment) if column >= 0]
+
+    return sorted((column, row) for row, column in pairs) if transposed else pairs
+
+
+def match_products(slugs, names, min_score=MIN_SCORE):
+    """슬러그 목록 × 카탈로그 이름 목록 → {슬러그: (이름 번호 또는 None, 점수)}"""
+    result = {slug: (None, 0.0) for slug in slugs}
+    if not slugs or not names:
+        return result
+    scores = TokenIndex(names).score_matrix(slugs)
+    for row, column in assign(scores):
+        score = float(scores[row][column])
+        result[slugs[row]] = (column if score >= min_score else None, round(score, 3))
+    return result
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else MAPPING_JSON
+    with open(path, 'r', encoding='utf-8') as f:
+        names = [mapping['name'] for mapping in json.load(f)]
+
+    from generate_products_data import OUR_PRODUCTS_SLUGS
+
+    started = time.perf_counter()
+    matches = match_products(OUR_PRODUCTS_SLUGS, names)
+    elapsed = time.perf_counter() - started
+
+    print(f"🔗 슬러그 {len(OUR_PRODUCTS_SLUGS)}개 × 카탈로그 {len(names)}개 ({'SciPy' if HAS_SCIPY else '헝가리안'} 배정{'' if HAS_NUMPY else ', NumPy 없음'})")
+    for slug, (index, score) in matches.items():
+        if index is None:
+            print(f"  ❌ {slug:<36} 매칭 실패 (점수 {score})")
+        else:
+            print(f"  ✅ {slug:<36} → #{index:<3} {names[index]} (점수 {score})")
+    print(f"⏱️ 소요 시간: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,37 +3,77 @@
 """
 추출된 매핑 정보를 바탕으로 이미지를 단순화된 폴더 구조로 재배치
 /images/products/v2/main/, /images/products/v2/hover/, /images/products/v2/colors/
+
+삭제는 예전 제품별 폴더(bookcase-*)와 이 스크립트가 이전에 배치한 파일(PLACED_MANIFEST)만
+(다운로더 등이 같은 폴더에 둔 파일은 건드리지 않음)
+image_downloader.py 가 받은 파일(DOWNLOAD_MANIFEST)은 그대로 두는 항목으로 계획에 포함
 """
 
+import argparse
 import json
-import shutil
+import os
+import time
 from pathlib import Path
 
+from asset_index import AssetIndex
+from image_store import ImageStore
+import instrumentation
+from organize_engine import (
+    DEFAULT_WORKERS,
+    add_to_plan,
+    apply_sync,
+    diff_tree,
+    load_placed,
+    owned_files,
+    plan_item,
+    print_report,
+    print_sync_plan,
+    prune_empty_dirs,
+    save_placed,
+    scan_files,
+)
+from source_index import SourceIndex
+
 # 경로 설정
+PROJECT_ROOT = r"C:\Users\apf_temp_admin\Desktop\befunweb"
 MAPPING_JSON = r"C:\Users\apf_temp_admin\Desktop\befunweb\extracted-mappings.json"
 SOURCE_DIR = r"C:\Users\apf_temp_admin\Desktop\Bookcases, Bookshelves - modern, large or small - Tylko_files"
 TARGET_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\public\images\products\v2"
+STORE_DIR = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\image-store"
+ASSET_DB = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\asset-index.sqlite"
+PLACED_MANIFEST = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\reorganize-placed.json"
+# image_downloader.py 의 매니페스트 (경로는 PROJECT_ROOT 기준)
+DOWNLOAD_MANIFEST = r"C:\Users\apf_temp_admin\Desktop\befunweb\.cache\image-download-manifest.json"
+
+# 같은 이미지는 저장소에 한 번만 두고 제품 폴더에는 링크로 배치
+STORE = ImageStore(STORE_DIR)
+
+def legacy_product_dirs():
+    """예전 제품별 폴더들 (bookcase-*)"""
+    target_path = Path(TARGET_DIR)
+    if not target_path.is_dir():
+        return []
+    return [folder for folder in target_path.glob("bookcase-*") if folder.is_dir()]
+
+def simplified_dirs():
+    """단순 구조 폴더들"""
+    target_path = Path(TARGET_DIR)
+    return [target_path / "main", target_path / "hover", target_path / "colors"]
+
+def current_files(plan):
+    """동기화가 비교 / 삭제할 현재 파일: 예전 제품별 폴더 전체 + 단순 구조 폴더 중 이 스크립트의 파일"""
+    existing = owned_files(scan_files(simplified_dirs()), plan, load_placed(PLACED_MANIFEST))
+    existing.update(scan_files(legacy_product_dirs()))
+    return existing
 
 def create_simplified_structure():
     """단순화된 폴더 구조 생성"""
-    print("📁 단순화된 폴더 구조 생성 중...")
+    print("📁 단순화된 폴더 구조 확인 중...")
     
     target_path = Path(TARGET_DIR)
-    
-    # 기존 제품별 폴더들 삭제
-    for folder in target_path.glob("bookcase-*"):
-        if folder.is_dir():
-            print(f"  🗑️ 삭제: {folder.name}")
-            shutil.rmtree(folder)
-    
-    # 새로운 단순 구조 생성
-    (target_path / "main").mkdir(exist_ok=True)
-    (target_path / "hover").mkdir(exist_ok=True) 
-    (target_path / "colors").mkdir(exist_ok=True)
-    
-    print("  ✅ /main/ 폴더 생성")
-    print("  ✅ /hover/ 폴더 생성")
-    print("  ✅ /colors/ 폴더 생성")
+    for folder in ("main", "hover", "colors"):
+        (target_path / folder).mkdir(parents=True, exist_ok=True)
+        print(f"  ✅ /{folder}/ 폴더")
 
 def load_mapping_data():
     """JSON에서 매핑 데이터 로드"""
@@ -45,96 +85,115 @@ def load_mapping_data():
     print(f"  📦 로드된 제품: {len(mappings)}개")
     return mappings
 
-def copy_images_to_new_structure(mappings):
-    """새로운 구조로 이미지 복사"""
-    print("📸 새로운 구조로 이미지 복사 중...")
-    
-    source_path = Path(SOURCE_DIR)
+def downloaded_files():
+    """다운로더가 단순 구조 폴더에 받아 둔 파일 목록 (매니페스트가 없으면 빈 목록)"""
+    try:
+        with open(DOWNLOAD_MANIFEST, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return []
+    folders = {os.path.normcase(os.path.abspath(folder)) for folder in simplified_dirs()}
+    files = []
+    for entry in entries.values():
+        path = Path(entry['path'])
+        if not path.is_absolute():
+            path = Path(PROJECT_ROOT) / path
+        if os.path.normcase(os.path.abspath(path.parent)) in folders and path.is_file():
+            files.append(Path(TARGET_DIR) / path.parent.name / path.name)
+    return files
+
+def plan_new_structure(mappings, names):
+    """새로운 구조로의 복사 계획 작성 → (계획, 누락 파일 목록)
+
+    다운로더가 받은 파일은 제자리 항목(원본 = 대상)으로 넣어 변경 없음으로 남기고,
+    같은 대상은 원본 폴더에서 복사하지 않음 (다운로더 매니페스트와 내용이 계속 같도록)
+    """
     target_path = Path(TARGET_DIR)
-    
-    copied_main = 0
-    copied_hover = 0
-    copied_colors = 0
+    downloaded = downloaded_files()
+    plan = [plan_item(path, path, path.parent.name) for path in downloaded]
     missing_files = []
-    
-    for i, mapping in enumerate(mappings):
-        product_name = mapping['name']
-        print(f"\n📦 {i+1}/32: {product_name}")
-        
-        # 메인 이미지 복사
-        if mapping['main_image']:
-            main_src = source_path / mapping['main_image']
-            if main_src.exists():
-                main_dst = target_path / "main" / mapping['main_image']
-                shutil.copy2(main_src, main_dst)
-                print(f"  📸 메인: {mapping['main_image']}")
-                copied_main += 1
-            else:
-                print(f"  ❌ 메인 없음: {mapping['main_image']}")
-                missing_files.append(mapping['main_image'])
-        
-        # 호버 이미지 복사
-        if mapping['hover_image']:
-            hover_src = source_path / mapping['hover_image']
-            if hover_src.exists():
-                hover_dst = target_path / "hover" / mapping['hover_image']
-                shutil.copy2(hover_src, hover_dst)
-                print(f"  🎯 호버: {mapping['hover_image']}")
-                copied_hover += 1
-            else:
-                print(f"  ❌ 호버 없음: {mapping['hover_image']}")
-                missing_files.append(mapping['hover_image'])
+    skip = set(downloaded)
+    
+    for mapping in mappings:
+        # 메인 / 호버 이미지
+        for kind, key in (("main", 'main_image'), ("hover", 'hover_image')):
+            filename = mapping[key]
+            if filename and target_path / kind / filename not in skip:
+                add_to_plan(plan, missing_files, names, SOURCE_DIR, filename,
+                            target_path / kind / filename, kind)
         
-        # 색상 섬네일들 복사
-        colors_count = 0
+        # 색상 섬네일들
         for thumbnail in mapping['color_thumbnails']:
-            color_src = source_path / thumbnail
-            if color_src.exists():
-                color_dst = target_path / "colors" / thumbnail
-                shutil.copy2(color_src, color_dst)
-                colors_count += 1
-                copied_colors += 1
-            else:
-                missing_files.append(thumbnail)
-        
-        print(f"  🎨 색상: {colors_count}/{len(mapping['color_thumbnails'])}개")
+            if target_path / "colors" / thumbnail not in skip:
+                add_to_plan(plan, missing_files, names, SOURCE_DIR, thumbnail,
+                            target_path / "colors" / thumbnail, "colors")
     
-    return copied_main, copied_hover, copied_colors, missing_files
+    return plan, missing_files
+
+def sync_new_structure(mappings, dry_run=False, workers=DEFAULT_WORKERS):
+    """새로운 구조와 현재 폴더를 비교하여 달라진 파일만 복사 / 이동 / 삭제
+
+    예전 제품별 폴더의 파일과 이전에 배치했지만 계획에서 빠진 파일은 내용이 같으면 새 위치로 이동,
+    나머지는 삭제 (다른 도구가 둔 파일은 그대로)
+    → (결과 목록, 누락 파일 목록), dry_run 이면 계획만 출력하고 결과는 None
+    """
+    print("📸 새로운 구조와 현재 폴더 비교 중...")
+    
+    plan, missing_files = plan_new_structure(mappings, SourceIndex.scan(SOURCE_DIR))
+    # 해시는 이미지 색인에 저장된 값을 재사용 (크기 / mtime 이 바뀐 파일만 다시 계산)
+    with AssetIndex(ASSET_DB) as assets:
+        sync = diff_tree(plan, current_files(plan), assets.digest_of)
+    print_sync_plan(sync)
+    
+    if dry_run:
+        return None, missing_files
+    
+    create_simplified_structure()
+    results = apply_sync(sync, STORE.place, workers)
+    # 다음 실행에서 지워도 되는 파일 = 이번에 배치된 파일 (다운로더의 제자리 항목 제외)
+    save_placed(PLACED_MANIFEST, [item['dest'] for item in plan
+                                  if item['src'] != item['dest'] and item['dest'].exists()])
+    
+    removed = prune_empty_dirs(legacy_product_dirs())
+    if removed:
+        print(f"  🗑️ 빈 폴더 삭제: {removed}개")
+    return results, missing_files
 
-def generate_final_report(copied_main, copied_hover, copied_colors, missing_files):
+def generate_final_report(results, missing_files, elapsed):
     """최종 결과 리포트"""
     print("\n" + "=" * 70)
     print("📊 이미지 재배치 최종 리포트")
     print("=" * 70)
     
-    target_path = Path(TARGET_DIR)
-    
-    # 실제 파일 개수 확인
-    main_files = list((target_path / "main").glob("*"))
-    hover_files = list((target_path / "hover").glob("*"))
-    color_files = list((target_path / "colors").glob("*"))
+    # 실제 파일 개수 확인 (이미지 색인을 갱신한 뒤 조회)
+    with AssetIndex(ASSET_DB) as assets:
+        assets.refresh(TARGET_DIR)
+        counts = assets.counts_by_role(TARGET_DIR)
+    main_count, hover_count, color_count = counts['main'], counts['hover'], counts['colors']
     
-    print(f"📁 /main/ 폴더: {len(main_files)}개 파일")
-    print(f"📁 /hover/ 폴더: {len(hover_files)}개 파일")
-    print(f"📁 /colors/ 폴더: {len(color_files)}개 파일")
-    print(f"📊 총 복사된 파일: {len(main_files) + len(hover_files) + len(color_files)}개")
-    
-    if missing_files:
-        print(f"\n❌ 누락된 파일: {len(missing_files)}개")
-        for file in missing_files[:10]:  # 처음 10개만 표시
-            print(f"  - {file}")
-        if len(missing_files) > 10:
-            print(f"  ... 및 {len(missing_files) - 10}개 더")
+    print(f"📁 /main/ 폴더: {main_count}개 파일")
+    print(f"📁 /hover/ 폴더: {hover_count}개 파일")
+    print(f"📁 /colors/ 폴더: {color_count}개 파일")
+    print(f"📊 총 파일: {main_count + hover_count + color_count}개")
     
+    print_report(results, missing_files, elapsed)
     print(f"\n🎉 이미지 재배치 완료!")
-    print(f"✅ 메인 이미지: {copied_main}개")
-    print(f"✅ 호버 이미지: {copied_hover}개") 
-    print(f"✅ 색상 섬네일: {copied_colors}개")
     
-    return len(main_files), len(hover_files), len(color_files)
+    return main_count, hover_count, color_count
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="이미지를 단순화된 폴더 구조로 재배치")
+    parser.add_argument("--dry-run", action="store_true", help="동기화 계획만 출력하고 변경하지 않음")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 복사 스레드 수")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
 
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+    instrumentation.configure(args)
+    
     print("🚀 이미지 재배치 시작!")
     print("=" * 70)
     print("🎯 목표: 단순화된 폴더 구조로 전환")
@@ -142,19 +201,22 @@ def main():
     print("  📁 새로운: /main|hover|colors/ (모든 파일 통합)")
     
     try:
-        # 1. 새로운 폴더 구조 생성
-        create_simplified_structure()
-        
-        # 2. 매핑 데이터 로드
+        # 1. 매핑 데이터 로드
         mappings = load_mapping_data()
         
-        # 3. 이미지 복사
-        copied_main, copied_hover, copied_colors, missing = copy_images_to_new_structure(mappings)
+        # 2. 계획 출력 후 달라진 이미지만 동기화
+        started = time.perf_counter()
+        results, missing = sync_new_structure(mappings, args.dry_run, args.workers)
+        
+        if results is None:
+            print("\n🔍 dry-run: 계획만 출력하고 변경하지 않았습니다.")
+            return
         
-        # 4. 최종 리포트
+        # 3. 최종 리포트
         main_count, hover_count, color_count = generate_final_report(
-            copied_main, copied_hover, copied_colors, missing
+            results, missing, time.perf_counter() - started
         )
+        STORE.report()
         
         print("\n🎯 다음 단계:")
         print("1. ProductV2 데이터 파일 업데이트")
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+제품 이미지 반응형 변형 생성기
+정리된 public/images/products/v2 트리의 이미지를 너비 단계별 WebP / AVIF 로 줄여서
+public/images/variants/ 아래에 만들고, 프론트엔드가 읽을 manifest.json 작성
+
+- 원본 크기 / 해시는 이미지 색인(asset_index, image_probe) 에서 가져옴
+- 원본 해시와 설정이 manifest 와 같고 파일이 남아 있으면 건너뜀
+- 변환은 프로세스 풀에서 원본 하나당 한 번 열어 모든 단계를 생성
+
+사용법: python scripts/responsive_variants.py [--widths 320,640,960,1280,1920] [--formats webp,avif]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from asset_index import AssetIndex
+from image_probe import probe_tree
+import instrumentation
+from instrumentation import stage
+
+# Pillow 는 선택 사항: 없으면 계획만 출력하고 종료
+try:
+    from PIL import Image
+    Image.init()
+    HAS_PILLOW = True
+except ImportError:
+    HAS_PILLOW = False
+
+# 경로 설정 (저장소 루트에서 실행)
+PUBLIC_DIR = "public"
+SOURCE_ROOT = "public/images/products/v2"
+OUTPUT_ROOT = "public/images/variants"
+MANIFEST_FILE = "public/images/variants/manifest.json"
+DB_FILE = ".cache/asset-index.sqlite"
+
+DEFAULT_WIDTHS = (320, 640, 960, 1280, 1920)
+DEFAULT_FORMATS = ('webp', 'avif')
+QUALITY = {'webp': 80, 'avif': 55}
+MANIFEST_VERSION = 1
+
+
+def public_url(path):
+    """public/ 아래 파일 경로 → '/images/...' URL"""
+    return '/' + Path(os.path.relpath(path, PUBLIC_DIR)).as_posix()
+
+
+def ladder_for(width, widths):
+    """원본보다 작은 단계만 사용 (원본이 가장 작은 단계보다 작으면 원본 너비 하나)"""
+    steps = [w for w in sorted(set(widths)) if w < width]
+    return steps or [width]
+
+
+def settings_key(widths, formats):
+    """변형 설정 지문 (단계 / 형식 / 품질이 바뀌면 다시 생성)"""
+    text = json.dumps({'widths': sorted(widths), 'formats': list(formats),
+                       'quality': {f: QUALITY[f] for f in formats}}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def variant_path(source, width, fmt):
+    """원본 경로 + 너비 + 형식 → 변형 파일 경로"""
+    relative = Path(os.path.relpath(source, SOURCE_ROOT))
+    return Path(OUTPUT_ROOT) / relative.parent / f"{relative.stem}-{width}w.{fmt}"
+
+
+def load_manifest(manifest_file=MANIFEST_FILE):
+    """이전 manifest 로드 (없거나 손상/버전 불일치면 빈 manifest)"""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != MANIFEST_VERSION:
+        return {}
+    return data.get('images', {})
+
+
+def save_manifest(images, manifest_file=MANIFEST_FILE):
+    """manifest 저장 (내용이 같으면 쓰지 않음) → 저장 여부"""
+    text = json.dumps({'version': MANIFEST_VERSION, 'images': images}, ensure_ascii=False, indent=2)
+    path = Path(manifest_file)
+    try:
+        if path.read_text(encoding='utf-8') == text:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
+    return True
+
+
+def plan_variants(rows, previous, widths, formats, settings):
+    """생성 작업 목록과 그대로 쓸 manifest 항목 → (작업 목록, 유지 항목)"""
+    tasks, kept = [], {}
+    for row in rows:
+        if row['width'] is None or row['sha256'] is None:
+            continue
+        url = public_url(row['path'])
+        entry = previous.get(url)
+        if (entry and entry.get('sha256') == row['sha256'] and entry.get('settings') == settings
+                and all(os.path.exists(Path(PUBLIC_DIR) / v['src'].lstrip('/')) for v in entry['variants'])):
+            kept[url] = entry
+            continue
+
+        specs = [(width, fmt, str(variant_path(row['path'], width, fmt)), QUALITY[fmt])
+                 for width in ladder_for(row['width'], widths) for fmt in formats]
+        tasks.append({'url': url, 'path': row['path'], 'sha256': row['sha256'],
+                      'width': row['width'], 'height': row['height'], 'specs': specs})
+    return tasks, kept
+
+
+def render_variants(task):
+    """원본 하나를 열어 모든 변형 저장 (프로세스 풀 작업) → manifest 항목"""
+    variants = []
+    with Image.open(task['path']) as image:
+        image.load()
+        # 팔레트(P) / 색상 키 투명도는 밴드에 'A' 가 없고 info['transparency'] 로만 표시됨
+        mode = 'RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB'
+        if image.mode != mode:
+            image = image.convert(mode)
+
+        for width, fmt, out_path, quality in task['specs']:
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            out = Path(out_path)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            tmp = out.with_name(f".{out.name}.{os.getpid()}.tmp")
+            resized.save(tmp, format=fmt.upper(), quality=quality)
+            os.replace(tmp, out)
+            variants.append({'src': public_url(out), 'width': width, 'height': height,
+                             'format': fmt, 'bytes': out.stat().st_size})
+
+    return {'sha256': task['sha256'], 'width': task['width'], 'height': task['height'],
+            'variants': variants}
+
+
+def remove_stale_variants(previous, images):
+    """manifest 에서 빠진 변형 파일 삭제 → 삭제 수"""
+    current = {v['src'] for entry in images.values() for v in entry['variants']}
+    removed = 0
+    for entry in previous.values():
+        for variant in entry['variants']:
+            if variant['src'] not in current:
+                try:
+                    os.remove(Path(PUBLIC_DIR) / variant['src'].lstrip('/'))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+    return removed
+
+
+def parse_list(text, cast=str):
+    return tuple(cast(item) for item in text.split(',') if item.strip())
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="제품 이미지 반응형 WebP / AVIF 변형 생성")
+    parser.add_argument("--widths", default=",".join(map(str, DEFAULT_WIDTHS)), help="너비 단계 (쉼표 구분)")
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS), help="출력 형식 (webp, avif)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="변환 프로세스 수")
+    parser.add_argument("--db", default=DB_FILE, help="이미지 색인 DB 경로")
+    instrumentation.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    instrumentation.configure(args)
+    widths = parse_list(args.widths, int)
+    formats = parse_list(args.formats)
+
+    print("🖼️ 반응형 이미지 변형 생성 시작")
+    print(f"📂 원본: {SOURCE_ROOT} → {OUTPUT_ROOT}")
+    print(f"📏 너비: {', '.join(map(str, widths))} / 형식: {', '.join(formats)}")
+
+    if HAS_PILLOW:
+        unsupported = [fmt for fmt in formats if fmt.upper() not in Image.SAVE]
+        if unsupported:
+            print(f"⚠️ 이 Pillow 로는 저장할 수 없는 형식 제외: {', '.join(unsupported)}")
+            formats = tuple(fmt for fmt in formats if fmt not in unsupported)
+
+    unknown = [fmt for fmt in formats if fmt not in QUALITY]
+    if unknown or not formats:
+        print(f"❌ 지원하지 않는 형식: {', '.join(unknown) or '(없음)'}")
+        return
+
+    started = time.perf_counter()
+    source_root = os.path.normpath(SOURCE_ROOT)
+    with AssetIndex(args.db) as index:
+        probe_tree(index, [source_root])
+        rows = index.query(root=source_root)
+
+    settings = settings_key(widths, formats)
+    previous = load_manifest()
+    tasks, images = plan_variants(rows, previous, widths, formats, settings)
+    print(f"📋 원본 {len(rows)}개 중 생성 필요 {len(tasks)}개, 최신 {len(images)}개")
+
+    if tasks and not HAS_PILLOW:
+        print("⚠️ Pillow 가 설치되지 않아 변형을 만들 수 없습니다: pip install pillow")
+        return
+
+    failed = []
+    with stage("render_variants") as metrics:
+        metrics.cache(hits=len(images), misses=len(tasks))
+        if tasks:
+            with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(tasks)))) as executor:
+                futures = [(task, executor.submit(render_variants, task)) for task in tasks]
+                for task, future in futures:
+                    try:
+                        entry = future.result()
+                    except Exception as e:
+                        # 디코딩 폭탄 / 잘못된 값 / 풀 중단도 작업 하나의 실패로 기록하고 성공한 것은 manifest 에 저장
+                        failed.append((task['url'], e))
+                        continue
+                    entry['settings'] = settings
+                    images[task['url']] = entry
+                    metrics.add(files=1, bytes=sum(v['bytes'] for v in entry['variants']))
+        metrics.add(failed=len(failed))
+
+    images = dict(sorted(images.items()))
+    removed = remove_stale_variants(previous, images)
+    saved = save_manifest(images)
+
+    variants = [v for entry in images.values() for v in entry['variants']]
+    print(f"\n✅ 생성: {len(tasks) - len(failed)}개 원본, 전체 변형 {len(variants)}개 "
+          f"({sum(v['bytes'] for v in variants):,} bytes)")
+    if removed:
+        print(f"🗑️ 오래된 변형 삭제: {removed}개")
+    for url, error in failed:
+        print(f"❌ {url}: {error}")
+    print(f"📄 manifest: {MANIFEST_FILE} ({'갱신' if saved else '변경 없음'})")
+    print(f"⏱️ 소요 시간: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다운로드 공용 재시도 / 속도 제한 스케줄러
+- 지터가 들어간 지수 백오프 + Retry-After 헤더 준수
+- 호스트별 토큰 버킷 (429/503 이면 속도를 절반으로, 성공하면 조금씩 회복)
+- 5xx 가 연속되면 해당 호스트 요청을 잠시 끊는 서킷 브레이커
+
+서버가 건강할 때는 전혀 기다리지 않고, 필요한 만큼만 기다림
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+# 서버가 속도를 줄이라고 알려주는 상태 코드
+THROTTLE_STATUS = {429, 503}
+
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_RATE = 20.0          # 호스트별 초당 요청 수 (시작값이자 상한)
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_BURST = 20
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_COOLDOWN = 60.0
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """서킷 브레이커가 열려 있어 요청하지 않음"""
+
+
+def parse_retry_after(value, now=None):
+    """Retry-After 헤더(초 또는 HTTP 날짜) → 기다릴 초 (해석 불가면 None)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - now)
+
+
+class TokenBucket:
+    """적응형 토큰 버킷 (AIMD: 스로틀링이면 속도 절반, 성공하면 조금씩 증가)"""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, min_rate=DEFAULT_MIN_RATE,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._not_before = 0.0
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """토큰 하나 획득 → 실제로 기다린 초 (토큰이 있으면 0)"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._not_before and self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = max(self._not_before - now, (1 - self._tokens) / self.rate)
+            self._sleep(wait)
+            waited += wait
+
+    def pause(self, seconds):
+        """Retry-After 등으로 호스트 전체 요청을 seconds 동안 멈춤"""
+        with self._lock:
+            self._not_before = max(self._not_before, self._clock() + seconds)
+
+    def penalize(self):
+        """스로틀링 응답 → 속도 절반"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def reward(self):
+        """성공 응답 → 속도 조금 회복"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class CircuitBreaker:
+    """연속 5xx 가 threshold 번이면 cooldown 동안 요청 차단, 이후 한 번 시험 요청"""
+
+    def __init__(self, threshold=DEFAULT_BREAKER_THRESHOLD, cooldown=DEFAULT_BREAKER_COOLDOWN,
+                 clock=time.monotonic):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def allow(self):
+        """지금 요청해도 되는지 (열린 상태면 False, 쿨다운 후에는 한 번만 허용)"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._clock() - self._opened_at < self.cooldown or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._failures >= self.threshold:
+                self._opened_at = self._clock()
+
+
+class RetryScheduler:
+    """호스트별 토큰 버킷 + 서킷 브레이커 + 지수 백오프로 요청 함수를 실행"""
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, base_delay=DEFAULT_BASE_DELAY,
+                 max_delay=DEFAULT_MAX_DELAY, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                 breaker_threshold=DEFAULT_BREAKER_THRESHOLD,
+                 breaker_cooldown=DEFAULT_BREAKER_COOLDOWN,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate = rate
+        self.burst = burst
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._breakers = {}
+
+    def _host_state(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst,
+                                                  clock=self._clock, sleep=self._sleep)
+                self._breakers[host] = CircuitBreaker(self.breaker_threshold,
+                                                      self.breaker_cooldown, clock=self._clock)
+            return self._buckets[host], self._breakers[host]
+
+    def backoff(self, attempt):
+        """attempt 번째 실패 후 대기 시간 (full jitter 지수 백오프)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def call(self, url, request):
+        """request() 를 실행하고 일시적 오류면 재시도 → request() 의 반환값
+
+        request 는 실패 시 requests 예외(HTTPError 는 response 포함)를 던져야 한다.
+        """
+        bucket, breaker = self._host_state(url)
+
+        for attempt in range(1, self.max_attempts + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"서킷 브레이커 열림: {urlsplit(url).netloc}")
+            bucket.acquire()
+
+            try:
+                result = request()
+            except requests.exceptions.HTTPError as e:
+                response = e.response
+                status = response.status_code if response is not None else None
+                if status is not None and status >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if status not in RETRYABLE_STATUS or attempt == self.max_attempts:
+                    raise
+
+                delay = self.backoff(attempt)
+                if status in THROTTLE_STATUS:
+                    bucket.penalize()
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    if retry_after is not None:
+                        # 서버가 알려준 시간만큼 호스트 전체를 멈추고 그 이상은 기다리지 않음
+                        bucket.pause(min(retry_after, self.max_delay))
+                        delay = 0.0
+                self._sleep(delay)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError):
+                breaker.record_failure()
+                if attempt == self.max_attempts:
+                    raise
+                self._sleep(self.backoff(attempt))
+            else:
+                breaker.record_success()
+                bucket.reward()
+                return result
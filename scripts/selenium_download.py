@@ -1,84 +1,163 @@
 #!/usr/bin/env python3
-# Selenium을 사용한 우회 다운로드
+# Selenium을 사용한 우회 다운로드 (배치 모드)
+# 브라우저는 한 번만 띄워 쿠키/User-Agent 를 얻고, 실제 다운로드는 공유 세션으로 일괄 처리
+#
+# 사용법: python scripts/selenium_download.py [--urls urls.txt] [--no-browser] [--show-browser]
 
+import argparse
 import time
-import os
 from pathlib import Path
-import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 
-def setup_browser():
+from image_downloader import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_PER_HOST,
+    TARGET_DIR,
+    build_session,
+    collect_jobs,
+    download_all,
+    summarize,
+    url_filename,
+)
+
+# Selenium 은 선택 사항: 없으면 브라우저 없이 공유 세션만으로 다운로드
+try:
+    from selenium import webdriver
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+    HAS_SELENIUM = True
+except ImportError:
+    HAS_SELENIUM = False
+
+SITE_URL = "https://tylko.com"
+READY_TIMEOUT = 30
+# Cloudflare 챌린지 페이지 표시 문구
+CHALLENGE_MARKERS = ("Just a moment", "cf-challenge")
+
+
+def setup_browser(headless=True):
     """브라우저 설정"""
     chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless=new')
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
-    
+
     driver = webdriver.Chrome(options=chrome_options)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     return driver
 
-def download_with_selenium():
-    """Selenium으로 우회 다운로드"""
+
+def page_ready(driver):
+    """문서 로드가 끝났고 챌린지 페이지가 아닌지"""
+    if driver.execute_script("return document.readyState") != "complete":
+        return False
+    source = driver.page_source
+    return not any(marker in source for marker in CHALLENGE_MARKERS)
+
+
+def wait_until_ready(driver, timeout=READY_TIMEOUT):
+    """고정 sleep 대신 페이지가 준비될 때까지만 대기 → 준비되면 True"""
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.25).until(page_ready)
+        return True
+    except TimeoutException:
+        return False
+
+
+def session_from_browser(driver, pool_size=DEFAULT_CONCURRENCY):
+    """브라우저의 쿠키와 User-Agent 를 복사한 공유 세션 생성"""
+    session = build_session(pool_size=pool_size)
+    session.headers['User-Agent'] = driver.execute_script("return navigator.userAgent;")
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie['name'], cookie['value'],
+                            domain=cookie.get('domain'), path=cookie.get('path', '/'))
+    return session
+
+
+def browser_session(site_url=SITE_URL, headless=True, pool_size=DEFAULT_CONCURRENCY,
+                    timeout=READY_TIMEOUT):
+    """브라우저를 한 번 띄워 사이트를 방문하고 그 쿠키로 만든 세션 반환 (브라우저는 바로 종료)"""
     print("🤖 Selenium 브라우저 시작...")
-    
+    driver = setup_browser(headless)
     try:
-        driver = setup_browser()
-        
-        # Tylko.com 페이지 먼저 방문 (쿠키/세션 설정)
-        print("🌐 Tylko.com 방문 중...")
-        driver.get("https://tylko.com")
-        time.sleep(3)
-        
-        # 이미지 URL로 직접 이동
-        test_url = "https://media.tylko.com/media/catalogue/catalogue_entry/2024/02/unreal_render_tasks/unreal_50.webp"
-        print(f"📷 이미지 URL 접근: {test_url}")
-        driver.get(test_url)
-        time.sleep(2)
-        
-        # 페이지 소스 확인
-        if "Just a moment" in driver.page_source:
-            print("⏳ Cloudflare 챌린지 대기 중...")
-            time.sleep(10)
-        
-        # 쿠키 가져오기
-        cookies = driver.get_cookies()
-        session = requests.Session()
-        for cookie in cookies:
-            session.cookies.set(cookie['name'], cookie['value'])
-        
-        # 세션으로 다운로드 시도
-        headers = {
-            'User-Agent': driver.execute_script("return navigator.userAgent;"),
-            'Referer': 'https://tylko.com/'
-        }
-        
-        print("📥 세션으로 다운로드 시도...")
-        response = session.get(test_url, headers=headers)
-        print(f"응답 상태: {response.status_code}")
-        
-        if response.status_code == 200:
-            downloads_path = Path("downloads/test")
-            downloads_path.mkdir(parents=True, exist_ok=True)
-            
-            filepath = downloads_path / "selenium-test.webp"
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"✅ 성공! {filepath} ({len(response.content)} bytes)")
-        else:
-            print(f"❌ 여전히 실패: {response.status_code}")
-            
+        print(f"🌐 {site_url} 방문 중...")
+        driver.get(site_url)
+        if not wait_until_ready(driver, timeout):
+            print(f"⏳ {timeout}초 안에 페이지가 준비되지 않았습니다 (현재 쿠키로 계속)")
+        return session_from_browser(driver, pool_size)
+    finally:
         driver.quit()
-        
-    except Exception as e:
-        print(f"❌ 오류: {e}")
-        import traceback
-        traceback.print_exc()
+
+
+def download_with_selenium(jobs, site_url=SITE_URL, use_browser=True, headless=True,
+                           concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST,
+                           timeout=READY_TIMEOUT):
+    """Selenium으로 얻은 세션 하나로 작업 목록 전체를 우회 다운로드"""
+    pool_size = max(concurrency, per_host)
+    session = None
+
+    if use_browser and HAS_SELENIUM:
+        try:
+            session = browser_session(site_url, headless, pool_size, timeout)
+        except WebDriverException as e:
+            print(f"⚠️ 브라우저를 시작할 수 없습니다 (브라우저 없이 계속): {e.msg}")
+    elif use_browser:
+        print("⚠️ selenium 이 설치되지 않아 브라우저 없이 다운로드합니다.")
+
+    if session is None:
+        session = build_session(pool_size=pool_size)
+
+    print(f"📥 세션으로 {len(jobs)}개 다운로드 시도...")
+    return download_all(jobs, concurrency, per_host, session=session)
+
+
+def jobs_from_url_list(url_file, target_dir):
+    """한 줄에 URL 하나인 텍스트 파일 → 작업 목록"""
+    jobs = []
+    with open(url_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            url = line.strip()
+            if url and not url.startswith('#'):
+                jobs.append({'url': url, 'path': Path(target_dir) / url_filename(url),
+                             'type': 'download'})
+    return jobs
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Selenium 쿠키를 이용한 이미지 일괄 다운로드")
+    parser.add_argument("--urls", help="URL 목록 파일 (기본: realImageMappings.ts + extracted-mappings.json)")
+    parser.add_argument("--target", default=TARGET_DIR, help="저장 폴더")
+    parser.add_argument("--site", default=SITE_URL, help="쿠키를 얻기 위해 먼저 방문할 페이지")
+    parser.add_argument("--no-browser", action="store_true", help="브라우저 없이 세션만으로 다운로드")
+    parser.add_argument("--show-browser", action="store_true", help="브라우저 창 표시 (기본: headless)")
+    parser.add_argument("--timeout", type=float, default=READY_TIMEOUT, help="페이지 준비 대기 최대 초")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 다운로드 수")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.urls:
+        jobs = jobs_from_url_list(args.urls, args.target)
+    else:
+        jobs, _ = collect_jobs(target_dir=args.target)
+
+    if not jobs:
+        print("❌ 다운로드할 이미지가 없습니다.")
+        return
+
+    started = time.perf_counter()
+    results = download_with_selenium(jobs, args.site, use_browser=not args.no_browser,
+                                     headless=not args.show_browser,
+                                     concurrency=args.concurrency, timeout=args.timeout)
+    summarize(results, time.perf_counter() - started)
+
 
 if __name__ == "__main__":
-    download_with_selenium()
\ No newline at end of file
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다운로드 폴더 색인
+폴더를 한 번만 나열하여 파일명을 (렌더 id, 변형 접미사, 섬네일 여부, 확장자) 로 분해해 두고
+매핑 패턴 하나를 사전 조회 한 번으로 찾음
+
+    unreal_124137_uCmcm5n_thumbnail.webp → ('124137', 'uCmcm5n', True, 'webp')
+    unreal_50.webp                       → ('50', None, False, 'webp')
+    Living_room_08_...Bookcase.jpg       → unreal 형식이 아니면 이름으로만 색인
+"""
+
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+
+IMAGE_EXTENSIONS = ('.jpg', '.webp')
+# 메인 / 호버 후보에서 제외하는 파일명 조각
+SKIP_WORDS = ('icon', 'logo', 'banner')
+
+_UNREAL_RE = re.compile(
+    r'unreal_(?P<render>\d+)'
+    r'(?:_(?!thumbnail(?:\.|$))(?P<variant>[A-Za-z0-9]+))?'
+    r'(?P<thumbnail>_thumbnail)?'
+    r'(?:\.(?P<ext>\w+))?$',
+    re.IGNORECASE,
+)
+
+
+def parse_image_name(name):
+    """파일명(또는 확장자 없는 패턴) → (렌더 id, 변형, 섬네일 여부, 확장자), unreal 형식이 아니면 None"""
+    match = _UNREAL_RE.match(name)
+    if not match:
+        return None
+    ext = match.group('ext')
+    return (match.group('render'), match.group('variant'), bool(match.group('thumbnail')),
+            ext.lower() if ext else None)
+
+
+class SourceIndex:
+    """다운로드 폴더 한 번 나열로 만든 파일 색인"""
+
+    def __init__(self, directory, names=()):
+        self.directory = Path(directory)
+        self.paths = []
+        self._by_name = {}
+        self._by_lower = {}
+        # (렌더 id, 변형, 섬네일 여부) → [경로] (확장자만 다른 파일이 여럿일 수 있음)
+        self._by_key = defaultdict(list)
+        self._others = []
+
+        for name in sorted(names):
+            self._add(name)
+
+    @classmethod
+    def scan(cls, directory):
+        """폴더를 한 번 나열하여 색인 생성 (폴더가 없으면 빈 색인)"""
+        try:
+            with os.scandir(directory) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+        except FileNotFoundError:
+            names = []
+        return cls(directory, names)
+
+    def _add(self, name):
+        path = self.directory / name
+        self.paths.append(path)
+        self._by_name[name] = path
+        self._by_lower.setdefault(name.lower(), path)
+
+        key = parse_image_name(name)
+        if key is None:
+            self._others.append(path)
+        else:
+            self._by_key[key[:3]].append(path)
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __contains__(self, name):
+        """정확한 파일명 존재 여부 (organize_engine.add_to_plan 의 names 로 사용 가능)"""
+        return name in self._by_name
+
+    def has(self, name):
+        """대소문자 무시 파일명 존재 여부"""
+        return name.lower() in self._by_lower
+
+    def get(self, name):
+        """대소문자 무시 파일명 → 경로 (없으면 None)"""
+        return self._by_lower.get(name.lower())
+
+    def candidates(self, pattern):
+        """패턴에 해당하는 파일 목록
+
+        unreal 패턴은 (렌더 id, 변형, 섬네일 여부) 사전 조회, 확장자가 있으면 확장자까지 일치해야 함.
+        그 외 패턴은 정확한 파일명이면 그 파일, 아니면 unreal 형식이 아닌 파일들 중 이름에 패턴이 들어간 것.
+        """
+        key = parse_image_name(pattern)
+        if key is None:
+            exact = self._by_name.get(pattern)
+            if exact is not None:
+                return [exact]
+            return [path for path in self._others if pattern in path.name]
+
+        render, variant, is_thumbnail, ext = key
+        paths = self._by_key.get((render, variant, is_thumbnail), [])
+        if ext:
+            paths = [path for path in paths if path.suffix.lower() == f'.{ext}']
+        return paths
+
+    def find(self, pattern, exclude=()):
+        """패턴에 해당하는 첫 파일 (exclude 에 든 경로는 건너뜀, 없으면 None)"""
+        for path in self.candidates(pattern):
+            if path not in exclude:
+                return path
+        return None
+
+    def classify(self):
+        """메인(jpg) / 호버(섬네일이 아닌 webp) / 색상(섬네일 webp) 이미지 목록"""
+        main_images, hover_images, color_images = [], [], []
+        for path in self.paths:
+            suffix = path.suffix.lower()
+            if suffix not in IMAGE_EXTENSIONS:
+                continue
+            name = path.name.lower()
+            if suffix == '.webp' and 'thumbnail' in name:
+                color_images.append(path)
+            elif not any(skip in name for skip in SKIP_WORDS):
+                (main_images if suffix == '.jpg' else hover_images).append(path)
+        return main_images, hover_images, color_images
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+합성 카탈로그 / 이미지 폴더 생성기 (벤치마크용)
+product-v2-example.txt 와 같은 data-testid 구조의 Tylko 목록 HTML(제품 카드 N개)과
+브라우저가 저장한 것 같은 다운로드 폴더(자리표시 WebP / JPEG M개)를 만듦
+
+- 제품은 실제 페이지처럼 디자인(Edge / Original Classic / Original Modern ...) 단위로 생성
+  같은 디자인의 카드들은 색상 섬네일 목록을 공유하고, 카드마다 메인 / 호버 이미지는 따로 가짐
+- 파일명: unreal_<id>[_<접미사>]_thumbnail.webp / unreal_<id>[_<접미사>].webp /
+  Living_room_<nn>_living-room-Bookcase_<접미사>.jpg
+- 중간중간 제품 카드가 아닌 <li> (Configure yours 타일) 도 섞음
+- 같은 seed 면 항상 같은 결과, 정답 매핑은 catalogue.json 에 저장 (추출기 검증용)
+- 이미지는 Pillow 가 있으면 실제로 열리는 작은 이미지, 없으면 헤더만 맞춘 자리표시 파일
+
+사용법: python scripts/synthetic_catalogue.py 출력폴더 [--products 3400] [--images M] [--pages P] [--seed 0]
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Pillow 는 선택 사항: 없으면 헤더만 맞춘 자리표시 파일 생성
+try:
+    from PIL import Image
+    HAS_PILLOW = True
+except ImportError:
+    HAS_PILLOW = False
+
+LISTING_FILE = "listing.html"
+PAGES_DIR = "pages"
+DOWNLOADS_DIR = "downloads"
+CATALOGUE_JSON = "catalogue.json"
+
+MEDIA_URL = "https://media.tylko.com/media"
+RENDER_URL = f"{MEDIA_URL}/catalogue/catalogue_entry/2024/02/unreal_render_tasks"
+THUMBNAIL_URL = f"{MEDIA_URL}/catalogue/catalogue_entry/2025/03/catalogue/catalogue_entry/2024/02/unreal_render_tasks"
+GALLERY_URL = f"{MEDIA_URL}/gallery/furniture_image/2022/05"
+
+# 실제 목록 페이지의 제품 수 (벤치마크 배율의 기준)
+BASE_PRODUCTS = 34
+# 이 간격마다 제품 카드가 아닌 타일을 끼움
+PROMO_EVERY = 12
+# 디자인 하나에서 카드로 나오는 색상 수
+CARDS_PER_DESIGN = (1, 3)
+DISCOUNT_RATE = 0.9
+TOP_SELLER_RATE = 0.1
+# 다운로드 폴더에서 참조되지 않는 파일(아이콘, 다른 렌더 등) 비율 (--images 를 안 주었을 때)
+NOISE_RATIO = 0.25
+
+IMAGE_SIZE = 256
+THUMBNAIL_SIZE = (54, 68)
+
+# (가구 종류, 색상들, 렌더 id 범위, 변형 접미사 확률, 붙는 옵션들, 높이 소수점 여부)
+FAMILIES = (
+    ("Edge", ("White", "Sand", "Brown", "Black", "Grey", "Green", "Terracotta", "Blue"),
+     (120_000, 200_000), 1.0, ("", " with External Drawers"), True),
+    ("Original Classic", ("White", "Grey", "Black", "Moss Green", "Pink", "Yellow", "Burgund"),
+     (100, 1_100_000), 0.5, ("", " with Doors", " with Doors and Bottom Storage", " with Doors and Drawers"), False),
+    ("Original Modern", ("White", "Grey", "Black", "Premium Black", "Burgund", "Green", "Blue", "Moss Green",
+                         "Sand", "Pink", "Terracotta", "Yellow", "Red"),
+     (10, 30_000), 0.0, ("", " with Doors", " with Doors and Drawers"), False),
+    ("Edge", ("Light Wood Effect", "Dark Wood Effect"),
+     (154_000, 155_000), 1.0, ("", " with External Drawers"), True),
+)
+
+CARD_TEMPLATE = (
+    '<li data-testid="product-card"><figure class="flex flex-col h-full relative group/plp-product-card '
+    'transition-all basic-transition hover:shadow-plp-product-card bg-white" data-index="{index}" '
+    'preview="{hover_url}"><a href="/en-ot/furniture/bookcase/{product_id},j,{slug}" class="custom" '
+    'data-testid="product-card-link"><!--[--><!--]--><!--[--><div class="relative w-full overflow-hidden aspect-square">'
+    '<img src="{main_url}" alt="{name}" loading="eager" fetchpriority="high" class="object-cover absolute top-0 left-0" '
+    'style="min-width:calc(100% + 1px);" data-testid="product-card-image-instagrid">'
+    '<img src="{hover_url}" alt="{name}" loading="lazy" class="hidden absolute inset-0 duration-500 ease-in-out '
+    'opacity-0 transition-all z-1 transform scale-[1.04]" fetchpriority="low" style="min-width:calc(100% + 1px);" '
+    'data-testid="product-card-image">{badge}<!----><button class="outline-none ty-btn-icon configure-yours '
+    'ty-btn-icon--m ty-btn-filled ty-btn-filled--dark hover:bg-white absolute bottom-8 lg:bottom-16 left-1/2 '
+    'min-w-max -translate-x-1/2 translate-y-64 z-2"><!--[--><!--]--><!--[--> Configure yours<!--]--></button></div>'
+    '<!--]--><!--[--><!--]--></a><!----><div class="flex flex-col justify-between h-full md:mt-4">'
+    '<div class="tile-group overflow-hidden h-full"><section class="scroll-container relative flex gap-8" '
+    'data-testid="product-card-swatches" data-v-1e02a993=""><div class="px-8 md:px-16 min-w-full scroll-wrapper '
+    'gap-8 flex" data-v-1e02a993=""><!--[--><!--[-->{swatches}<!--]--><!--]--></div></section></div>'
+    '<a href="/en-ot/furniture/bookcase/{product_id},j,{slug}" class="custom flex flex-col flex-1 p-8 md:p-16" '
+    'data-index="{index}" data-testid="product-card-link"><!--[--><!--]--><!--[--><div class="flex flex-col flex-1">'
+    '{label}<p class="semibold-14 text-neutral-900" data-testid="product-card-furniture-type">{furniture_type}</p>'
+    '<h2 class="line-clamp-1 normal-14 md:mt-2 text-neutral-750" data-testid="product-card-furniture-description">'
+    '{name}</h2><!--[--><h3 class="normal-14 md:mt-2 text-neutral-750" data-testid="product-card-furniture-size">'
+    '{dimensions}</h3><!--]--></div><aside class="semibold-16 text-neutral-900 mt-8 md:mt-12 text-neutral-900">'
+    '<!--[-->{discount}<!--]--><span class="normal-16 line-through text-neutral-900" '
+    'data-testid="product-card-price">€{original_price}</span></aside><!--]--><!--[--><!--]--></a></div></figure></li>'
+)
+SWATCH_TEMPLATE = (
+    '<div class="flex flex-col relative cursor-pointer"><img class="block object-cover overflow-hidden border swatch '
+    'min-w-[40px] max-w-[40px] h-[50px] md:min-w-[54px] md:max-w-[54px] md:h-[68px] rounded-4 {border}" '
+    'loading="eager" src="{url}" fetchpriority="high"><!----></div>'
+)
+BADGE_TEMPLATE = (
+    '<div class="semibold-12 px-8 py-2 rounded-4 absolute top-8 left-8 md:top-12 md:left-16 z-2 flex py-2 px-8" '
+    'style="color:#FFFF66;background-color:#FF3C00;" data-testid="product-card-badge"><!--[-->-{percent}% '
+    '<span class="ml-4">&amp;</span><span class="ml-4">Free delivery</span><!--]--></div>'
+)
+LABEL_HTML = ('<p class="semibold-12 uppercase mb-8 md:mb-12 text-[#BE7958]" '
+              'data-testid="product-card-label">Top seller</p>')
+DISCOUNT_TEMPLATE = ('<span class="semibold-16 text-orange mr-4" '
+                     'data-testid="product-card-price-discount">€{price}</span>')
+PROMO_HTML = (
+    '<li><a rel="noopener noreferrer" target="_blank" class="custom relative w-full h-full flex flex-col '
+    'justify-between bg-[#FFEADB] pointer-events-none" data-section="plp-usp-configure-yours"><!--[--><!--]-->'
+    '<div class="p-8 pt-16 md:p-16"><p class="semibold-16">Make it yours</p></div><picture>'
+    '<img class="w-full" src="https://media.tylko.com/cloudinary/plp/breaks/customization/bookcase/regular/XLD.png" '
+    'alt="Customise yours" loading="lazy" fetchpriority="high"></picture><!--]--><!--[--><!--]--></a></li>'
+)
+PAGE_HEAD = ('<div id="plp" class="md-max:px-0 grid-container mt-12"><ul class="grid grid-cols-2 gap-8 md:gap-16 '
+             'lg:grid-cols-4" data-section="grid-v2-board"><!--[-->')
+PAGE_TAIL = '<!--]--></ul></div>'
+
+
+def _suffix(rng, length=7):
+    return ''.join(rng.choice(string.ascii_letters + string.digits) for _ in range(length))
+
+
+def _render_name(render_id, variant, thumbnail=False):
+    """unreal_<id>[_<변형>][_thumbnail].webp"""
+    return f"unreal_{render_id}{'_' + variant if variant else ''}{'_thumbnail' if thumbnail else ''}.webp"
+
+
+def _slugify(text):
+    return '-'.join(''.join(ch if ch.isalnum() else ' ' for ch in text.lower()).split())
+
+
+def make_catalogue(count, seed=0):
+    """제품 count 개 생성 → 카드 순서의 제품 목록 (정답 매핑 + HTML 렌더용 필드)"""
+    rng = random.Random(seed)
+    used_ids = set()
+    products = []
+
+    while len(products) < count:
+        furniture_type, colors, id_range, variant_rate, options, decimal_height = rng.choice(FAMILIES)
+        option = rng.choice(options)
+        width = rng.randrange(60, 330)
+        height = f"{rng.randrange(110, 280)}.8" if decimal_height else str(rng.randrange(80, 290))
+
+        # 디자인의 색상별 렌더 (카드 호버 이미지 / 색상 섬네일)
+        renders = []
+        for _ in colors:
+            render_id = rng.randrange(*id_range)
+            while render_id in used_ids:
+                render_id = rng.randrange(*id_range)
+            used_ids.add(render_id)
+            renders.append((render_id, _suffix(rng) if rng.random() < variant_rate else None))
+        thumbnails = [_render_name(render_id, variant, thumbnail=True) for render_id, variant in renders]
+
+        shown = rng.sample(range(len(colors)), min(len(colors), rng.randint(*CARDS_PER_DESIGN)))
+        for color_index in shown:
+            if len(products) >= count:
+                break
+            render_id, variant = renders[color_index]
+            name = f"Bookcase in {colors[color_index]}{option}"
+            original_price = rng.randrange(300, 3200)
+            has_discount = rng.random() < DISCOUNT_RATE
+            percent = rng.choice((20, 25, 30, 40))
+            products.append({
+                "name": name,
+                "main_image": f"Living_room_{rng.randrange(1, 40):02d}_living-room-Bookcase_{_suffix(rng)}.jpg",
+                "hover_image": _render_name(render_id, variant),
+                # 자기 색상이 첫 번째 섬네일
+                "color_thumbnails": [thumbnails[color_index]]
+                                    + [name for i, name in enumerate(thumbnails) if i != color_index],
+                "price": round(original_price * (100 - percent) / 100) if has_discount else None,
+                "original_price": original_price,
+                "dimensions": f"{width} x {height} cm",
+                "furniture_type": furniture_type,
+                "has_top_seller": rng.random() < TOP_SELLER_RATE,
+                "has_discount": has_discount,
+                "product_id": 3_000_000 + len(products),
+                "percent": percent,
+            })
+
+    return products
+
+
+def expected_mappings(products):
+    """추출기가 돌려줘야 하는 매핑 목록 (extracted-mappings.json 과 같은 키 / 순서)"""
+    keys = ("name", "main_image", "hover_image", "color_thumbnails", "price", "original_price",
+            "dimensions", "furniture_type", "has_top_seller", "has_discount")
+    return [{key: product[key] for key in keys} for product in products]
+
+
+def render_card(product, index):
+    """제품 하나 → <li data-testid="product-card"> HTML"""
+    swatches = ''.join(
+        SWATCH_TEMPLATE.format(url=f"{THUMBNAIL_URL}/{name}",
+                               border="border-neutral-900" if i == 0 else "border-transparent")
+        for i, name in enumerate(product["color_thumbnails"]))
+    return CARD_TEMPLATE.format(
+        index=index,
+        product_id=product["product_id"],
+        slug=_slugify(f"{product['name']} {product['dimensions']}"),
+        name=product["name"],
+        main_url=f"{GALLERY_URL}/{product['main_image']}",
+        hover_url=f"{RENDER_URL}/{product['hover_image']}",
+        badge=BADGE_TEMPLATE.format(percent=product["percent"]) if product["has_discount"] else '',
+        swatches=swatches,
+        label=LABEL_HTML if product["has_top_seller"] else '',
+        furniture_type=product["furniture_type"],
+        dimensions=product["dimensions"],
+        discount=DISCOUNT_TEMPLATE.format(price=product["price"]) if product["has_discount"] else '',
+        original_price=product["original_price"],
+    )
+
+
+def write_listing(path, products, start=0):
+    """목록 페이지 하나 저장 (카드 사이사이 타일 포함) → 파일 크기"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(PAGE_HEAD)
+        for offset, product in enumerate(products):
+            f.write(render_card(product, start + offset))
+            if (start + offset + 1) % PROMO_EVERY == 0:
+                f.write(PROMO_HTML)
+        f.write(PAGE_TAIL)
+    return path.stat().st_size
+
+
+def write_pages(directory, products, pages):
+    """제품을 pages 개 페이지로 나눠 저장 → 파일 경로 목록 (입력 순서 = 카드 순서)"""
+    per_page = -(-len(products) // max(1, pages))
+    paths = []
+    for page, start in enumerate(range(0, len(products), per_page), 1):
+        path = Path(directory) / f"listing-{page:03d}.html"
+        write_listing(path, products[start:start + per_page], start)
+        paths.append(path)
+    return paths
+
+
+def referenced_files(products):
+    """카탈로그가 참조하는 파일명 (처음 나온 순서, 중복 없음)"""
+    names = {}
+    for product in products:
+        for name in (product["main_image"], product["hover_image"], *product["color_thumbnails"]):
+            names.setdefault(name, None)
+    return list(names)
+
+
+def _noise_name(rng, used):
+    """참조되지 않는 다운로드 파일 이름 (다른 렌더, 거실 사진, 아이콘)"""
+    while True:
+        kind = rng.random()
+        if kind < 0.5:
+            name = _render_name(rng.randrange(200_000, 2_000_000), _suffix(rng) if rng.random() < 0.5 else None,
+                                thumbnail=rng.random() < 0.5)
+        elif kind < 0.8:
+            name = f"Living_room_{rng.randrange(1, 40):02d}_living-room-Bookcase_{_suffix(rng)}.jpg"
+        else:
+            name = f"icon_{_suffix(rng, 5).lower()}.svg"
+        if name not in used:
+            return name
+
+
+def _image_size(name, image_size):
+    return THUMBNAIL_SIZE if '_thumbnail' in name else (image_size, image_size)
+
+
+def _stub_image(name, size, rng):
+    """Pillow 없이 만드는 자리표시 (image_probe 가 읽는 헤더 + 무작위 본문)"""
+    width, height = size
+    payload = rng.randbytes(max(64, width * height // 8))
+    if name.endswith('.jpg'):
+        comment = payload[:65533]
+        return (b'\xff\xd8' + b'\xff\xfe' + struct.pack('>H', len(comment) + 2) + comment
+                + b'\xff\xc0' + struct.pack('>HBHHB', 17, 8, height, width, 3)
+                + b'\x01\x22\x00\x02\x11\x01\x03\x11\x01' + b'\xff\xd9')
+    # VP8L: 서명 0x2F 뒤에 (너비-1) | (높이-1) << 14
+    chunk = b'\x2f' + struct.pack('<I', (width - 1) | ((height - 1) << 14)) + payload
+    if len(chunk) % 2:
+        chunk += b'\x00'
+    return b'RIFF' + struct.pack('<I', 12 + len(chunk)) + b'WEBP' + b'VP8L' + struct.pack('<I', len(chunk)) + chunk
+
+
+def write_image(job):
+    """(경로, 크기, seed) → 파일 크기 (프로세스 풀 작업, seed 로 내용이 정해짐)"""
+    path, size, seed = job
+    rng = random.Random(seed)
+    name = os.path.basename(path)
+    if name.endswith('.svg'):
+        data = f'<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24"><!-- {seed} --></svg>'.encode()
+        with open(path, 'wb') as f:
+            f.write(data)
+        return len(data)
+    if not HAS_PILLOW:
+        data = _stub_image(name, size, rng)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return len(data)
+
+    # 단색 바탕 + 거친 무늬 (파일마다 내용이 달라 저장소에서 중복 제거되지 않음)
+    base = Image.new('RGB', size, tuple(rng.randrange(256) for _ in range(3)))
+    tile = Image.frombytes('RGB', (8, 8), rng.randbytes(8 * 8 * 3)).resize(size, Image.NEAREST)
+    image = Image.blend(base, tile, 0.3)
+    image.save(path, format='JPEG' if name.endswith('.jpg') else 'WEBP', quality=80)
+    return os.path.getsize(path)
+
+
+def write_download_folder(directory, products, total=None, seed=0, image_size=IMAGE_SIZE, workers=None):
+    """다운로드 폴더 생성 → (저장한 파일 수, 바이트 수, 빠진 참조 파일 목록)
+
+    total 이 참조 파일 수보다 적으면 일부 참조 파일이 빠진 폴더 (다운로드 누락 재현),
+    많으면 나머지는 참조되지 않는 파일로 채움
+    """
+    rng = random.Random(seed + 1)
+    referenced = referenced_files(products)
+    if total is None:
+        total = round(len(referenced) * (1 + NOISE_RATIO))
+
+    if total < len(referenced):
+        keep = set(rng.sample(range(len(referenced)), total))
+        names = [name for i, name in enumerate(referenced) if i in keep]
+        missing = [name for i, name in enumerate(referenced) if i not in keep]
+    else:
+        names = list(referenced)
+        missing = []
+        used = set(names)
+        while len(names) < total:
+            name = _noise_name(rng, used)
+            used.add(name)
+            names.append(name)
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    jobs = [(str(directory / name), _image_size(name, image_size), rng.getrandbits(64)) for name in names]
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 64:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            sizes = list(executor.map(write_image, jobs, chunksize=64))
+    else:
+        sizes = [write_image(job) for job in jobs]
+    return len(jobs), sum(sizes), missing
+
+
+def generate_corpus(directory, products, images=None, pages=1, seed=0, image_size=IMAGE_SIZE, workers=None):
+    """목록 HTML(한 파일 + 페이지들) / 다운로드 폴더 / 정답 JSON 생성 → 요약 dict"""
+    directory = Path(directory)
+    catalogue = make_catalogue(products, seed)
+    listing_bytes = write_listing(directory / LISTING_FILE, catalogue)
+    page_files = write_pages(directory / PAGES_DIR, catalogue, pages) if pages > 1 else []
+    files, image_bytes, missing = write_download_folder(directory / DOWNLOADS_DIR, catalogue, images, seed,
+                                                        image_size, workers)
+    with open(directory / CATALOGUE_JSON, 'w', encoding='utf-8') as f:
+        json.dump(expected_mappings(catalogue), f, ensure_ascii=False, indent=2)
+
+    return {
+        "products": len(catalogue),
+        "listing": str(directory / LISTING_FILE),
+        "listing_bytes": listing_bytes,
+        "pages": [str(path) for path in page_files],
+        "downloads": str(directory / DOWNLOADS_DIR),
+        "files": files,
+        "image_bytes": image_bytes,
+        "missing": missing,
+        "catalogue": str(directory / CATALOGUE_JSON),
+    }
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="합성 Tylko 목록 HTML + 다운로드 폴더 생성")
+    parser.add_argument("output", help="생성할 폴더")
+    parser.add_argument("--products", type=int, default=BASE_PRODUCTS, help="제품 카드 수")
+    parser.add_argument("--images", type=int, default=None,
+                        help=f"다운로드 폴더 파일 수 (기본: 참조 파일 + {NOISE_RATIO:.0%})")
+    parser.add_argument("--pages", type=int, default=1, help="목록을 나눠 저장할 페이지 수 (1 이면 한 파일만)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 seed (같으면 같은 결과)")
+    parser.add_argument("--image-size", type=int, default=IMAGE_SIZE, help="메인 / 호버 이미지 한 변 (px)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="이미지 생성 프로세스 수")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("🏭 합성 카탈로그 생성")
+    print(f"📦 제품 {args.products:,}개, 페이지 {args.pages}개, seed {args.seed}"
+          f"{'' if HAS_PILLOW else ' (Pillow 없음: 헤더만 맞춘 자리표시 파일)'}")
+    started = time.perf_counter()
+    summary = generate_corpus(args.output, args.products, args.images, args.pages, args.seed,
+                              args.image_size, args.workers)
+
+    print(f"📄 {summary['listing']} ({summary['listing_bytes']:,} bytes)")
+    if summary['pages']:
+        print(f"📄 페이지 {len(summary['pages'])}개: {Path(summary['pages'][0]).parent}")
+    print(f"🖼️ {summary['downloads']}: {summary['files']:,}개 ({summary['image_bytes']:,} bytes)"
+          f", 빠진 참조 파일 {len(summary['missing'])}개")
+    print(f"✅ 정답 매핑: {summary['catalogue']}")
+    print(f"⏱️ 소요 시간: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
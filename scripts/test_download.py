@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 # 테스트용 간단 다운로드 스크립트
 
-import requests
-import os
 from pathlib import Path
 
+from image_downloader import build_session
+
 def test_download():
     print("🧪 다운로드 테스트 시작...")
     
@@ -14,12 +14,9 @@ def test_download():
     try:
         print(f"📥 테스트 다운로드: {test_url}")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Referer': 'https://tylko.com/'
-        }
-        
-        response = requests.get(test_url, headers=headers, timeout=30)
+        # 다운로더와 같은 헤더/커넥션 풀 설정의 공유 세션 사용
+        session = build_session(pool_size=1)
+        response = session.get(test_url, timeout=30)
         print(f"응답 상태: {response.status_code}")
         print(f"응답 헤더: {dict(response.headers)}")
         
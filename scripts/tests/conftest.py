@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""scripts/ 의 모듈을 스크립트에서처럼 이름으로 import (python -m pytest scripts/tests)"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
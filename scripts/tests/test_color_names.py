@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""color_names: 빈 목록 / 열 수 없는 섬네일에서 동기화가 멈추지 않는지"""
+
+import pytest
+
+import color_names
+from asset_index import AssetIndex
+
+pytestmark = pytest.mark.skipif(not color_names.HAS_IMAGING, reason="NumPy / Pillow 필요")
+
+
+@pytest.fixture
+def index(tmp_path):
+    with AssetIndex(tmp_path / "index.sqlite") as index:
+        yield index
+
+
+def test_match_palette_empty():
+    assert color_names.match_palette([]) == []
+
+
+def test_name_thumbnails_undecodable(tmp_path, index):
+    broken = tmp_path / "unreal_1_thumbnail.webp"
+    broken.write_bytes(b"not an image")
+    assert color_names.name_thumbnails(index, [broken], workers=1) == {}
+
+
+def test_name_thumbnails_skips_only_undecodable(tmp_path, index):
+    from PIL import Image
+
+    good = tmp_path / "unreal_2_thumbnail.webp"
+    Image.new('RGB', (54, 68), (20, 20, 20)).save(good)
+    broken = tmp_path / "unreal_3_thumbnail.webp"
+    broken.write_bytes(b"not an image")
+
+    named = color_names.name_thumbnails(index, [good, broken], workers=1)
+    assert list(named) == [good]
+    assert named[good][0] == "black"
+
+
+def test_main_without_thumbnails(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["color_names.py", str(tmp_path / "nonexistent"),
+                                     "--db", str(tmp_path / "index.sqlite")])
+    color_names.main()
+    assert "대표색을 구할 섬네일이 없습니다" in capsys.readouterr().out
@@ -0,0 +1,36 @@
+import generate_products_data as codegen
+from generate_products_data import OUR_PRODUCTS_SLUGS, build_entries, positional_swatches, to_ts
+
+
+def mapping(name, thumbnails):
+    return {'name': name, 'main_image': 'main.webp', 'hover_image': 'hover.webp',
+            'color_thumbnails': thumbnails}
+
+
+def test_swatches_follow_colour_names_not_thumbnail_order(tmp_path):
+    slug = OUR_PRODUCTS_SLUGS[0]
+    swatches = {slug: {'White': 'white.webp', 'Brown': 'brown.webp'}}
+    mappings = [mapping("Bookcase in White with Doors", ['brown.webp', 'white.webp'])]
+
+    entries, _ = build_entries(mappings, image_root=tmp_path, swatches=swatches)
+
+    assert entries[slug]['colorSwatches'] == {'White': 'white.webp', 'Brown': 'brown.webp'}
+    assert entries[slug]['colorThumbnails'] == ['brown.webp', 'white.webp']
+
+
+def test_unassigned_product_falls_back_to_thumbnail_order(tmp_path):
+    slug = OUR_PRODUCTS_SLUGS[0]
+    mappings = [mapping("Bookcase in White with Doors", ['a.webp', 'b.webp'])]
+
+    entries, _ = build_entries(mappings, image_root=tmp_path)
+
+    assert entries[slug]['colorSwatches'] == positional_swatches(['a.webp', 'b.webp'])
+    assert entries[slug]['colorSwatches']['White'] == 'a.webp'
+    assert entries[slug]['colorSwatches']['Grey'] == 'b.webp'
+    assert entries[slug]['colorSwatches']['Beige'] == 'a.webp'
+    assert set(entries[slug]['colorSwatches']) == set(codegen.SWATCH_COLORS)
+
+
+def test_object_keys_are_quoted_when_not_identifiers():
+    assert to_ts({'width': 1, 'height': 2}) == "{ width: 1, height: 2 }"
+    assert "'Moss Green': 'x.webp'" in to_ts({'Moss Green': 'x.webp'})
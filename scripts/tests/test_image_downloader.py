@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""image_downloader.download_image: 로컬 HTTP 서버로 304 / 이어받기 / 검증 실패 확인"""
+import base64
+import hashlib
+import json
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from image_downloader import DownloadManifest, IncompleteDownload, _part_paths, build_session, download_image
+
+BODY = bytes(range(256)) * 1024  # CHUNK_SIZE 의 4배 (끊기기 전에 받은 청크가 임시 파일에 남도록)
+ETAG = f'"{hashlib.md5(BODY).hexdigest()}"'
+LAST_MODIFIED = formatdate(0, usegmt=True)
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    """경로별로 다르게 응답하는 이미지 서버 (받은 요청 헤더는 server.requests 에 기록)"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        if self.path == '/image.webp':
+            self.serve_body(BODY, ETAG)
+        elif self.path == '/drop.webp':
+            # 첫 요청은 절반만 보내고 연결을 끊음
+            if self.server.dropped or self.headers.get('Range'):
+                self.serve_body(BODY, ETAG)
+            else:
+                self.server.dropped = True
+                self.send_response(200)
+                self.send_header('ETag', ETAG)
+                self.send_header('Content-Length', str(len(BODY)))
+                self.end_headers()
+                self.wfile.write(BODY[:len(BODY) // 2])
+        elif self.path == '/short.webp':
+            # 전체 크기보다 짧은 본문 (서버 쪽에서 잘린 파일)
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes 0-99/{len(BODY)}')
+            self.send_header('Content-Length', '100')
+            self.end_headers()
+            self.wfile.write(BODY[:100])
+        elif self.path == '/corrupt.webp':
+            # S3 응답: ETag 는 BODY 의 MD5 인데 내용이 다름
+            self.serve_body(BODY[::-1], ETAG, {'x-amz-request-id': 'test'})
+        elif self.path == '/corrupt-content-md5.webp':
+            content_md5 = base64.b64encode(hashlib.md5(BODY).digest()).decode()
+            self.serve_body(BODY[::-1], '"v1"', {'Content-MD5': content_md5})
+        elif self.path == '/opaque-etag.webp':
+            # MD5 처럼 생겼지만 MD5 가 아닌 ETag (S3 가 아닌 서버)
+            self.serve_body(BODY[::-1], ETAG)
+        elif self.path == '/unexpected-304.webp':
+            self.send_response(304)
+            self.end_headers()
+        else:
+            self.send_error(404)
+
+    def serve_body(self, body, etag, extra_headers=None):
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        start = 0
+        requested = self.headers.get('Range', '')
+        if requested.startswith('bytes=') and self.headers.get('If-Range') in (None, etag):
+            start = int(requested[len('bytes='):].rstrip('-'))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(body)}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(body) - 1}/{len(body)}')
+        else:
+            self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Content-Length', str(len(body) - start))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body[start:])
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), ImageHandler)
+    httpd.requests = []
+    httpd.dropped = False
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    httpd.base_url = f'http://127.0.0.1:{httpd.server_address[1]}'
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def session():
+    with build_session(pool_size=2) as shared:
+        yield shared
+
+
+def test_second_run_not_modified(server, session, tmp_path):
+    url = f'{server.base_url}/image.webp'
+    target = tmp_path / 'main' / 'image.webp'
+    manifest_file = tmp_path / 'manifest.json'
+
+    manifest = DownloadManifest(manifest_file)
+    assert download_image(session, url, target, manifest) == ('downloaded', len(BODY))
+    manifest.save()
+    assert target.read_bytes() == BODY
+
+    # 다음 실행: 저장된 매니페스트로 조건부 요청 → 304
+    status = download_image(session, url, target, DownloadManifest(manifest_file))
+    assert status == ('not_modified', 0)
+    headers = server.requests[-1][1]
+    assert headers['If-None-Match'] == ETAG
+    assert headers['If-Modified-Since'] == LAST_MODIFIED
+    assert target.read_bytes() == BODY
+
+
+def test_changed_local_file_downloads_again(server, session, tmp_path):
+    url = f'{server.base_url}/image.webp'
+    target = tmp_path / 'image.webp'
+    manifest = DownloadManifest(tmp_path / 'manifest.json')
+    download_image(session, url, target, manifest)
+
+    # 로컬 파일이 기록과 다르면 조건부 헤더 없이 다시 받음
+    target.write_bytes(b'edited')
+    assert download_image(session, url, target, manifest) == ('downloaded', len(BODY))
+    assert 'If-None-Match' not in server.requests[-1][1]
+    assert target.read_bytes() == BODY
+
+
+def test_resume_after_dropped_connection(server, session, tmp_path):
+    url = f'{server.base_url}/drop.webp'
+    target = tmp_path / 'drop.webp'
+    part_path, meta_path = _part_paths(target)
+
+    with pytest.raises(requests.exceptions.RequestException):
+        download_image(session, url, target)
+    assert not target.exists()
+    assert part_path.exists() and meta_path.exists()
+    half = part_path.stat().st_size
+    assert 0 < half < len(BODY)
+
+    assert download_image(session, url, target) == ('resumed', len(BODY) - half)
+    headers = server.requests[-1][1]
+    assert headers['Range'] == f'bytes={half}-'
+    assert headers['If-Range'] == ETAG
+    assert target.read_bytes() == BODY
+    assert not part_path.exists() and not meta_path.exists()
+
+
+def test_complete_part_finished_on_416(server, session, tmp_path):
+    url = f'{server.base_url}/image.webp'
+    target = tmp_path / 'image.webp'
+    part_path, meta_path = _part_paths(target)
+    # 이전 실행에서 본문은 다 받았지만 교체 전에 중단된 상태
+    part_path.write_bytes(BODY)
+    meta_path.write_text(json.dumps({'url': url, 'etag': ETAG, 'last_modified': None, 'total': len(BODY)}),
+                         encoding='utf-8')
+
+    assert download_image(session, url, target) == ('resumed', 0)
+    assert server.requests[-1][1]['Range'] == f'bytes={len(BODY)}-'
+    assert target.read_bytes() == BODY
+    assert not part_path.exists() and not meta_path.exists()
+
+
+def test_length_mismatch_rejected(server, session, tmp_path):
+    target = tmp_path / 'short.webp'
+    part_path, _ = _part_paths(target)
+
+    with pytest.raises(IncompleteDownload, match='길이 불일치'):
+        download_image(session, f'{server.base_url}/short.webp', target)
+    assert not target.exists()
+    # 짧은 임시 파일은 다음 실행에서 이어받도록 남김
+    assert part_path.stat().st_size == 100
+
+
+def test_etag_md5_mismatch_rejected(server, session, tmp_path):
+    target = tmp_path / 'corrupt.webp'
+    part_path, meta_path = _part_paths(target)
+    manifest = DownloadManifest(tmp_path / 'manifest.json')
+
+    with pytest.raises(IncompleteDownload, match='해시 불일치'):
+        download_image(session, f'{server.base_url}/corrupt.webp', target, manifest)
+    assert not target.exists()
+    assert not part_path.exists() and not meta_path.exists()
+    assert manifest.conditional_headers(f'{server.base_url}/corrupt.webp', target) == {}
+
+
+def test_content_md5_mismatch_rejected(server, session, tmp_path):
+    target = tmp_path / 'corrupt.webp'
+    with pytest.raises(IncompleteDownload, match='해시 불일치'):
+        download_image(session, f'{server.base_url}/corrupt-content-md5.webp', target)
+    assert not target.exists()
+
+
+def test_md5_shaped_etag_not_trusted_without_s3_headers(server, session, tmp_path):
+    target = tmp_path / 'opaque.webp'
+    # 길이만 검증하므로 ETag 와 내용이 달라도 받음
+    assert download_image(session, f'{server.base_url}/opaque-etag.webp', target) == ('downloaded', len(BODY))
+    assert target.read_bytes() == BODY[::-1]
+
+
+def test_unconditional_304_rejected(server, session, tmp_path):
+    target = tmp_path / 'unexpected.webp'
+    part_path, meta_path = _part_paths(target)
+    with pytest.raises(requests.exceptions.HTTPError, match='304'):
+        download_image(session, f'{server.base_url}/unexpected-304.webp', target)
+    assert not target.exists()
+    assert not part_path.exists() and not meta_path.exists()
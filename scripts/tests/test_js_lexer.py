@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""js_lexer: 정규식 리터럴과 나눗셈 구분"""
+import pytest
+
+from js_lexer import check_source
+
+
+@pytest.mark.parametrize("source", [
+    "if (x) /re/.test(s);",
+    "if (ok) /[(]/.test(s);",
+    "while (i--) /a]/g.exec(s);",
+    "for (const line of lines) /^\\s*[{]/.test(line) && count++;",
+    "if (a && (b || c)) /[)]/.test(s);",
+])
+def test_regex_after_control_header(source):
+    assert check_source(source) == []
+
+
+@pytest.mark.parametrize("source", [
+    "const half = (total) / 2;",
+    "const rate = items.length / (elapsed) / 2;",
+    "const ratio = obj.if(a) / 2;",
+    "const value = f(x) / [1][0];",
+])
+def test_division_after_value(source):
+    assert check_source(source) == []
+
+
+def test_regex_after_return():
+    assert check_source("function f(s) { return /[}]/.test(s); }") == []
+
+
+def test_unbalanced_still_reported():
+    issues = check_source("if (x) { /re/.test(s);")
+    assert [issue.message for issue in issues] == ["닫히지 않은 '{'"]
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""perceptual_dedupe.build_report: 크기가 다른 같은 그림은 합치지 않음"""
+from perceptual_dedupe import build_report
+
+
+def make_row(path, sha, width, height, size):
+    return {'path': path, 'sha256': sha, 'width': width, 'height': height, 'size': size,
+            'role': None, 'product': None, 'color': None}
+
+
+def test_thumbnail_not_folded_into_render():
+    render = make_row("hover/unreal_37.webp", "a", 800, 800, 90_000)
+    rerender = make_row("main/unreal_37_b.webp", "b", 800, 800, 95_000)
+    thumbnail = make_row("colors/unreal_37_thumbnail.webp", "c", 100, 100, 4_000)
+    signatures = {"a": (0, 0x808080), "b": (1, 0x808080), "c": (2, 0x808080)}
+
+    clusters, resized = build_report([render, rerender, thumbnail], signatures, threshold=14)
+
+    assert len(clusters) == 1
+    assert clusters[0]['keep'] is render
+    assert clusters[0]['duplicates'] == [rerender]
+    assert clusters[0]['bytes'] == 95_000
+    assert resized == [{'keep': render, 'resized': [thumbnail]}]
+
+
+def test_cross_size_only_is_not_a_saving():
+    render = make_row("hover/unreal_37.webp", "a", 800, 800, 90_000)
+    thumbnail = make_row("colors/unreal_37_thumbnail.webp", "c", 100, 100, 4_000)
+    signatures = {"a": (0, 0x808080), "c": (0, 0x808080)}
+
+    clusters, resized = build_report([render, thumbnail], signatures, threshold=14)
+
+    assert clusters == []
+    assert resized == [{'keep': render, 'resized': [thumbnail]}]
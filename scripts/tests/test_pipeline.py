@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""pipeline: 단계 순서 (같은 폴더에 쓰는 download / organise 는 동시에 돌지 않음)"""
+import pipeline
+from pipeline import STAGES, Stage, _depends_on, build_graph, run_pipeline
+
+
+def test_download_before_organise():
+    graph = build_graph(STAGES)
+    assert 'download' in graph['organise']
+    assert not _depends_on('download', 'organise', graph)
+
+
+def test_image_consumers_wait_for_download_and_organise():
+    graph = build_graph(STAGES)
+    for name in ('codegen', 'variants'):
+        assert _depends_on(name, 'download', graph)
+        assert _depends_on(name, 'organise', graph)
+
+
+def test_download_declares_image_dirs():
+    download = next(stage for stage in STAGES if stage.name == 'download')
+    assert set(pipeline.IMAGE_DIRS) <= set(download.outputs)
+
+
+def test_shared_output_dir_settles(tmp_path, monkeypatch, capsys):
+    scripts = tmp_path / "scripts"
+    scripts.mkdir()
+    (scripts / "first.py").write_text(
+        "import os\nos.makedirs('out', exist_ok=True)\nopen('out/a.txt', 'w').write('a')\n"
+        "open('first.json', 'w').write('{}')\n", encoding='utf-8')
+    (scripts / "second.py").write_text("open('out/b.txt', 'w').write('b')\n", encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(pipeline, "SCRIPTS_DIR", str(scripts))
+
+    stages = [Stage("first", ["first.py"], [], ["first.json", "out"], "앞 단계"),
+              Stage("second", ["second.py"], ["first.json"], ["out"], "같은 폴더에 쓰는 뒤 단계")]
+    graph = build_graph(stages)
+    assert graph["second"] == {"first"}
+
+    state = {"files": {}, "stages": {}}
+    assert run_pipeline(stages, graph, state, jobs=2) == {"first": "ran", "second": "ran"}
+    # 뒤 단계가 out/ 을 바꿨어도 다음 실행에서 앞 단계가 다시 돌지 않음
+    assert run_pipeline(stages, graph, state, jobs=2) == {"first": "skipped", "second": "skipped"}
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""product_matcher: NumPy 없이도 같은 점수 / 배정"""
+import itertools
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+import product_matcher
+from generate_products_data import OUR_PRODUCTS_SLUGS
+
+MAPPING_JSON = Path(__file__).resolve().parents[2] / "extracted-mappings.json"
+
+
+@pytest.mark.skipif(not product_matcher.HAS_NUMPY, reason="NumPy 없음 (비교 대상 없음)")
+def test_pure_python_matches_numpy(monkeypatch):
+    with open(MAPPING_JSON, 'r', encoding='utf-8') as f:
+        names = [mapping['name'] for mapping in json.load(f)]
+    expected = product_matcher.match_products(OUR_PRODUCTS_SLUGS, names)
+
+    monkeypatch.setattr(product_matcher, 'HAS_NUMPY', False)
+    assert product_matcher.match_products(OUR_PRODUCTS_SLUGS, names) == expected
+
+
+@pytest.mark.parametrize("shape", [(3, 3), (3, 5), (5, 3), (1, 4)])
+def test_pure_python_assignment_is_optimal(monkeypatch, shape):
+    monkeypatch.setattr(product_matcher, 'HAS_NUMPY', False)
+    rng = random.Random(sum(shape))
+    rows, columns = shape
+    scores = [[rng.random() for _ in range(columns)] for _ in range(rows)]
+
+    pairs = product_matcher.assign(scores)
+
+    assert len(pairs) == min(rows, columns)
+    assert len({row for row, _ in pairs}) == len({column for _, column in pairs}) == len(pairs)
+    if rows <= columns:
+        best = max(sum(scores[row][column] for row, column in enumerate(perm))
+                   for perm in itertools.permutations(range(columns), rows))
+    else:
+        best = max(sum(scores[row][column] for column, row in enumerate(perm))
+                   for perm in itertools.permutations(range(rows), columns))
+    assert sum(scores[row][column] for row, column in pairs) == pytest.approx(best)
+
+
+def test_no_catalogue(monkeypatch):
+    monkeypatch.setattr(product_matcher, 'HAS_NUMPY', False)
+    assert product_matcher.match_products(['a-b'], []) == {'a-b': (None, 0.0)}
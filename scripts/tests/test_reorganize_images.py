@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""reorganize-images.py: 자신이 배치한 파일과 예전 제품별 폴더만 삭제"""
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from image_store import ImageStore
+
+SCRIPT = Path(__file__).resolve().parents[1] / "reorganize-images.py"
+
+
+@pytest.fixture
+def reorganize(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("reorganize_images", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    source = tmp_path / "source"
+    source.mkdir()
+    for name in ("a.webp", "a_thumbnail.webp", "b.webp"):
+        (source / name).write_bytes(name.encode() * 50)
+    monkeypatch.setattr(module, "SOURCE_DIR", str(source))
+    monkeypatch.setattr(module, "TARGET_DIR", str(tmp_path / "v2"))
+    monkeypatch.setattr(module, "ASSET_DB", str(tmp_path / "index.sqlite"))
+    monkeypatch.setattr(module, "PLACED_MANIFEST", str(tmp_path / "placed.json"))
+    monkeypatch.setattr(module, "PROJECT_ROOT", str(tmp_path))
+    monkeypatch.setattr(module, "DOWNLOAD_MANIFEST", str(tmp_path / "downloads.json"))
+    monkeypatch.setattr(module, "STORE", ImageStore(tmp_path / "store"))
+    return module
+
+
+def mapping(main, hover=None, thumbnails=()):
+    return {'name': main, 'main_image': main, 'hover_image': hover, 'color_thumbnails': list(thumbnails)}
+
+
+def test_keeps_files_placed_by_other_tools(reorganize, tmp_path):
+    target = tmp_path / "v2"
+    downloaded = target / "main" / "unreal_1300814.webp"
+    downloaded.parent.mkdir(parents=True)
+    downloaded.write_bytes(b"downloaded")
+    partial = target / "hover" / "unreal_1300813.webp.part"
+    partial.parent.mkdir(parents=True)
+    partial.write_bytes(b"in flight")
+    legacy = target / "bookcase-black" / "main" / "old.webp"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_bytes(b"old")
+
+    results, missing = reorganize.sync_new_structure([mapping("a.webp", "b.webp", ["a_thumbnail.webp"])],
+                                                     workers=2)
+
+    assert all(result['ok'] for result in results) and missing == []
+    assert (target / "main" / "a.webp").exists()
+    assert (target / "colors" / "a_thumbnail.webp").exists()
+    assert downloaded.read_bytes() == b"downloaded"
+    assert partial.read_bytes() == b"in flight"
+    assert not legacy.exists() and not (target / "bookcase-black").exists()
+
+
+def test_removes_own_files_dropped_from_mappings(reorganize, tmp_path):
+    target = tmp_path / "v2"
+    reorganize.sync_new_structure([mapping("a.webp", "b.webp", ["a_thumbnail.webp"])], workers=2)
+    foreign = target / "colors" / "manual.webp"
+    foreign.write_bytes(b"manual")
+
+    reorganize.sync_new_structure([mapping("a.webp")], workers=2)
+
+    assert (target / "main" / "a.webp").exists()
+    assert not (target / "hover" / "b.webp").exists()
+    assert not (target / "colors" / "a_thumbnail.webp").exists()
+    assert foreign.exists()
+
+
+def test_downloaded_files_are_kept_in_place(reorganize, tmp_path):
+    target = tmp_path / "v2"
+    downloaded = {"main/unreal_1300814.webp": b"only in realImageMappings", "main/a.webp": b"downloaded a"}
+    for name, data in downloaded.items():
+        (target / name).parent.mkdir(parents=True, exist_ok=True)
+        (target / name).write_bytes(data)
+    # 다운로더 매니페스트 경로는 저장소 루트 기준
+    (tmp_path / "downloads.json").write_text(json.dumps({
+        f"https://example.com/{name}": {'path': f"v2/{name}", 'size': len(data)}
+        for name, data in downloaded.items()
+    }), encoding='utf-8')
+
+    plan, missing = reorganize.plan_new_structure([mapping("a.webp")], {"a.webp"})
+    assert sorted(str(item['dest'].relative_to(target)) for item in plan) == sorted(downloaded)
+    assert all(item['src'] == item['dest'] for item in plan) and missing == []
+
+    reorganize.sync_new_structure([mapping("a.webp")], workers=2)
+    for name, data in downloaded.items():
+        assert (target / name).read_bytes() == data
+    assert json.loads((tmp_path / "placed.json").read_text(encoding='utf-8')) == {'placed': []}
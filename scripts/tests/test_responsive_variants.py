@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""responsive_variants: 팔레트 투명도 유지, 작업 하나가 실패해도 manifest 저장"""
+import json
+import struct
+import sys
+import zlib
+
+import pytest
+
+import responsive_variants
+
+pytestmark = pytest.mark.skipif(not responsive_variants.HAS_PILLOW, reason="Pillow 없음")
+
+if responsive_variants.HAS_PILLOW:
+    from PIL import Image
+
+
+def save_palette_png(path):
+    """왼쪽 절반이 투명한 P 모드 PNG (tRNS 청크만 있고 알파 밴드는 없음)"""
+    image = Image.new('P', (8, 8), 1)
+    image.putpalette([0, 0, 0, 200, 30, 30] + [0, 0, 0] * 254)
+    for x in range(4):
+        for y in range(8):
+            image.putpixel((x, y), 0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    image.save(path, transparency=0)
+
+
+def save_bomb_png(path):
+    """헤더만 40000x40000 인 PNG (열면 DecompressionBombError)"""
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    ihdr = struct.pack('>IIBBBBB', 40000, 40000, 8, 2, 0, 0, 0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', ihdr) + chunk(b'IEND', b''))
+
+
+def test_palette_transparency_kept(tmp_path):
+    source = tmp_path / 'palette.png'
+    save_palette_png(source)
+    out = tmp_path / 'palette.4.webp'
+    task = {'path': str(source), 'sha256': 'x', 'width': 8, 'height': 8,
+            'specs': [(8, 'webp', str(out), 100)]}
+
+    responsive_variants.render_variants(task)
+
+    with Image.open(out) as variant:
+        assert variant.mode == 'RGBA'
+        assert variant.getpixel((0, 0))[3] == 0
+        assert variant.getpixel((7, 7))[3] == 255
+
+
+def test_failed_task_still_saves_manifest(monkeypatch, capsys, tmp_path):
+    source_root = tmp_path / responsive_variants.SOURCE_ROOT
+    save_palette_png(source_root / 'main' / 'good.png')
+    save_bomb_png(source_root / 'main' / 'bomb.png')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'argv', ['responsive_variants.py', '--widths', '4', '--formats', 'webp',
+                                      '--workers', '1', '--quiet'])
+
+    responsive_variants.main()
+
+    with open(responsive_variants.MANIFEST_FILE, 'r', encoding='utf-8') as f:
+        images = json.load(f)['images']
+    assert list(images) == ['/images/products/v2/main/good.png']
+    out = capsys.readouterr().out
+    assert '/images/products/v2/main/bomb.png' in out
+    assert '❌' in out
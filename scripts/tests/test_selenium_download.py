@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""selenium_download: URL 목록 → 브라우저 없이 공유 세션 일괄 다운로드 (로컬 HTTP 서버)"""
+import sys
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import selenium_download
+
+IMAGES = {'a.webp': b'RIFF-a' * 100, 'b.webp': b'RIFF-b' * 200}
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def base_url(tmp_path):
+    served = tmp_path / 'served'
+    served.mkdir()
+    for name, data in IMAGES.items():
+        (served / name).write_bytes(data)
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), partial(QuietHandler, directory=str(served)))
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def url_file(tmp_path, base_url):
+    path = tmp_path / 'urls.txt'
+    path.write_text(f"# 주석\n{base_url}/a.webp\n\n  {base_url}/b.webp  \n{base_url}/missing.webp\n",
+                    encoding='utf-8')
+    return path
+
+
+def test_jobs_from_url_list(url_file, base_url, tmp_path):
+    jobs = selenium_download.jobs_from_url_list(url_file, tmp_path / 'out')
+    assert [job['url'] for job in jobs] == [f'{base_url}/a.webp', f'{base_url}/b.webp',
+                                            f'{base_url}/missing.webp']
+    assert jobs[0]['path'] == tmp_path / 'out' / 'a.webp'
+    assert {job['type'] for job in jobs} == {'download'}
+
+
+def test_main_no_browser(monkeypatch, capsys, url_file, tmp_path):
+    target = tmp_path / 'out'
+    monkeypatch.setattr(sys, 'argv', ['selenium_download.py', '--urls', str(url_file),
+                                      '--target', str(target), '--no-browser', '--concurrency', '2'])
+    monkeypatch.setattr(selenium_download, 'browser_session', pytest.fail)
+
+    selenium_download.main()
+
+    for name, data in IMAGES.items():
+        assert (target / name).read_bytes() == data
+    assert not (target / 'missing.webp').exists()
+    out = capsys.readouterr().out
+    assert '성공: 2/3' in out
+    assert '실패: 1' in out
+
+
+def test_without_selenium_falls_back_to_session(monkeypatch, capsys, url_file, tmp_path):
+    monkeypatch.setattr(selenium_download, 'HAS_SELENIUM', False)
+    monkeypatch.setattr(selenium_download, 'browser_session', pytest.fail)
+    jobs = selenium_download.jobs_from_url_list(url_file, tmp_path / 'out')
+
+    results = selenium_download.download_with_selenium(jobs, use_browser=True, concurrency=2)
+
+    assert 'selenium 이 설치되지 않아' in capsys.readouterr().out
+    assert [result['ok'] for result in results] == [True, True, False]
+    assert (tmp_path / 'out' / 'b.webp').read_bytes() == IMAGES['b.webp']
@@ -57,8 +57,12 @@ export default function ProductDetailClient({ slug }: ProductDetailClientProps)
     );
   }
 
-  // 현재 선택된 변형의 이미지들
-  const currentImages = [selectedVariant.mainImage, selectedVariant.hoverImage].filter(Boolean);
+  // 현재 선택된 변형의 이미지들 (생성된 원본 크기로 비율을 잡아 레이아웃 시프트 방지)
+  const currentImages = [
+    { src: selectedVariant.mainImage, size: selectedVariant.mainImageSize },
+    { src: selectedVariant.hoverImage, size: selectedVariant.hoverImageSize }
+  ].filter(image => Boolean(image.src));
+  const currentImage = currentImages[selectedImageIndex] ?? currentImages[0];
 
   const handleColorChange = (variantId: string) => {
     const newVariant = product.colorVariants.find(v => v.id === variantId);
@@ -92,10 +96,11 @@ export default function ProductDetailClient({ slug }: ProductDetailClientProps)
             {/* Main Image */}
             <div className="aspect-square bg-gray-50 rounded-lg overflow-hidden">
               <Image
-                src={currentImages[selectedImageIndex] || selectedVariant.mainImage}
+                src={currentImage?.src || selectedVariant.mainImage}
                 alt={`${product.name} - ${selectedVariant.name}`}
-                width={600}
-                height={600}
+                width={currentImage?.size?.width ?? 600}
+                height={currentImage?.size?.height ?? 600}
+                sizes="(max-width: 1024px) 100vw, 50vw"
                 className="w-full h-full object-cover"
                 priority
               />
@@ -115,7 +120,7 @@ export default function ProductDetailClient({ slug }: ProductDetailClientProps)
                     }`}
                   >
                     <Image
-                      src={image}
+                      src={image.src}
                       alt={`${product.name} view ${index + 1}`}
                       width={80}
                       height={80}
@@ -0,0 +1,309 @@
+// 🤖 자동 생성 파일 - 직접 수정하지 마세요
+// 생성: python scripts/generate_products_data.py
+// 원본: extracted-mappings.json + color-swatches.json + public/images/products/v2
+
+export interface GeneratedImageSize {
+  width: number;
+  height: number;
+}
+
+export interface GeneratedProductImages {
+  sourceName: string;
+  mainImage: string;
+  hoverImage: string;
+  colorThumbnails: string[];
+  colorSwatches: Record<string, string>;
+  mainImageSize?: GeneratedImageSize;
+  hoverImageSize?: GeneratedImageSize;
+}
+
+export const productImageMappings: Record<string, GeneratedProductImages> = {
+  'bookcase-white-doors': {
+    sourceName: 'Bookcase in White with Doors',
+    mainImage: '/images/products/v2/main/Living_room_08_living-room-Bookcase_EAPgDsY.jpg',
+    hoverImage: '/images/products/v2/hover/unreal_50.webp',
+    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_22509_thumbnail.webp', 'unreal_24177_thumbnail.webp', 'unreal_16043_thumbnail.webp', 'unreal_29923_thumbnail.webp', 'unreal_29922_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_15643_thumbnail.webp', 'unreal_29920_thumbnail.webp', 'unreal_7935_thumbnail.webp', 'unreal_7934_thumbnail.webp', 'unreal_7933_thumbnail.webp', 'unreal_2176944_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_22509_thumbnail.webp',
+      Brown: 'unreal_24177_thumbnail.webp',
+      Black: 'unreal_16043_thumbnail.webp',
+      Green: 'unreal_29923_thumbnail.webp',
+      Blue: 'unreal_29922_thumbnail.webp',
+      Red: 'unreal_29921_thumbnail.webp',
+      Beige: 'unreal_15643_thumbnail.webp'
+    },
+    mainImageSize: { width: 1000, height: 1000 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-grey-external-drawers': {
+    sourceName: 'Bookcase in Grey with External Drawers',
+    mainImage: '/images/products/v2/main/unreal_1075797.webp',
+    hoverImage: '/images/products/v2/hover/unreal_191615_KG3boPp.webp',
+    colorThumbnails: ['unreal_1300811_thumbnail.webp', 'unreal_124097_io6eqG9_thumbnail.webp', 'unreal_124105_IYRRqNC_thumbnail.webp', 'unreal_124107_td0mbrB_thumbnail.webp', 'unreal_124111_pw5ed3g_thumbnail.webp', 'unreal_124113_GKbwSmO_thumbnail.webp', 'unreal_124115_hZ6bF0i_thumbnail.webp', 'unreal_124117_FtIm4hQ_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_212_g9B0kiP_thumbnail.webp',
+      Brown: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Black: 'unreal_124425_1QAV6ST_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_187283_SkP60Hp_thumbnail.webp',
+      Red: 'unreal_197_uxXsipd_thumbnail.webp',
+      Beige: 'unreal_245_iu7gxLQ_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-brown': {
+    sourceName: 'Bookcase in Brown',
+    mainImage: '/images/products/v2/main/unreal_124332_sj5uTGc.webp',
+    hoverImage: '/images/products/v2/hover/unreal_124331_ZWcuK1x.webp',
+    colorThumbnails: ['unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_124317_AzskeiX_thumbnail.webp', 'unreal_1300831_thumbnail.webp', 'unreal_124325_ipi3QS9_thumbnail.webp', 'unreal_124327_G0PZCqZ_thumbnail.webp', 'unreal_124333_zE9wxou_thumbnail.webp', 'unreal_124335_tJNYm8O_thumbnail.webp', 'unreal_124337_ZgMWR6U_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_29921_thumbnail.webp',
+      Brown: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Black: 'unreal_37_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_4489_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_124005_Cjj5HZz_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-grey-doors-storage': {
+    sourceName: 'Bookcase in Grey with Doors and Bottom Storage',
+    mainImage: '/images/products/v2/main/907_Tylko_Bookcase_Type1_FINAL_04_living-room-Bookcase.jpg',
+    hoverImage: '/images/products/v2/hover/unreal_212_g9B0kiP.webp',
+    colorThumbnails: ['unreal_212_g9B0kiP_thumbnail.webp', 'unreal_28939_saUa3a5_thumbnail.webp', 'unreal_15264_thumbnail.webp', 'unreal_29928_thumbnail.webp', 'unreal_16988_thumbnail.webp', 'unreal_9070_thumbnail.webp', 'unreal_1064021_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_212_g9B0kiP_thumbnail.webp',
+      Grey: 'unreal_28939_saUa3a5_thumbnail.webp',
+      Brown: 'unreal_15264_thumbnail.webp',
+      Black: 'unreal_29928_thumbnail.webp',
+      Green: 'unreal_16988_thumbnail.webp',
+      Blue: 'unreal_9070_thumbnail.webp',
+      Red: 'unreal_1064021_thumbnail.webp',
+      Beige: 'unreal_212_g9B0kiP_thumbnail.webp'
+    },
+    mainImageSize: { width: 1000, height: 1000 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-moss-green': {
+    sourceName: 'Bookcase in Moss Green',
+    mainImage: '/images/products/v2/main/unreal_1065155.webp',
+    hoverImage: '/images/products/v2/hover/unreal_1063961.webp',
+    colorThumbnails: ['unreal_1063961_thumbnail.webp', 'unreal_14040_KBEA61s_thumbnail.webp', 'unreal_1255995_thumbnail.webp', 'unreal_1255994_thumbnail.webp', 'unreal_1255992_thumbnail.webp', 'unreal_1255991_thumbnail.webp', 'unreal_8915_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_1063961_thumbnail.webp',
+      Grey: 'unreal_14040_KBEA61s_thumbnail.webp',
+      Brown: 'unreal_1255995_thumbnail.webp',
+      Black: 'unreal_1255994_thumbnail.webp',
+      Green: 'unreal_1255992_thumbnail.webp',
+      Blue: 'unreal_1255991_thumbnail.webp',
+      Red: 'unreal_8915_thumbnail.webp',
+      Beige: 'unreal_1063961_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-black': {
+    sourceName: 'Bookcase in Black',
+    mainImage: '/images/products/v2/main/unreal_124426_cquVq4l.webp',
+    hoverImage: '/images/products/v2/hover/unreal_124425_1QAV6ST.webp',
+    colorThumbnails: ['unreal_124425_1QAV6ST_thumbnail.webp', 'unreal_124405_uTjABmn_thumbnail.webp', 'unreal_1300839_thumbnail.webp', 'unreal_124413_3EYImuG_thumbnail.webp', 'unreal_124415_4CDWl3t_thumbnail.webp', 'unreal_124419_e3k3J6s_thumbnail.webp', 'unreal_124421_MDG5KaT_thumbnail.webp', 'unreal_124423_8EbC2hA_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_124425_1QAV6ST_thumbnail.webp',
+      Grey: 'unreal_50_thumbnail.webp',
+      Brown: 'unreal_29921_thumbnail.webp',
+      Black: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_4489_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_124005_Cjj5HZz_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-white-large': {
+    sourceName: 'Bookcase in White',
+    mainImage: '/images/products/v2/main/unreal_370127.webp',
+    hoverImage: '/images/products/v2/hover/unreal_14718.webp',
+    colorThumbnails: ['unreal_14718_thumbnail.webp', 'unreal_1261674_thumbnail.webp', 'unreal_1261673_thumbnail.webp', 'unreal_1261672_thumbnail.webp', 'unreal_1261671_thumbnail.webp', 'unreal_1261670_thumbnail.webp', 'unreal_1261669_thumbnail.webp', 'unreal_1261668_thumbnail.webp', 'unreal_1261667_thumbnail.webp', 'unreal_8622_thumbnail.webp', 'unreal_8621_thumbnail.webp', 'unreal_8620_thumbnail.webp', 'unreal_2176638_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_22509_thumbnail.webp',
+      Brown: 'unreal_24177_thumbnail.webp',
+      Black: 'unreal_16043_thumbnail.webp',
+      Green: 'unreal_29923_thumbnail.webp',
+      Blue: 'unreal_29922_thumbnail.webp',
+      Red: 'unreal_29921_thumbnail.webp',
+      Beige: 'unreal_15643_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-light-wood': {
+    sourceName: 'Bookcase in Light Wood Effect',
+    mainImage: '/images/products/v2/main/unreal_156041_2PFDZ4t.webp',
+    hoverImage: '/images/products/v2/hover/unreal_154634_uOy2I1O.webp',
+    colorThumbnails: ['unreal_154634_uOy2I1O_thumbnail.webp', 'unreal_154633_vsoVUir_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_29921_thumbnail.webp',
+      Brown: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Black: 'unreal_37_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_4489_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_154634_uOy2I1O_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-burgundy-doors-drawers': {
+    sourceName: 'Bookcase in Burgund with Doors and Drawers',
+    mainImage: '/images/products/v2/main/unreal_370630.webp',
+    hoverImage: '/images/products/v2/hover/unreal_245_iu7gxLQ.webp',
+    colorThumbnails: ['unreal_245_iu7gxLQ_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_26013_thumbnail.webp', 'unreal_24319_thumbnail.webp', 'unreal_25417_thumbnail.webp', 'unreal_19319_thumbnail.webp', 'unreal_267_ruIqpOm_thumbnail.webp', 'unreal_17961_thumbnail.webp', 'unreal_26199_thumbnail.webp', 'unreal_7813_thumbnail.webp', 'unreal_7812_thumbnail.webp', 'unreal_7811_thumbnail.webp', 'unreal_2176675_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_245_iu7gxLQ_thumbnail.webp',
+      Grey: 'unreal_27059_thumbnail.webp',
+      Brown: 'unreal_26013_thumbnail.webp',
+      Black: 'unreal_24319_thumbnail.webp',
+      Green: 'unreal_25417_thumbnail.webp',
+      Blue: 'unreal_19319_thumbnail.webp',
+      Red: 'unreal_267_ruIqpOm_thumbnail.webp',
+      Beige: 'unreal_17961_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-grey-compact': {
+    sourceName: 'Bookcase in Grey',
+    mainImage: '/images/products/v2/main/unreal_366843.webp',
+    hoverImage: '/images/products/v2/hover/unreal_4489.webp',
+    colorThumbnails: ['unreal_4489_thumbnail.webp', 'unreal_4804_5FlRoPy_thumbnail.webp', 'unreal_4490_thumbnail.webp', 'unreal_4487_thumbnail.webp', 'unreal_4486_thumbnail.webp', 'unreal_4485_thumbnail.webp', 'unreal_1064353_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_4489_thumbnail.webp',
+      Grey: 'unreal_4804_5FlRoPy_thumbnail.webp',
+      Brown: 'unreal_4490_thumbnail.webp',
+      Black: 'unreal_4487_thumbnail.webp',
+      Green: 'unreal_4486_thumbnail.webp',
+      Blue: 'unreal_4485_thumbnail.webp',
+      Red: 'unreal_1064353_thumbnail.webp',
+      Beige: 'unreal_4489_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-light-wood-drawers': {
+    sourceName: 'Bookcase in Light Wood Effect with External Drawers',
+    mainImage: '/images/products/v2/main/unreal_1075727.webp',
+    hoverImage: '/images/products/v2/hover/unreal_154688_ZxTGNxY.webp',
+    colorThumbnails: ['unreal_154688_ZxTGNxY_thumbnail.webp', 'unreal_154687_kq14Eh5_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_29921_thumbnail.webp',
+      Brown: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Black: 'unreal_37_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_4489_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_154722_Daa7Fxo_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-green-xl': {
+    sourceName: 'Bookcase in Green',
+    mainImage: '/images/products/v2/main/14_1.jpg',
+    hoverImage: '/images/products/v2/hover/unreal_1076615.webp',
+    colorThumbnails: ['unreal_1076615_thumbnail.webp', 'unreal_1082821_thumbnail.webp', 'unreal_1082823_thumbnail.webp', 'unreal_1082825_thumbnail.webp', 'unreal_1082827_thumbnail.webp', 'unreal_1082829_thumbnail.webp', 'unreal_1082831_thumbnail.webp', 'unreal_1082833_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_29921_thumbnail.webp',
+      Brown: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Black: 'unreal_37_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_1076615_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_124005_Cjj5HZz_thumbnail.webp'
+    },
+    mainImageSize: { width: 472, height: 472 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-white-external-drawers': {
+    sourceName: 'Bookcase in White with External Drawers',
+    mainImage: '/images/products/v2/main/unreal_124436_nBnrSSB.webp',
+    hoverImage: '/images/products/v2/hover/unreal_124435_Z0LwZty.webp',
+    colorThumbnails: ['unreal_124435_Z0LwZty_thumbnail.webp', 'unreal_124427_MRGIZaE_thumbnail.webp', 'unreal_1300841_thumbnail.webp', 'unreal_124437_rfkLSQe_thumbnail.webp', 'unreal_124441_jL28UXx_thumbnail.webp', 'unreal_124443_GviGlHR_thumbnail.webp', 'unreal_124445_beS5Wfb_thumbnail.webp', 'unreal_124447_xPNixoP_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_212_g9B0kiP_thumbnail.webp',
+      Brown: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Black: 'unreal_124435_Z0LwZty_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_4489_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_124471_E20jniq_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-moss-green-doors': {
+    sourceName: 'Bookcase in Moss Green with Doors',
+    mainImage: '/images/products/v2/main/unreal_1065964.webp',
+    hoverImage: '/images/products/v2/hover/unreal_1064770.webp',
+    colorThumbnails: ['unreal_1064770_thumbnail.webp', 'unreal_55_R2LUr66_thumbnail.webp', 'unreal_21433_thumbnail.webp', 'unreal_21431_thumbnail.webp', 'unreal_21429_thumbnail.webp', 'unreal_21427_thumbnail.webp', 'unreal_9287_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_1064770_thumbnail.webp',
+      Grey: 'unreal_50_thumbnail.webp',
+      Brown: 'unreal_29921_thumbnail.webp',
+      Black: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Green: 'unreal_37_thumbnail.webp',
+      Blue: 'unreal_4489_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_1064770_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-premium-black': {
+    sourceName: 'Bookcase in Premium Black with Doors and Drawers',
+    mainImage: '/images/products/v2/main/Modern_Classic_Matt_Black_Shelf_with_Drawers.jpg',
+    hoverImage: '/images/products/v2/hover/unreal_37.webp',
+    colorThumbnails: ['unreal_37_thumbnail.webp', 'unreal_21611_thumbnail.webp', 'unreal_19458_thumbnail.webp', 'unreal_21609_thumbnail.webp', 'unreal_17349_thumbnail.webp', 'unreal_14890_thumbnail.webp', 'unreal_16899_thumbnail.webp', 'unreal_21606_thumbnail.webp', 'unreal_19079_thumbnail.webp', 'unreal_1298451_thumbnail.webp', 'unreal_1298453_thumbnail.webp', 'unreal_1298455_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_37_thumbnail.webp',
+      Grey: 'unreal_50_thumbnail.webp',
+      Brown: 'unreal_29921_thumbnail.webp',
+      Black: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_4489_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_124005_Cjj5HZz_thumbnail.webp'
+    },
+    mainImageSize: { width: 1186, height: 1200 },
+    hoverImageSize: { width: 800, height: 800 }
+  },
+  'bookcase-beige-drawers-backpanels': {
+    sourceName: 'Bookcase in Sand with External Drawers',
+    mainImage: '/images/products/v2/main/unreal_124006_LAACU4l.webp',
+    hoverImage: '/images/products/v2/hover/unreal_124005_Cjj5HZz.webp',
+    colorThumbnails: ['unreal_124005_Cjj5HZz_thumbnail.webp', 'unreal_123987_fenGfuM_thumbnail.webp', 'unreal_1300801_thumbnail.webp', 'unreal_123995_96k6CbC_thumbnail.webp', 'unreal_123997_4V22Xv6_thumbnail.webp', 'unreal_124001_xf4UDjh_thumbnail.webp', 'unreal_124003_dbQ4SBg_thumbnail.webp', 'unreal_124007_ASpOVct_thumbnail.webp'],
+    colorSwatches: {
+      White: 'unreal_50_thumbnail.webp',
+      Grey: 'unreal_29921_thumbnail.webp',
+      Brown: 'unreal_124331_ZWcuK1x_thumbnail.webp',
+      Black: 'unreal_37_thumbnail.webp',
+      Green: 'unreal_1063961_thumbnail.webp',
+      Blue: 'unreal_4489_thumbnail.webp',
+      Red: 'unreal_27059_thumbnail.webp',
+      Beige: 'unreal_124005_Cjj5HZz_thumbnail.webp'
+    },
+    mainImageSize: { width: 800, height: 800 },
+    hoverImageSize: { width: 800, height: 800 }
+  }
+};
@@ -1,107 +1,27 @@
 import { ProductV2, ColorVariantV2, ProductBadge } from '@/types/productsV2';
+import { productImageMappings, GeneratedProductImages } from './generated/productImages';
 
 // 실제 product-v2-example.txt에서 추출한 34개 제품 데이터
 // 모든 제품은 Bookcase 카테고리이며, 다양한 색상과 크기를 가집니다.
 
-// 실제 이미지 경로 매핑 테이블
-const productImageMappings: Record<string, {mainImage: string, hoverImage: string, colorThumbnails: string[]}> = {
-  'bookcase-white-doors': {
-    mainImage: '/images/products/v2/main/Living_room_08_living-room-Bookcase_EAPgDsY.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_50.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_22509_thumbnail.webp', 'unreal_24177_thumbnail.webp', 'unreal_16043_thumbnail.webp', 'unreal_29923_thumbnail.webp', 'unreal_29922_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_15643_thumbnail.webp']
-  },
-  'bookcase-grey-external-drawers': {
-    mainImage: '/images/products/v2/main/unreal_1075797.webp',
-    hoverImage: '/images/products/v2/hover/unreal_191615_KG3boPp.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_212_g9B0kiP_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_124425_1QAV6ST_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_187283_SkP60Hp_thumbnail.webp', 'unreal_197_uxXsipd_thumbnail.webp', 'unreal_245_iu7gxLQ_thumbnail.webp']
-  },
-  'bookcase-brown': {
-    mainImage: '/images/products/v2/main/unreal_124332_sj5uTGc.webp',
-    hoverImage: '/images/products/v2/hover/unreal_124331_ZWcuK1x.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_37_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_4489_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_124005_Cjj5HZz_thumbnail.webp']
-  },
-  'bookcase-grey-doors-storage': {
-    mainImage: '/images/products/v2/main/907_Tylko_Bookcase_Type1_FINAL_04_living-room-Bookcase.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_212_g9B0kiP.webp',
-    colorThumbnails: ['unreal_212_g9B0kiP_thumbnail.webp', 'unreal_28939_saUa3a5_thumbnail.webp', 'unreal_15264_thumbnail.webp', 'unreal_29928_thumbnail.webp', 'unreal_16988_thumbnail.webp', 'unreal_9070_thumbnail.webp', 'unreal_1064021_thumbnail.webp']
-  },
-  'bookcase-moss-green': {
-    mainImage: '/images/products/v2/main/unreal_1065155.webp',
-    hoverImage: '/images/products/v2/hover/unreal_1063961.webp',
-    colorThumbnails: ['unreal_1063961_thumbnail.webp', 'unreal_14040_KBEA61s_thumbnail.webp', 'unreal_1255995_thumbnail.webp', 'unreal_1255994_thumbnail.webp', 'unreal_1255992_thumbnail.webp', 'unreal_1255991_thumbnail.webp', 'unreal_8915_thumbnail.webp']
-  },
-  'bookcase-black': {
-    mainImage: '/images/products/v2/main/unreal_124426_cquVq4l.webp',
-    hoverImage: '/images/products/v2/hover/unreal_124425_1QAV6ST.webp',
-    colorThumbnails: ['unreal_124425_1QAV6ST_thumbnail.webp', 'unreal_50_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_4489_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_124005_Cjj5HZz_thumbnail.webp']
-  },
-  'bookcase-white-large': {
-    mainImage: '/images/products/v2/main/Living_room_08_living-room-Bookcase_EAPgDsY.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_50.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_22509_thumbnail.webp', 'unreal_24177_thumbnail.webp', 'unreal_16043_thumbnail.webp', 'unreal_29923_thumbnail.webp', 'unreal_29922_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_15643_thumbnail.webp']
-  },
-  'bookcase-light-wood': {
-    mainImage: '/images/products/v2/main/unreal_156041_2PFDZ4t.webp',
-    hoverImage: '/images/products/v2/hover/unreal_154634_uOy2I1O.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_37_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_4489_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_154634_uOy2I1O_thumbnail.webp']
-  },
-  'bookcase-burgundy-doors-drawers': {
-    mainImage: '/images/products/v2/main/unreal_370630.webp',
-    hoverImage: '/images/products/v2/hover/unreal_245_iu7gxLQ.webp',
-    colorThumbnails: ['unreal_245_iu7gxLQ_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_26013_thumbnail.webp', 'unreal_24319_thumbnail.webp', 'unreal_25417_thumbnail.webp', 'unreal_19319_thumbnail.webp', 'unreal_267_ruIqpOm_thumbnail.webp', 'unreal_17961_thumbnail.webp']
-  },
-  'bookcase-grey-compact': {
-    mainImage: '/images/products/v2/main/907_Tylko_Bookcase_Type1_FINAL_04_living-room-Bookcase.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_212_g9B0kiP.webp',
-    colorThumbnails: ['unreal_4489_thumbnail.webp', 'unreal_4804_5FlRoPy_thumbnail.webp', 'unreal_4490_thumbnail.webp', 'unreal_4487_thumbnail.webp', 'unreal_4486_thumbnail.webp', 'unreal_4485_thumbnail.webp', 'unreal_1064353_thumbnail.webp']
-  },
-  'bookcase-light-wood-drawers': {
-    mainImage: '/images/products/v2/main/unreal_1075727.webp',
-    hoverImage: '/images/products/v2/hover/unreal_154688_ZxTGNxY.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_37_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_4489_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_154722_Daa7Fxo_thumbnail.webp']
-  },
-  'bookcase-green-xl': {
-    mainImage: '/images/products/v2/main/unreal_1065155.webp',
-    hoverImage: '/images/products/v2/hover/unreal_1063961.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_37_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_1076615_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_124005_Cjj5HZz_thumbnail.webp']
-  },
-  'bookcase-white-external-drawers': {
-    mainImage: '/images/products/v2/main/unreal_124436_nBnrSSB.webp',
-    hoverImage: '/images/products/v2/hover/unreal_124435_Z0LwZty.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_212_g9B0kiP_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_124435_Z0LwZty_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_4489_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_124471_E20jniq_thumbnail.webp']
-  },
-  'bookcase-moss-green-doors': {
-    mainImage: '/images/products/v2/main/unreal_1065964.webp',
-    hoverImage: '/images/products/v2/hover/unreal_1064770.webp',
-    colorThumbnails: ['unreal_1064770_thumbnail.webp', 'unreal_50_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_37_thumbnail.webp', 'unreal_4489_thumbnail.webp', 'unreal_27059_thumbnail.webp']
-  },
-  'bookcase-premium-black': {
-    mainImage: '/images/products/v2/main/Modern_Classic_Matt_Black_Shelf_with_Drawers.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_37.webp',
-    colorThumbnails: ['unreal_37_thumbnail.webp', 'unreal_50_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_4489_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_124005_Cjj5HZz_thumbnail.webp']
-  },
-  'bookcase-beige-drawers-backpanels': {
-    mainImage: '/images/products/v2/main/unreal_124006_LAACU4l.webp',
-    hoverImage: '/images/products/v2/hover/unreal_124005_Cjj5HZz.webp',
-    colorThumbnails: ['unreal_50_thumbnail.webp', 'unreal_29921_thumbnail.webp', 'unreal_124331_ZWcuK1x_thumbnail.webp', 'unreal_37_thumbnail.webp', 'unreal_1063961_thumbnail.webp', 'unreal_4489_thumbnail.webp', 'unreal_27059_thumbnail.webp', 'unreal_124005_Cjj5HZz_thumbnail.webp']
-  }
+// 실제 이미지 경로 매핑 테이블 (extracted-mappings.json 에서 생성 - scripts/generate_products_data.py)
+const productImage = (productSlug: string): GeneratedProductImages => {
+  return productImageMappings[productSlug] ?? {
+    sourceName: '',
+    mainImage: `/images/products/v2/main/${productSlug}-main.jpg`,
+    hoverImage: `/images/products/v2/hover/${productSlug}-hover.webp`,
+    colorThumbnails: [],
+    colorSwatches: {}
+  };
 };
 
-// 색상 이름을 썸네일 인덱스로 매핑하는 헬퍼 함수
-const getColorIndex = (colorName: string): number => {
-  const colorMap: Record<string, number> = {
-    'White': 0,
-    'Grey': 1,
-    'Gray': 1,
-    'Brown': 2,
-    'Black': 3,
-    'Green': 4,
-    'Moss Green': 4,
-    'Blue': 5,
-    'Red': 6,
-    'Beige': 7
+// 색상 이름을 스와치 키(color-swatches.json 의 이름)로 맞추는 헬퍼 함수
+const getSwatchName = (colorName: string): string => {
+  const aliases: Record<string, string> = {
+    'Gray': 'Grey',
+    'Moss Green': 'Green'
   };
-  return colorMap[colorName] || 0;
+  return aliases[colorName] ?? colorName;
 };
 
 // 실제 이미지 경로 생성 헬퍼 함수들
@@ -120,15 +40,9 @@ const createColorVariant = (
     // Old signature: (productSlug, colorId, name, isDefault)
     actualIsDefault = thumbnailFileOrIsDefault;
     
-    // Get actual thumbnail from mapping table based on color index
-    const imageMapping = productImageMappings[productSlug];
-    if (imageMapping && imageMapping.colorThumbnails) {
-      // Map color names to thumbnail indices (approximate)
-      const colorIndex = getColorIndex(name);
-      actualThumbnailFile = imageMapping.colorThumbnails[colorIndex] || imageMapping.colorThumbnails[0] || `placeholder-${name.toLowerCase()}.webp`;
-    } else {
-      actualThumbnailFile = `placeholder-${name.toLowerCase()}.webp`;
-    }
+    // Get actual thumbnail from mapping table by color name
+    const swatches = productImageMappings[productSlug]?.colorSwatches;
+    actualThumbnailFile = swatches?.[getSwatchName(name)] ?? `placeholder-${name.toLowerCase()}.webp`;
   } else {
     // New signature: (productSlug, colorId, name, thumbnailFile, isDefault)
     actualThumbnailFile = thumbnailFileOrIsDefault;
@@ -136,16 +50,16 @@ const createColorVariant = (
   }
   
   // Get actual image paths from mapping table
-  const imageMapping = productImageMappings[productSlug];
-  const mainImagePath = imageMapping ? imageMapping.mainImage : `/images/products/v2/main/${productSlug}-main.jpg`;
-  const hoverImagePath = imageMapping ? imageMapping.hoverImage : `/images/products/v2/hover/${productSlug}-hover.webp`;
+  const imageMapping = productImage(productSlug);
   
   return {
     id: colorId,
     name,
     thumbnail: `/images/products/v2/colors/${actualThumbnailFile}`,
-    mainImage: mainImagePath,
-    hoverImage: hoverImagePath,
+    mainImage: imageMapping.mainImage,
+    hoverImage: imageMapping.hoverImage,
+    mainImageSize: imageMapping.mainImageSize,
+    hoverImageSize: imageMapping.hoverImageSize,
     isDefault: actualIsDefault,
     sku: `BKC-${colorId}`,
     availability: 'in_stock'
@@ -191,8 +105,8 @@ export const productsV2Data: ProductV2[] = [
     category: 'bookcase',
     
     // V2 전용 필드 - 실제 이미지 경로
-    mainImage: '/images/products/v2/main/Living_room_08_living-room-Bookcase_EAPgDsY.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_50.webp',
+    mainImage: productImage('bookcase-white-doors').mainImage,
+    hoverImage: productImage('bookcase-white-doors').hoverImage,
     
     colorVariants: [
       createColorVariant('bookcase-white-doors', 'white-1', 'White', true),
@@ -230,8 +144,8 @@ export const productsV2Data: ProductV2[] = [
     description: 'Large grey bookcase with external drawers - 243x137.8cm',
     category: 'bookcase',
     
-    mainImage: '/images/products/v2/main/unreal_1075797.webp',
-    hoverImage: '/images/products/v2/hover/unreal_191615_KG3boPp.webp',
+    mainImage: productImage('bookcase-grey-external-drawers').mainImage,
+    hoverImage: productImage('bookcase-grey-external-drawers').hoverImage,
     
     colorVariants: [
       createColorVariant('bookcase-grey-external-drawers', 'grey-2', 'Grey', true),
@@ -268,8 +182,8 @@ export const productsV2Data: ProductV2[] = [
     description: 'Large brown bookcase - 201x249x27cm',
     category: 'bookcase',
     
-    mainImage: '/images/products/v2/main/unreal_124332_sj5uTGc.webp',
-    hoverImage: '/images/products/v2/hover/unreal_124331_ZWcuK1x.webp',
+    mainImage: productImage('bookcase-brown').mainImage,
+    hoverImage: productImage('bookcase-brown').hoverImage,
     
     colorVariants: [
       createColorVariant('bookcase-brown', 'brown-3', 'Brown', true),
@@ -306,8 +220,8 @@ export const productsV2Data: ProductV2[] = [
     description: 'Large grey plywood bookcase with doors and bottom storage - 185x263x32cm',
     category: 'bookcase',
     
-    mainImage: '/images/products/v2/main/907_Tylko_Bookcase_Type1_FINAL_04_living-room-Bookcase.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_212_g9B0kiP.webp',
+    mainImage: productImage('bookcase-grey-doors-storage').mainImage,
+    hoverImage: productImage('bookcase-grey-doors-storage').hoverImage,
     
     colorVariants: [
       createColorVariant('bookcase-grey-doors-storage', 'grey-4', 'Grey', true),
@@ -345,8 +259,8 @@ export const productsV2Data: ProductV2[] = [
     description: 'Compact moss green bookcase - 102x163cm',
     category: 'bookcase',
     
-    mainImage: '/images/products/v2/main/unreal_1065155.webp',
-    hoverImage: '/images/products/v2/hover/unreal_1063961.webp',
+    mainImage: productImage('bookcase-moss-green').mainImage,
+    hoverImage: productImage('bookcase-moss-green').hoverImage,
     
     colorVariants: [
       createColorVariant('bookcase-moss-green', 'moss-green-5', 'Moss Green', true),
@@ -383,8 +297,8 @@ export const productsV2Data: ProductV2[] = [
     description: 'Medium black bookcase - 136x197.8cm',
     category: 'bookcase',
     
-    mainImage: '/images/products/v2/main/unreal_124426_cquVq4l.webp',
-    hoverImage: '/images/products/v2/hover/unreal_124425_1QAV6ST.webp',
+    mainImage: productImage('bookcase-black').mainImage,
+    hoverImage: productImage('bookcase-black').hoverImage,
     
     colorVariants: [
       createColorVariant('bookcase-black', 'black-006', 'Black', true),
@@ -421,8 +335,8 @@ export const productsV2Data: ProductV2[] = [
     description: 'Extra large white bookcase - 308x227.8cm',
     category: 'bookcase',
     
-    mainImage: '/images/products/v2/main/Living_room_08_living-room-Bookcase_EAPgDsY.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_50.webp',
+    mainImage: productImage('bookcase-white-large').mainImage,
+    hoverImage: productImage('bookcase-white-large').hoverImage,
     
     colorVariants: [
       createColorVariant('bookcase-white-large', 'white-007', 'White', true),
@@ -459,8 +373,8 @@ export const productsV2Data: ProductV2[] = [
     description: 'Large light wood effect bookcase - 260x227.8cm',
     category: 'bookcase',
     
-    mainImage: '/images/products/v2/main/unreal_156041_2PFDZ4t.webp',
-    hoverImage: '/images/products/v2/hover/unreal_154634_uOy2I1O.webp',
+    mainImage: productImage('bookcase-light-wood').mainImage,
+    hoverImage: productImage('bookcase-light-wood').hoverImage,
     
     colorVariants: [
       createColorVariant('bookcase-light-wood', 'white-008', 'White', true),
@@ -497,8 +411,8 @@ export const productsV2Data: ProductV2[] = [
     slug: 'bookcase-burgundy-doors-drawers',
     description: 'Elegant burgundy bookcase with doors and drawers - 164x273cm',
     category: 'bookcase',
-    mainImage: '/images/products/v2/main/unreal_370630.webp',
-    hoverImage: '/images/products/v2/hover/unreal_245_iu7gxLQ.webp',
+    mainImage: productImage('bookcase-burgundy-doors-drawers').mainImage,
+    hoverImage: productImage('bookcase-burgundy-doors-drawers').hoverImage,
     colorVariants: [
       createColorVariant('bookcase-burgundy-doors-drawers', 'white-009', 'White', true),
       createColorVariant('bookcase-burgundy-doors-drawers', 'grey-009', 'Grey'),
@@ -529,8 +443,8 @@ export const productsV2Data: ProductV2[] = [
     slug: 'bookcase-grey-compact',
     description: 'Compact grey bookcase - 102x163cm',
     category: 'bookcase',
-    mainImage: '/images/products/v2/main/907_Tylko_Bookcase_Type1_FINAL_04_living-room-Bookcase.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_212_g9B0kiP.webp',
+    mainImage: productImage('bookcase-grey-compact').mainImage,
+    hoverImage: productImage('bookcase-grey-compact').hoverImage,
     colorVariants: [
       createColorVariant('bookcase-grey-compact', 'white-010', 'White', true),
       createColorVariant('bookcase-grey-compact', 'grey-010', 'Grey'),
@@ -561,8 +475,8 @@ export const productsV2Data: ProductV2[] = [
     slug: 'bookcase-light-wood-drawers',
     description: 'Light wood effect bookcase with external drawers - 224x167.8cm',
     category: 'bookcase',
-    mainImage: '/images/products/v2/main/unreal_1075727.webp',
-    hoverImage: '/images/products/v2/hover/unreal_154688_ZxTGNxY.webp',
+    mainImage: productImage('bookcase-light-wood-drawers').mainImage,
+    hoverImage: productImage('bookcase-light-wood-drawers').hoverImage,
     colorVariants: [
       createColorVariant('bookcase-light-wood-drawers', 'white-011', 'White', true),
       createColorVariant('bookcase-light-wood-drawers', 'grey-011', 'Grey'),
@@ -593,8 +507,8 @@ export const productsV2Data: ProductV2[] = [
     slug: 'bookcase-green-xl',
     description: 'Extra large green bookcase - 324x197.8cm',
     category: 'bookcase',
-    mainImage: '/images/products/v2/main/unreal_1065155.webp',
-    hoverImage: '/images/products/v2/hover/unreal_1063961.webp',
+    mainImage: productImage('bookcase-green-xl').mainImage,
+    hoverImage: productImage('bookcase-green-xl').hoverImage,
     colorVariants: [
       createColorVariant('bookcase-green-xl', 'white-012', 'White', true),
       createColorVariant('bookcase-green-xl', 'grey-012', 'Grey'),
@@ -626,8 +540,8 @@ export const productsV2Data: ProductV2[] = [
     slug: 'bookcase-white-external-drawers',
     description: 'White bookcase with external drawers - 114x197.8cm',
     category: 'bookcase',
-    mainImage: '/images/products/v2/main/unreal_124436_nBnrSSB.webp',
-    hoverImage: '/images/products/v2/hover/unreal_124435_Z0LwZty.webp',
+    mainImage: productImage('bookcase-white-external-drawers').mainImage,
+    hoverImage: productImage('bookcase-white-external-drawers').hoverImage,
     colorVariants: [
       createColorVariant('bookcase-white-external-drawers', 'white-013', 'White', true),
       createColorVariant('bookcase-white-external-drawers', 'grey-013', 'Grey'),
@@ -658,8 +572,8 @@ export const productsV2Data: ProductV2[] = [
     slug: 'bookcase-moss-green-doors',
     description: 'Tall moss green bookcase with doors - 150x283cm',
     category: 'bookcase',
-    mainImage: '/images/products/v2/main/unreal_1065964.webp',
-    hoverImage: '/images/products/v2/hover/unreal_1064770.webp',
+    mainImage: productImage('bookcase-moss-green-doors').mainImage,
+    hoverImage: productImage('bookcase-moss-green-doors').hoverImage,
     colorVariants: [
       createColorVariant('bookcase-moss-green-doors', 'green-014', 'Green', true),
       createColorVariant('bookcase-moss-green-doors', 'white-014', 'White'),
@@ -691,8 +605,8 @@ export const productsV2Data: ProductV2[] = [
     slug: 'bookcase-premium-black',
     description: 'Premium black bookcase with doors and drawers - 142x163cm',
     category: 'bookcase',
-    mainImage: '/images/products/v2/main/Modern_Classic_Matt_Black_Shelf_with_Drawers.jpg',
-    hoverImage: '/images/products/v2/hover/unreal_37.webp',
+    mainImage: productImage('bookcase-premium-black').mainImage,
+    hoverImage: productImage('bookcase-premium-black').hoverImage,
     colorVariants: [
       createColorVariant('bookcase-premium-black', 'black-015', 'Black', true),
       createColorVariant('bookcase-premium-black', 'white-015', 'White'),
@@ -726,8 +640,8 @@ export const productsV2Data: ProductV2[] = [
     slug: 'bookcase-beige-drawers-backpanels',
     description: 'Large beige bookcase with drawers and backpanels - 230x233cm',
     category: 'bookcase',
-    mainImage: '/images/products/v2/main/unreal_124006_LAACU4l.webp',
-    hoverImage: '/images/products/v2/hover/unreal_124005_Cjj5HZz.webp',
+    mainImage: productImage('bookcase-beige-drawers-backpanels').mainImage,
+    hoverImage: productImage('bookcase-beige-drawers-backpanels').hoverImage,
     colorVariants: [
       createColorVariant('bookcase-beige-drawers-backpanels', 'white-034', 'White', true),
       createColorVariant('bookcase-beige-drawers-backpanels', 'grey-034', 'Grey'),
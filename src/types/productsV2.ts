@@ -1,6 +1,11 @@
 import { BaseProduct, Money } from './products';
 
 // V2 전용 확장 타입들
+export interface ImageSizeV2 {
+  width: number;
+  height: number;
+}
+
 export interface ColorVariantV2 {
   id: string;
   name: string;                // "White", "Grey", "Brown" 등
@@ -9,6 +14,8 @@ export interface ColorVariantV2 {
   thumbnail: string;           // 스와치용 썸네일
   mainImage: string;           // 해당 색상의 메인 이미지
   hoverImage: string;          // 해당 색상의 호버 이미지
+  mainImageSize?: ImageSizeV2;  // 원본 크기 (이미지 색인에서 생성, 레이아웃 시프트 방지)
+  hoverImageSize?: ImageSizeV2;
   
   // 상태 및 메타데이터
   isSelected?: boolean;